@@ -0,0 +1,114 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+""" Micro-benchmarks for BIP32 keys derivation. Run from the repository root with: python -m benchmarks.bench_bip32 """
+
+
+# Imports
+import timeit
+import tracemalloc
+import ecdsa
+from ecdsa.curves import SECP256k1
+from bip_utils    import Bip32
+from bip_utils    import utils
+
+
+# Public extended key used for public derivation
+TEST_EX_PUB = "xpub6ASuArnXKPbfEwhqN6e3mwBcDTgzisQN1wXN9BJcM47sSikHjJf3UFHKkNAWbWMiGj7Wf5uMash7SyYq527Hqck2AxYysAA7xmALppuCkwQ"
+# Number of repetitions
+REP_NUM     = 1000
+
+
+def PrintResult(name, tot_time, rep_num):
+    """ Print a benchmark result.
+
+    Args:
+        name (str)      : Benchmark name
+        tot_time (float): Total time in seconds
+        rep_num (int)   : Number of repetitions
+    """
+    print("%-45s: %8.2f us" % (name, tot_time / rep_num * 1e6))
+
+
+def BenchVerifyingKey():
+    """ Benchmark public child derivation followed by the ECDSA public key construction, which skips the point validation,
+    compared with the same derivation followed by a validated construction of the public key.
+    """
+    bip32_ctx = Bip32.FromExtendedKey(TEST_EX_PUB)
+    # Make sure the fixed-base table is built before measuring
+    bip32_ctx.ChildKey(0)
+
+    def validated_key():
+        pub_key_bytes = bip32_ctx.ChildKey(0).PublicKey().RawUncompressed().ToBytes()
+        return ecdsa.VerifyingKey.from_string(pub_key_bytes, curve = SECP256k1)
+
+    validated = timeit.timeit(validated_key, number = REP_NUM)
+    trusted   = timeit.timeit(lambda: bip32_ctx.ChildKey(0).EcdsaPublicKey(), number = REP_NUM)
+
+    PrintResult("ChildKey + verifying key (validated point)", validated, REP_NUM)
+    PrintResult("ChildKey + EcdsaPublicKey (trusted point)", trusted, REP_NUM)
+    PrintResult("Saving per public child", validated - trusted, REP_NUM)
+
+
+def BenchHmac():
+    """ Benchmark the HMAC-SHA512 computed for each child, with the key prepared every time and with a pre-keyed object. """
+    bip32_ctx = Bip32.FromExtendedKey(TEST_EX_PUB)
+    chain     = bip32_ctx.Chain()
+    data      = bip32_ctx.PublicKey().RawCompressed().ToBytes() + (0).to_bytes(4, "big")
+    hmac_obj  = utils.HmacSha512New(chain)
+
+    keyed     = timeit.timeit(lambda: utils.HmacSha512(chain, data), number = REP_NUM)
+    pre_keyed = timeit.timeit(lambda: utils.HmacSha512Copy(hmac_obj, data), number = REP_NUM)
+
+    PrintResult("HMAC-SHA512 (key prepared every time)", keyed, REP_NUM)
+    PrintResult("HMAC-SHA512 (pre-keyed object copied)", pre_keyed, REP_NUM)
+    PrintResult("Saving per child", keyed - pre_keyed, REP_NUM)
+
+
+def BenchPublicDerivation():
+    """ Benchmark public derivation. """
+    bip32_ctx = Bip32.FromExtendedKey(TEST_EX_PUB)
+    # Make sure the fixed-base table is built before measuring
+    bip32_ctx.ChildKey(0)
+
+    single = timeit.timeit(lambda: [bip32_ctx.ChildKey(i) for i in range(REP_NUM)], number = 1)
+
+    PrintResult("Public derivation (ChildKey)", single, REP_NUM)
+
+
+def BenchMemory():
+    """ Benchmark the memory used by publicly derived children. """
+    bip32_ctx = Bip32.FromExtendedKey(TEST_EX_PUB)
+    # Make sure the fixed-base table is built before measuring
+    bip32_ctx.ChildKey(0)
+
+    tracemalloc.start()
+    children = bip32_ctx.ChildKeys(range(REP_NUM))
+    mem_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("%-45s: %8d bytes" % ("Memory per public child", mem_size // len(children)))
+
+
+if __name__ == "__main__":
+    BenchVerifyingKey()
+    BenchHmac()
+    BenchPublicDerivation()
+    BenchMemory()
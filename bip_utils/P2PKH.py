@@ -29,6 +29,24 @@ from .key_helper    import KeyHelper
 class P2PKH:
     """ P2PKH class. It allows the Pay-to-Public-Key-Hash address generation. """
 
+    @staticmethod
+    def ToPayload(pub_key_bytes):
+        """ Get address payload in P2PKH format, i.e. the public key hash.
+
+        Args:
+            pub_key_bytes (bytes): Public key bytes
+
+        Returns:
+            bytes: Address payload (20-byte)
+
+        Raises:
+            ValueError: If the key is not a public compressed key
+        """
+        if not KeyHelper.IsPublicCompressed(pub_key_bytes):
+            raise ValueError("Public compressed key is required for P2PKH")
+
+        return utils.Hash160(pub_key_bytes)
+
     @staticmethod
     def ToAddress(pub_key_bytes, net_addr_ver = BitcoinConf.P2PKH_NET_VER.Main()):
         """ Get address in P2PKH format.
@@ -43,7 +61,4 @@ class P2PKH:
         Raises:
             ValueError: If the key is not a public compressed key
         """
-        if not KeyHelper.IsPublicCompressed(pub_key_bytes):
-            raise ValueError("Public compressed key is required for P2PKH")
-
-        return Base58Encoder.CheckEncode(net_addr_ver + utils.Hash160(pub_key_bytes))
+        return Base58Encoder.CheckEncode(net_addr_ver + P2PKH.ToPayload(pub_key_bytes))
@@ -38,15 +38,14 @@ class P2SH:
     """ P2SH class. It allows the Pay-to-Script-Hash address generation. """
 
     @staticmethod
-    def ToAddress(pub_key_bytes, net_addr_ver = BitcoinConf.P2SH_NET_VER.Main()):
-        """ Get address in P2SH format.
+    def ToPayload(pub_key_bytes):
+        """ Get address payload in P2SH format, i.e. the script hash.
 
         Args:
-            pub_key_bytes (bytes)         : Public key bytes
-            net_addr_ver (bytes, optional): Net address version, default is Bitcoin main network
+            pub_key_bytes (bytes): Public key bytes
 
         Returns:
-            str: Address string
+            bytes: Address payload (20-byte)
 
         Raises:
             ValueError: If the key is not a public compressed key
@@ -59,7 +58,21 @@ class P2SH:
         # Script signature: 0x0014 | Hash160(public_key)
         script_sig = binascii.unhexlify(P2SHConst.SCRIPT_BYTES) + key_hash
         # Address bytes = Hash160(script_signature)
-        addr_bytes = utils.Hash160(script_sig)
+        return utils.Hash160(script_sig)
 
+    @staticmethod
+    def ToAddress(pub_key_bytes, net_addr_ver = BitcoinConf.P2SH_NET_VER.Main()):
+        """ Get address in P2SH format.
+
+        Args:
+            pub_key_bytes (bytes)         : Public key bytes
+            net_addr_ver (bytes, optional): Net address version, default is Bitcoin main network
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the key is not a public compressed key
+        """
         # Final address: Base58Check(addr_prefix | address_bytes)
-        return Base58Encoder.CheckEncode(net_addr_ver + addr_bytes)
+        return Base58Encoder.CheckEncode(net_addr_ver + P2SH.ToPayload(pub_key_bytes))
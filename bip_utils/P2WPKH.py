@@ -41,6 +41,24 @@ class P2WPKH:
     https://github.com/bitcoin/bips/blob/master/bip-0173.mediawiki
     """
 
+    @staticmethod
+    def ToPayload(pub_key_bytes):
+        """ Get address payload in P2WPKH format, i.e. the witness program (public key hash).
+
+        Args:
+            pub_key_bytes (bytes): Public key bytes
+
+        Returns:
+            bytes: Address payload (20-byte)
+
+        Raises:
+            ValueError: If key is not a public compressed key
+        """
+        if not KeyHelper.IsPublicCompressed(pub_key_bytes):
+            raise ValueError("Public compressed key is required for P2WPKH")
+
+        return utils.Hash160(pub_key_bytes)
+
     @staticmethod
     def ToAddress(pub_key_bytes, net_addr_ver = BitcoinConf.P2WPKH_NET_VER.Main()):
         """ Get address in P2WPKH format.
@@ -55,7 +73,4 @@ class P2WPKH:
         Raises:
             ValueError: If key is not a public compressed key
         """
-        if not KeyHelper.IsPublicCompressed(pub_key_bytes):
-            raise ValueError("Public compressed key is required for P2WPKH")
-
-        return Bech32Encoder.EncodeAddr(net_addr_ver, P2WPKHConst.WITNESS_VER, utils.Hash160(pub_key_bytes))
+        return Bech32Encoder.EncodeAddr(net_addr_ver, P2WPKHConst.WITNESS_VER, P2WPKH.ToPayload(pub_key_bytes))
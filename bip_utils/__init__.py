@@ -16,7 +16,9 @@ from .eth_addr      import EthAddr
 from .xrp_addr      import XrpAddr
 # BIP39
 from .bip39_ex      import Bip39InvalidFileError, Bip39ChecksumError
-from .bip39         import EntropyGenerator, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator
+from .bip39         import Bip39Languages, EntropyGenerator, Bip39Mnemonic, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator
+# Secp256k1
+from .secp256k1     import Secp256k1FixedBase
 # BIP32
 from .bip32_ex      import Bip32KeyError, Bip32PathError
 from .bip32_utils   import Bip32Utils
@@ -24,9 +26,14 @@ from .bip32_path    import Bip32PathParser
 from .bip32         import Bip32
 # BIP44/49/84
 from .bip44_base_ex import Bip44DepthError, Bip44CoinNotAllowedError
-from .bip44_base    import Bip44Changes, Bip44Coins, Bip44Levels
+from .bip44_base    import Bip44BaseConst, Bip44Changes, Bip44Coins, Bip44Levels
 from .bip44         import Bip44
 from .bip49         import Bip49
 from .bip84         import Bip84
+# BIP39 recovery
+from .bip39_recovery import Bip39Recovery, Bip39PassphraseRecovery, Bip39RecoveryTarget
+# Address index and filter
+from .addr_index    import AddressIndex, AddressIndexBuilder
+from .addr_filter   import AddressFilter
 # Coin configuration
 from .bip_coin_conf import *
@@ -0,0 +1,230 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+# Imports
+import math
+
+
+class AddressFilterConst:
+    """ Class container for address filter constants. """
+
+    # Payload length in bytes
+    PAYLOAD_BYTE_LEN   = 20
+    # Default false positive rate
+    DEF_FALSE_POS_RATE = 0.001
+    # Maximum number of hash functions
+    MAX_HASH_NUM       = 32
+    # Serialized header length in bytes (number of bits, number of hash functions)
+    HEADER_BYTE_LEN    = 5
+
+
+class AddressFilter:
+    """ Address filter class. It's a Bloom filter of address payloads (see BipPublicKey.ToAddressPayload), useful as a
+    cheap negative check before an exact lookup (e.g. AddressIndex): if it says that a payload is not present, it's
+    surely not present, otherwise it may be present (with the specified false positive rate).
+    Since payloads are hashes, the filter positions are computed directly from their bytes without hashing them again.
+    """
+
+    #
+    # Static methods
+    #
+
+    @staticmethod
+    def FromCapacity(item_num, false_pos_rate = AddressFilterConst.DEF_FALSE_POS_RATE):
+        """ Create an empty filter sized for the specified number of payloads and false positive rate.
+
+        Args:
+            item_num (int)                  : Expected number of payloads
+            false_pos_rate (float, optional): False positive rate when the filter contains item_num payloads (default: 0.001)
+
+        Returns:
+            AddressFilter object: AddressFilter object
+
+        Raises:
+            ValueError: If the number of payloads or the false positive rate are not valid
+        """
+        if item_num <= 0:
+            raise ValueError("Invalid number of items (%d)" % item_num)
+        if not 0.0 < false_pos_rate < 1.0:
+            raise ValueError("Invalid false positive rate (%f)" % false_pos_rate)
+
+        bit_num = math.ceil(-item_num * math.log(false_pos_rate) / (math.log(2) ** 2))
+        hash_num = round(bit_num / item_num * math.log(2))
+
+        return AddressFilter(bit_num, min(max(hash_num, 1), AddressFilterConst.MAX_HASH_NUM))
+
+    @staticmethod
+    def FromBytes(filter_bytes):
+        """ Create a filter from its serialized bytes (see ToBytes).
+
+        Args:
+            filter_bytes (bytes): Filter bytes
+
+        Returns:
+            AddressFilter object: AddressFilter object
+
+        Raises:
+            ValueError: If the bytes are not valid
+        """
+        if len(filter_bytes) < AddressFilterConst.HEADER_BYTE_LEN:
+            raise ValueError("Invalid filter bytes (too short)")
+
+        bit_num = int.from_bytes(filter_bytes[:4], "big")
+        hash_num = filter_bytes[4]
+
+        addr_filter = AddressFilter(bit_num, hash_num)
+        if len(filter_bytes) != AddressFilterConst.HEADER_BYTE_LEN + len(addr_filter.m_bits):
+            raise ValueError("Invalid filter bytes (wrong length)")
+        addr_filter.m_bits[:] = filter_bytes[AddressFilterConst.HEADER_BYTE_LEN:]
+
+        return addr_filter
+
+    #
+    # Public methods
+    #
+
+    def __init__(self, bit_num, hash_num):
+        """ Construct an empty filter.
+
+        Args:
+            bit_num (int) : Number of bits
+            hash_num (int): Number of hash functions
+
+        Raises:
+            ValueError: If the number of bits or hash functions are not valid
+        """
+        if not 0 < bit_num < 2**32:
+            raise ValueError("Invalid number of bits (%d)" % bit_num)
+        if not 0 < hash_num <= AddressFilterConst.MAX_HASH_NUM:
+            raise ValueError("Invalid number of hash functions (%d)" % hash_num)
+
+        self.m_bit_num  = bit_num
+        self.m_hash_num = hash_num
+        self.m_bits     = bytearray((bit_num + 7) // 8)
+
+    def Add(self, payload):
+        """ Add an address payload.
+
+        Args:
+            payload (bytes): Address payload (20-byte)
+
+        Raises:
+            ValueError: If the payload length is not valid
+        """
+        for bit_idx in self.__BitIndexes(payload):
+            self.m_bits[bit_idx >> 3] |= 1 << (bit_idx & 7)
+
+    def AddRange(self, bip_obj, start, stop):
+        """ Add the address payloads of a range of indexes from a change level Bip object (e.g. BIP44, BIP49, BIP84).
+
+        Args:
+            bip_obj (Bip44Base child object): Bip44Base child object at change level
+            start (int)                     : First address index (included)
+            stop (int)                      : Last address index (excluded)
+
+        Raises:
+            Bip44DepthError: If the Bip object is not at change level
+        """
+        for payload in bip_obj.AddressRange(start, stop, payloads = True):
+            self.Add(payload)
+
+    def __contains__(self, payload):
+        """ Get if the specified address payload may be present.
+
+        Args:
+            payload (bytes): Address payload (20-byte)
+
+        Returns:
+            bool: False if surely not present, true if it may be present
+
+        Raises:
+            ValueError: If the payload length is not valid
+        """
+        bits = self.m_bits
+        for bit_idx in self.__BitIndexes(payload):
+            if not bits[bit_idx >> 3] & (1 << (bit_idx & 7)):
+                return False
+        return True
+
+    def Merge(self, addr_filter):
+        """ Merge the specified filter into the current one, which will contain the payloads of both.
+
+        Args:
+            addr_filter (AddressFilter object): AddressFilter object, with the same number of bits and hash functions
+
+        Raises:
+            ValueError: If the filters have different number of bits or hash functions
+        """
+        if self.m_bit_num != addr_filter.m_bit_num or self.m_hash_num != addr_filter.m_hash_num:
+            raise ValueError("Filters with different number of bits or hash functions cannot be merged")
+
+        bits_len = len(self.m_bits)
+        merged_bits = int.from_bytes(self.m_bits, "little") | int.from_bytes(addr_filter.m_bits, "little")
+        self.m_bits[:] = merged_bits.to_bytes(bits_len, "little")
+
+    def ToBytes(self):
+        """ Serialize the filter to bytes.
+
+        Returns:
+            bytes: Filter bytes
+        """
+        return self.m_bit_num.to_bytes(4, "big") + bytes([self.m_hash_num]) + bytes(self.m_bits)
+
+    def BitNum(self):
+        """ Get the number of bits.
+
+        Returns:
+            int: Number of bits
+        """
+        return self.m_bit_num
+
+    def HashNum(self):
+        """ Get the number of hash functions.
+
+        Returns:
+            int: Number of hash functions
+        """
+        return self.m_hash_num
+
+    #
+    # Private methods
+    #
+
+    def __BitIndexes(self, payload):
+        """ Get the bit indexes of the specified payload.
+        Since the payload is already a hash, the indexes are computed by double hashing using two halves of it.
+
+        Args:
+            payload (bytes): Address payload (20-byte)
+
+        Returns:
+            generator: Bit indexes
+
+        Raises:
+            ValueError: If the payload length is not valid
+        """
+        if len(payload) != AddressFilterConst.PAYLOAD_BYTE_LEN:
+            raise ValueError("Invalid address payload length (%d)" % len(payload))
+
+        h_1 = int.from_bytes(payload[:10], "little")
+        h_2 = int.from_bytes(payload[10:], "little") | 1
+        return ((h_1 + i * h_2) % self.m_bit_num for i in range(self.m_hash_num))
@@ -0,0 +1,279 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+# Imports
+import mmap
+from .bip32_utils import Bip32UtilsConst
+from .            import utils
+
+
+class AddressIndexConst:
+    """ Class container for address index constants. """
+
+    # File magic
+    MAGIC            = b"BAIX"
+    # File format version
+    VERSION          = 1
+    # Header length in bytes (magic, version, number of records)
+    HEADER_BYTE_LEN  = 9
+    # Key length in bytes
+    KEY_BYTE_LEN     = 20
+    # Root fingerprint length in bytes
+    FPRINT_BYTE_LEN  = 4
+    # Maximum path length (number of indexes)
+    PATH_MAX_LEN     = 6
+    # Record length in bytes (key, root fingerprint, path length, path indexes)
+    RECORD_BYTE_LEN  = KEY_BYTE_LEN + FPRINT_BYTE_LEN + 1 + PATH_MAX_LEN * 4
+
+
+class AddressIndexUtils:
+    """ Class container for address index utility functions. """
+
+    @staticmethod
+    def Key(addr):
+        """ Get the index key of the specified address.
+        Addresses can be specified as strings or as 20-byte payloads (see BipPublicKey.ToAddressPayload): payloads are
+        used directly as keys, while strings are hashed.
+
+        Args:
+            addr (str or bytes): Address string or payload
+
+        Returns:
+            bytes: Index key
+
+        Raises:
+            ValueError: If the address payload length is not valid
+        """
+        if isinstance(addr, str):
+            return utils.Sha256(addr.encode())[:AddressIndexConst.KEY_BYTE_LEN]
+
+        if len(addr) != AddressIndexConst.KEY_BYTE_LEN:
+            raise ValueError("Invalid address payload length (%d)" % len(addr))
+        return bytes(addr)
+
+
+class AddressIndexBuilder:
+    """ Address index builder class. It collects addresses with their derivation (root fingerprint and path) and saves
+    them to a file that can be opened by AddressIndex.
+    """
+
+    def __init__(self):
+        """ Construct class. """
+        self.m_records = []
+
+    def Add(self, addr, root_fprint, path_idx):
+        """ Add an address.
+
+        Args:
+            addr (str or bytes): Address string or payload
+            root_fprint (bytes): Fingerprint of the root key (4-byte)
+            path_idx (list)    : Indexes of the path from the root key
+
+        Raises:
+            ValueError: If the address payload, the fingerprint or the path are not valid
+        """
+        if len(root_fprint) != AddressIndexConst.FPRINT_BYTE_LEN:
+            raise ValueError("Invalid root fingerprint length (%d)" % len(root_fprint))
+        if len(path_idx) > AddressIndexConst.PATH_MAX_LEN:
+            raise ValueError("Path is too long (%d indexes)" % len(path_idx))
+        if any(idx < 0 or idx > Bip32UtilsConst.HARDENED_IDX * 2 - 1 for idx in path_idx):
+            raise ValueError("Invalid path index")
+
+        path_bytes = b"".join([idx.to_bytes(4, "big") for idx in path_idx])
+        path_bytes += b"\x00" * ((AddressIndexConst.PATH_MAX_LEN - len(path_idx)) * 4)
+
+        self.m_records.append(AddressIndexUtils.Key(addr) + bytes(root_fprint) + bytes([len(path_idx)]) + path_bytes)
+
+    def AddRange(self, bip_obj, start, stop, root_fprint, path_idx, payloads = False):
+        """ Add a range of addresses from a change level Bip object (e.g. BIP44, BIP49, BIP84).
+
+        Args:
+            bip_obj (Bip44Base child object): Bip44Base child object at change level
+            start (int)                     : First address index (included)
+            stop (int)                      : Last address index (excluded)
+            root_fprint (bytes)             : Fingerprint of the root key (4-byte)
+            path_idx (list)                 : Indexes of the path from the root key to the change level
+            payloads (bool, optional)       : True to add the address payloads instead of the addresses (default: false)
+
+        Raises:
+            ValueError: If the fingerprint or the path are not valid
+            Bip44DepthError: If the Bip object is not at change level
+        """
+        for addr_idx, addr in enumerate(bip_obj.AddressRange(start, stop, payloads = payloads), start):
+            self.Add(addr, root_fprint, list(path_idx) + [addr_idx])
+
+    def Size(self):
+        """ Get the number of added addresses.
+
+        Returns:
+            int: Number of added addresses
+        """
+        return len(self.m_records)
+
+    def Save(self, file_path):
+        """ Save the index to file, sorting the addresses.
+
+        Args:
+            file_path (str): File path
+        """
+        self.m_records.sort()
+
+        with open(file_path, "wb") as fout:
+            fout.write(AddressIndexConst.MAGIC + bytes([AddressIndexConst.VERSION]) + len(self.m_records).to_bytes(4, "big"))
+            fout.write(b"".join(self.m_records))
+
+
+class AddressIndex:
+    """ Address index class. It looks up the derivation (root fingerprint and path) of addresses in a file saved by
+    AddressIndexBuilder. The file is memory-mapped and binary searched, so it's not loaded in memory and opening it is immediate.
+    """
+
+    def __init__(self, file_path):
+        """ Construct class by opening the specified file.
+
+        Args:
+            file_path (str): File path
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        with open(file_path, "rb") as fin:
+            self.m_mmap = mmap.mmap(fin.fileno(), 0, access = mmap.ACCESS_READ)
+
+        try:
+            self.m_rec_num = self.__ReadHeader()
+        except ValueError:
+            self.Close()
+            raise
+
+    def __enter__(self):
+        """ Enter the context, the index is closed when exiting it.
+
+        Returns:
+            AddressIndex object: Current object
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Exit the context, closing the index. """
+        self.Close()
+
+    def Close(self):
+        """ Close the index file. """
+        self.m_mmap.close()
+
+    def Size(self):
+        """ Get the number of addresses.
+
+        Returns:
+            int: Number of addresses
+        """
+        return self.m_rec_num
+
+    def Lookup(self, addr):
+        """ Look up the derivation of the specified address.
+
+        Args:
+            addr (str or bytes): Address string or payload, in the same form used to build the index
+
+        Returns:
+            tuple: Root fingerprint (bytes) and path indexes (list)
+            None: If the address is not present
+
+        Raises:
+            ValueError: If the address payload length is not valid
+        """
+        key = AddressIndexUtils.Key(addr)
+        rec_offset = self.__Search(key)
+        if rec_offset is None:
+            return None
+
+        # Get record fields
+        offset = rec_offset + AddressIndexConst.KEY_BYTE_LEN
+        root_fprint = self.m_mmap[offset : offset + AddressIndexConst.FPRINT_BYTE_LEN]
+        offset += AddressIndexConst.FPRINT_BYTE_LEN
+        path_len = self.m_mmap[offset]
+        offset += 1
+        path_idx = [int.from_bytes(self.m_mmap[offset + i * 4 : offset + (i + 1) * 4], "big") for i in range(path_len)]
+
+        return root_fprint, path_idx
+
+    def __contains__(self, addr):
+        """ Get if the specified address is present.
+
+        Args:
+            addr (str or bytes): Address string or payload, in the same form used to build the index
+
+        Returns:
+            bool: True if present, false otherwise
+        """
+        return self.__Search(AddressIndexUtils.Key(addr)) is not None
+
+    def __ReadHeader(self):
+        """ Read and check the file header.
+
+        Returns:
+            int: Number of records
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        header_len = AddressIndexConst.HEADER_BYTE_LEN
+        if len(self.m_mmap) < header_len:
+            raise ValueError("Invalid address index file (too short)")
+        if self.m_mmap[:len(AddressIndexConst.MAGIC)] != AddressIndexConst.MAGIC:
+            raise ValueError("Invalid address index file (wrong magic)")
+        if self.m_mmap[len(AddressIndexConst.MAGIC)] != AddressIndexConst.VERSION:
+            raise ValueError("Invalid address index file (unsupported version)")
+
+        rec_num = int.from_bytes(self.m_mmap[len(AddressIndexConst.MAGIC) + 1 : header_len], "big")
+        if len(self.m_mmap) != header_len + rec_num * AddressIndexConst.RECORD_BYTE_LEN:
+            raise ValueError("Invalid address index file (wrong length)")
+
+        return rec_num
+
+    def __Search(self, key):
+        """ Binary search the record with the specified key.
+
+        Args:
+            key (bytes): Index key
+
+        Returns:
+            int: Record offset in file
+            None: If the key is not present
+        """
+        low = 0
+        high = self.m_rec_num
+
+        while low < high:
+            mid = (low + high) // 2
+            rec_offset = AddressIndexConst.HEADER_BYTE_LEN + mid * AddressIndexConst.RECORD_BYTE_LEN
+            rec_key = self.m_mmap[rec_offset : rec_offset + AddressIndexConst.KEY_BYTE_LEN]
+
+            if rec_key < key:
+                low = mid + 1
+            elif rec_key > key:
+                high = mid
+            else:
+                return rec_offset
+
+        return None
@@ -23,12 +23,16 @@
 import ecdsa
 from  ecdsa.curves  import SECP256k1
 from  ecdsa.ecdsa   import generator_secp256k1, int_to_string, string_to_int
+from  ecdsa.ellipticcurve import Point
 from .bip32_ex      import Bip32KeyError, Bip32PathError
 from .bip32_utils   import Bip32Utils
 from .bip32_path    import Bip32PathParser
+from .bip32_cache   import Bip32DerivationCache, Bip32DerivationCacheConst
 from .bip32_key_ser import Bip32KeyDeserializer
 from .bip_keys      import BipPrivateKey, BipPublicKey
 from .bip_coin_conf import Bip32Conf
+from .bip_coin_conf_helper import KeyNetVersions
+from .secp256k1     import Secp256k1
 from .              import utils
 
 
@@ -38,6 +42,10 @@ class Bip32Const:
     # SECP256k1 curve order
     CURVE_ORDER          = generator_secp256k1.order()
 
+    # Secret length in bytes
+    SECRET_BYTE_LEN      = 32
+    # Compressed public key length in bytes
+    PUB_KEY_BYTE_LEN     = 33
     # Fingerprint length in bytes
     FINGERPRINT_BYTE_LEN = 4
     # Fingerprint of master key
@@ -46,13 +54,20 @@ class Bip32Const:
     SEED_MIN_BIT_LEN     = 128
     # HMAC key for generating master key
     MASTER_KEY_HMAC_KEY  = b"Bitcoin seed"
+    # HMAC object keyed for generating master key, it's only copied and never updated
+    MASTER_KEY_HMAC      = utils.HmacSha512New(MASTER_KEY_HMAC_KEY)
 
 
 class Bip32:
     """ BIP32 class. It allows master key generation and children keys derivation in according to BIP-0032.
     BIP-0032 specifications: https://github.com/bitcoin/bips/blob/master/bip-0032.mediawiki
+    Objects are kept compact, since many of them can be held in memory: the private key is stored as bytes, the public key
+    as compressed bytes and the ecdsa keys objects are only created when requested.
     """
 
+    __slots__ = ("m_secret", "m_pub_key_bytes", "m_pub_point", "m_chain", "m_depth", "m_index", "m_parent_fprint",
+                 "m_key_net_ver", "m_der_cache", "m_hmac", "m_key_id", "m_fprint", "m_ecdsa_priv_key")
+
     #
     # Static methods
     #
@@ -78,7 +93,7 @@ class Bip32:
             raise ValueError("Seed length is too small, it shall be at least %d bit" % Bip32Const.SEED_MIN_BIT_LEN)
 
         # Compute HMAC
-        hmac = utils.HmacSha512(Bip32Const.MASTER_KEY_HMAC_KEY, seed_bytes)
+        hmac = utils.HmacSha512Copy(Bip32Const.MASTER_KEY_HMAC, seed_bytes)
         # Create BIP32 by splitting the HMAC into two 32-byte sequences
         return Bip32(secret = hmac[:32], chain = hmac[32:], key_net_ver = key_net_ver)
 
@@ -110,7 +125,7 @@ class Bip32:
         bip32_ctx = Bip32.FromSeed(seed_bytes, key_net_ver)
         # Start from 1 because the master key is already derived
         for i in range(1, len(path_idx)):
-            bip32_ctx = bip32_ctx.ChildKey(path_idx[i])
+            bip32_ctx = bip32_ctx.__ChildKey(path_idx[i], i == len(path_idx) - 1)
 
         return bip32_ctx
 
@@ -148,14 +163,14 @@ class Bip32:
             if secret[0] != 0:
                 raise Bip32KeyError("Invalid extended key (wrong secret)")
             secret = secret[1:]
-        # If public key, recover the complete key from the compressed one
+        # If public key, check that the compressed one is a valid point
         else:
             try:
-                secret = ecdsa.VerifyingKey.from_string(secret, curve = SECP256k1)
-            except ecdsa.keys.MalformedPointError:
+                pub_point = Secp256k1.PointFromCompressed(secret)
+            except ValueError:
                 raise Bip32KeyError("Invalid extended public key (malformed point)")
 
-        return Bip32(
+        bip32_obj = Bip32(
             secret      = secret,
             chain       = chain,
             depth       = depth,
@@ -163,6 +178,11 @@ class Bip32:
             fprint      = fprint,
             is_public   = is_public,
             key_net_ver = key_net_ver)
+        # Keep the recovered point, so that it's not computed again for derivation
+        if is_public:
+            bip32_obj.m_pub_point = pub_point
+
+        return bip32_obj
 
     #
     # Public methods
@@ -179,7 +199,7 @@ class Bip32:
         """ Construct class from secret and chain.
 
         Args:
-            secret (bytes)                               : Source bytes to generate the keypair
+            secret (bytes or ecdsa.VerifyingKey object)  : Source bytes to generate the keypair (private key bytes, or compressed public key bytes/ecdsa.VerifyingKey object if public)
             chain (bytes)                                : 32-byte representation of the chain code
             depth (int, optional)                        : Child depth, parent increments its own by one when assigning this (default: 0)
             index (int, optional)                        : Child index (default: 0)
@@ -188,27 +208,81 @@ class Bip32:
             key_net_ver (KeyNetVersions object, optional): Key net version object (Bip32 main net version by default)
 
         Raises:
-            Bip32KeyError: If the private key constructed from the secret is not valid
+            Bip32KeyError: If the key constructed from the secret is not valid
         """
 
+        # The public point is only kept when it's already available or needed for derivation
+        self.m_pub_point = None
+
         if not is_public:
             # Check private key validity
-            try:
-                self.m_key = ecdsa.SigningKey.from_string(secret, curve = SECP256k1)
-            except ecdsa.keys.MalformedPointError:
+            if not Bip32.__IsSecretValid(secret):
                 raise Bip32KeyError("Invalid private key (malformed point)")
-            # Get verifying key
-            self.m_ver_key = self.m_key.get_verifying_key()
+            # Public key is computed only when needed, since it's expensive
+            self.m_secret        = secret
+            self.m_pub_key_bytes = None
+        else:
+            self.m_secret = None
+            if isinstance(secret, ecdsa.VerifyingKey):
+                self.m_pub_point     = (secret.pubkey.point.x(), secret.pubkey.point.y())
+                self.m_pub_key_bytes = Secp256k1.PointToCompressed(self.m_pub_point)
+            else:
+                # Only the format is checked, the point is checked when recovered
+                if len(secret) != Bip32Const.PUB_KEY_BYTE_LEN or secret[0] not in (2, 3):
+                    raise Bip32KeyError("Invalid public key (wrong format)")
+                self.m_pub_key_bytes = secret
+
+        self.m_chain          = chain
+        self.m_depth          = depth
+        self.m_index          = index
+        self.m_parent_fprint  = fprint
+        self.m_key_net_ver    = key_net_ver
+        self.m_der_cache      = None
+        self.m_hmac           = None
+        self.m_key_id         = None
+        self.m_fprint         = None
+        self.m_ecdsa_priv_key = None
+
+    def __getstate__(self):
+        """ Get the object state for pickling.
+        Only the raw fields are stored (i.e. private key or compressed public key, chain code, depth, index, parent
+        fingerprint and key net versions), so the payload is small. The index is stored as an integer, since it can be
+        an enumerative (e.g. Bip44Changes) whose class would be stored by reference. The derivation cache is not stored.
+
+        Returns:
+            tuple: Object state
+        """
+        return (self.m_secret if self.m_secret is not None else self.m_pub_key_bytes,
+                self.m_chain,
+                self.m_depth,
+                int(self.m_index),
+                self.m_parent_fprint,
+                self.m_key_net_ver.Public(),
+                self.m_key_net_ver.Private())
+
+    def __setstate__(self, state):
+        """ Set the object state when unpickling.
+        The public key (or its point, if public) is computed only when needed.
+
+        Args:
+            state (tuple): Object state
+        """
+        key_bytes, self.m_chain, self.m_depth, self.m_index, self.m_parent_fprint, pub_net_ver, priv_net_ver = state
+
+        if len(key_bytes) == Bip32Const.SECRET_BYTE_LEN:
+            self.m_secret        = key_bytes
+            self.m_pub_key_bytes = None
         else:
-            self.m_key     = None
-            self.m_ver_key = secret
+            self.m_secret        = None
+            self.m_pub_key_bytes = key_bytes
 
-        self.m_is_public     = is_public
-        self.m_chain         = chain
-        self.m_depth         = depth
-        self.m_index         = index
-        self.m_parent_fprint = fprint
-        self.m_key_net_ver   = key_net_ver
+        self.m_pub_point      = None
+        self.m_key_net_ver    = KeyNetVersions(utils.BytesToHexString(pub_net_ver), utils.BytesToHexString(priv_net_ver))
+        self.m_der_cache      = None
+        self.m_hmac           = None
+        self.m_key_id         = None
+        self.m_fprint         = None
+        self.m_ecdsa_priv_key = None
 
     def ChildKey(self, index):
         """ Create and return a child key of the current one at the specified index.
@@ -223,7 +297,23 @@ class Bip32:
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
-        return self.__CkdPriv(index) if not self.m_is_public else self.__CkdPub(index)
+        return self.__ChildKey(index, True)
+
+    def ChildKeys(self, indexes):
+        """ Create and return the child keys of the current one at the specified indexes.
+        It's the same of calling ChildKey for each index (the data shared by the children, i.e. compressed public key
+        and fingerprint, is computed only once anyway).
+
+        Args:
+            indexes (iterable): Indexes
+
+        Returns:
+            list: Child keys as a list of Bip32 objects, in the same order of indexes
+
+        Raises:
+            Bip32KeyError: If an index results in an invalid key or it's hardened and the key is public-only
+        """
+        return [self.ChildKey(index) for index in indexes]
 
     def DerivePath(self, path):
         """ Derive children keys from the specified path.
@@ -245,17 +335,95 @@ class Bip32:
         if len(path_idx) == 0:
             raise Bip32PathError("The specified path is not valid")
 
-        bip32_obj = self
-        # Derive children keys
-        for idx in path_idx:
-            bip32_obj = bip32_obj.ChildKey(idx)
+        if self.m_der_cache is None:
+            bip32_obj = self
+            # Derive children keys
+            for i, idx in enumerate(path_idx):
+                bip32_obj = bip32_obj.__ChildKey(idx, i == len(path_idx) - 1)
+        else:
+            bip32_obj = self.__DerivePathCached(tuple(path_idx))
 
         return bip32_obj
 
+    def DeriveMany(self, paths):
+        """ Derive children keys from many paths, deriving the keys shared by more paths only once.
+        The paths are arranged in a trie of indexes, whose internal nodes are the keys of the shared prefixes. Paths are
+        consumed lazily and results are returned in the same order, so it's possible to stream huge inputs.
+        Only the internal keys are kept by the trie, the last key of each path is derived and returned directly.
+
+        Args:
+            paths (iterable): Paths
+
+        Returns:
+            generator: Generator of (path, Bip32 object) tuples, in the same order of paths
+
+        Raises:
+            Bip32PathError: If a path is not valid (raised when the path is reached)
+        """
+
+        # Each trie node maps an index to a tuple of the correspondent key and its children node
+        trie = {}
+
+        for path in paths:
+            # Parse path
+            path_idx = Bip32PathParser.Parse(path, True)
+
+            # Check result
+            if len(path_idx) == 0:
+                raise Bip32PathError("The specified path is not valid")
+
+            # Walk the trie through the path prefix, deriving the keys not yet present
+            bip32_obj = self
+            trie_node = trie
+            for idx in path_idx[:-1]:
+                trie_entry = trie_node.get(idx)
+                if trie_entry is None:
+                    trie_entry = (bip32_obj.__ChildKey(idx, False), {})
+                    trie_node[idx] = trie_entry
+                bip32_obj, trie_node = trie_entry
+
+            yield path, bip32_obj.ChildKey(path_idx[-1])
+
+    def EnableDerivationCache(self, max_size = Bip32DerivationCacheConst.DEF_MAX_SIZE):
+        """ Enable the derivation cache, which is useful when deriving many paths sharing the same prefix.
+        DerivePath will store the intermediate keys in a bounded LRU cache and start from the longest cached one.
+        The cache only lives in memory (it's never serialized) and it's owned by the current object, not by the derived ones.
+
+        Args:
+            max_size (int, optional): Maximum number of cached keys
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        self.m_der_cache = Bip32DerivationCache(max_size)
+
+    def DisableDerivationCache(self):
+        """ Disable the derivation cache, removing all the cached keys. """
+        self.PurgeDerivationCache()
+        self.m_der_cache = None
+
+    def PurgeDerivationCache(self):
+        """ Remove all the keys from the derivation cache, if enabled. """
+        if self.m_der_cache is not None:
+            self.m_der_cache.Purge()
+
+    def IsDerivationCacheEnabled(self):
+        """ Get if the derivation cache is enabled.
+
+        Returns:
+            bool: True if enabled, false otherwise
+        """
+        return self.m_der_cache is not None
+
     def ConvertToPublic(self):
         """ Convert a private Bip32 object into a public one. """
-        self.m_key       = None
-        self.m_is_public = True
+
+        # Cached keys are private, so they cannot be used anymore
+        self.PurgeDerivationCache()
+        # Make sure the public key is computed before removing the private one
+        self._CompressedPublicKey()
+        self.m_secret         = None
+        self.m_ecdsa_priv_key = None
 
     def IsPublicOnly(self):
         """ Get if it's public-only.
@@ -263,10 +431,12 @@ class Bip32:
         Returns:
             bool: True if public-only, false otherwise
         """
-        return self.m_is_public
+        return self.m_secret is None
 
     def EcdsaPrivateKey(self):
         """ Return the ECDSA private key object.
+        The object is created only the first time, since computing its public key is expensive. Its public point is
+        then also used as public key, if not yet computed.
 
         Return:
             ecdsa.SigningKey object: ecdsa.SigningKey object
@@ -274,17 +444,24 @@ class Bip32:
         Raises:
             Bip32KeyError: If internal key is public-only
         """
-        if self.m_is_public:
+        if self.m_secret is None:
             raise Bip32KeyError("Public-only deterministic keys have no private half")
-        return self.m_key
+
+        if self.m_ecdsa_priv_key is None:
+            self.m_ecdsa_priv_key = ecdsa.SigningKey.from_string(self.m_secret, curve = SECP256k1)
+            if self.m_pub_point is None:
+                point = self.m_ecdsa_priv_key.get_verifying_key().pubkey.point
+                self.m_pub_point = (point.x(), point.y())
+        return self.m_ecdsa_priv_key
 
     def EcdsaPublicKey(self):
         """ Return the ECDSA public key object.
+        The object is created every time it's requested.
 
         Return:
             ecdsa.VerifyingKey object: ecdsa.VerifyingKey object
         """
-        return self.m_ver_key
+        return Bip32.__VerifyingKeyFromTrustedPoint(self.__PublicPoint())
 
     def PrivateKey(self):
         """ Return private key bytes.
@@ -295,7 +472,7 @@ class Bip32:
         Raises:
             Bip32KeyError: If internal key is public-only
         """
-        if self.m_is_public:
+        if self.m_secret is None:
             raise Bip32KeyError("Public-only deterministic keys have no private half")
         return BipPrivateKey(self)
 
@@ -345,7 +522,11 @@ class Bip32:
         Returns:
             bytes: Key identifier bytes
         """
-        return utils.Hash160(self.PublicKey().RawCompressed().ToBytes())
+
+        # Compute it only the first time
+        if self.m_key_id is None:
+            self.m_key_id = utils.Hash160(self._CompressedPublicKey())
+        return self.m_key_id
 
     def FingerPrint(self):
         """ Get key fingerprint.
@@ -353,7 +534,11 @@ class Bip32:
         Returns:
             bytes: Key fingerprint bytes
         """
-        return self.KeyIdentifier()[:Bip32Const.FINGERPRINT_BYTE_LEN]
+
+        # Compute it only the first time, so that all children share the same bytes
+        if self.m_fprint is None:
+            self.m_fprint = self.KeyIdentifier()[:Bip32Const.FINGERPRINT_BYTE_LEN]
+        return self.m_fprint
 
     def ParentFingerPrint(self):
         """ Get parent fingerprint.
@@ -363,15 +548,87 @@ class Bip32:
         """
         return self.m_parent_fprint
 
+    #
+    # Protected methods (used internally by the library)
+    #
+
+    def _PrivateKeyBytes(self):
+        """ Get the private key bytes.
+
+        Returns:
+            bytes: Private key bytes (None if public-only)
+        """
+        return self.m_secret
+
+    def _CompressedPublicKey(self):
+        """ Get the compressed public key bytes, computing them only the first time.
+
+        Returns:
+            bytes: Compressed public key bytes
+        """
+        if self.m_pub_key_bytes is None:
+            self.m_pub_key_bytes = Secp256k1.PointToCompressed(self.__PublicPoint())
+        return self.m_pub_key_bytes
+
+    def _UncompressedPublicKey(self):
+        """ Get the uncompressed public key bytes, without the prefix byte.
+
+        Returns:
+            bytes: Uncompressed public key bytes
+        """
+        return Secp256k1.PointToUncompressed(self.__PublicPoint())
+
     #
     # Private methods
     #
 
-    def __CkdPriv(self, index):
+    def __DerivePathCached(self, path_idx):
+        """ Derive children keys from the specified path indexes, using the derivation cache.
+        The last key is never taken from the cache, so the returned object is not shared with other callers.
+
+        Args:
+            path_idx (tuple): Path indexes
+
+        Returns:
+            Bip32 object: Bip32 object
+        """
+
+        # Start from the longest cached prefix
+        prefix_len, bip32_obj = self.m_der_cache.GetLongestPrefix(path_idx, len(path_idx) - 1)
+        if bip32_obj is None:
+            bip32_obj = self
+
+        # Derive the remaining children keys, caching all except the last one
+        for i in range(prefix_len, len(path_idx)):
+            bip32_obj = bip32_obj.__ChildKey(path_idx[i], i == len(path_idx) - 1)
+            if i < len(path_idx) - 1:
+                self.m_der_cache.Put(path_idx[:i + 1], bip32_obj)
+
+        return bip32_obj
+
+    def __ChildKey(self, index, with_fprint):
+        """ Create a child key of the specified index, like ChildKey.
+        The parent fingerprint of a private child can be skipped for intermediate keys of a derivation, which are never
+        returned, so that the public key of a key with hardened children is not computed if not needed.
+
+        Args:
+            index (int)       : Index
+            with_fprint (bool): True to set the parent fingerprint of the child, false if the child is an intermediate key
+
+        Returns:
+            Bip32 object: Child key as a new Bip32 object
+
+        Raises:
+            Bip32KeyError: If the index results in an invalid key
+        """
+        return self.__CkdPriv(index, with_fprint) if self.m_secret is not None else self.__CkdPub(index)
+
+    def __CkdPriv(self, index, with_fprint):
         """ Create a child key of the specified index.
 
         Args:
-            index (int): Index
+            index (int)       : Index
+            with_fprint (bool): True to set the parent fingerprint of the child even if the index is hardened
 
         Returns:
             Bip32 object: Bip32 object constructed with the child parameters
@@ -382,33 +639,20 @@ class Bip32:
 
         # Index as bytes
         index_bytes = index.to_bytes(4, "big")
+        is_hardened = Bip32Utils.IsHardenedIndex(index)
 
         # Data for HMAC
-        if Bip32Utils.IsHardenedIndex(index):
-            data = b"\x00" + self.m_key.to_string() + index_bytes
+        if is_hardened:
+            data = b"\x00" + self.m_secret + index_bytes
         else:
-            data = self.PublicKey().RawCompressed().ToBytes() + index_bytes
+            data = self._CompressedPublicKey() + index_bytes
 
         # Compute HMAC halves
         i_l, i_r = self.__HmacHalves(data)
 
-        # Construct new key secret from i_l and current private key
-        i_l_int = string_to_int(i_l)
-        key_int = string_to_int(self.m_key.to_string())
-        new_key_int = (i_l_int + key_int) % Bip32Const.CURVE_ORDER
-
-        # Convert to string and left pad with zeros
-        secret = int_to_string(new_key_int)
-        secret = b"\x00" * (32 - len(secret)) + secret
-
-        # Construct and return a new Bip32 object
-        return Bip32(secret      = secret,
-                     chain       = i_r,
-                     depth       = self.m_depth + 1,
-                     index       = index,
-                     fprint      = self.FingerPrint(),
-                     is_public   = False,
-                     key_net_ver = self.m_key_net_ver)
+        # For hardened indexes the public key of the current object is not needed for derivation, so the fingerprint
+        # is computed only if requested (unless it's already available)
+        return self.__PrivChildFromHmac(index, i_l, i_r, self.FingerPrint() if not is_hardened or with_fprint else self.m_fprint)
 
     def __CkdPub(self, index):
         """ Create a publicly derived child key of the specified index.
@@ -428,28 +672,134 @@ class Bip32:
             raise Bip32KeyError("Public child derivation cannot be used to create a hardened child key")
 
         # Data for HMAC, same of __CkdPriv() for public child key
-        data = self.PublicKey().RawCompressed().ToBytes() + index.to_bytes(4, "big")
+        data = self._CompressedPublicKey() + index.to_bytes(4, "big")
 
         # Get HMAC of data
         i_l, i_r = self.__HmacHalves(data)
 
+        return self.__PubChildFromHmac(index, i_l, i_r, self.FingerPrint())
+
+    def __PrivChildFromHmac(self, index, i_l, i_r, fprint):
+        """ Create a child key of the specified index from the HMAC halves.
+
+        Args:
+            index (int)   : Index
+            i_l (bytes)   : Left half of the HMAC
+            i_r (bytes)   : Right half of the HMAC
+            fprint (bytes): Fingerprint of the current key, None for an intermediate key
+
+        Returns:
+            Bip32 object: Bip32 object constructed with the child parameters
+
+        Raises:
+            Bip32KeyError: If the index results in an invalid key
+        """
+
+        # Construct new key secret from i_l and current private key
+        i_l_int = string_to_int(i_l)
+        key_int = string_to_int(self.m_secret)
+        new_key_int = (i_l_int + key_int) % Bip32Const.CURVE_ORDER
+
+        # Convert to string and left pad with zeros
+        secret = int_to_string(new_key_int)
+        secret = b"\x00" * (32 - len(secret)) + secret
+
+        # Construct a new Bip32 object
+        bip32_obj = Bip32(secret      = secret,
+                          chain       = i_r,
+                          depth       = self.m_depth + 1,
+                          index       = index,
+                          fprint      = fprint,
+                          is_public   = False,
+                          key_net_ver = self.m_key_net_ver)
+
+        return bip32_obj
+
+    def __PubChildFromHmac(self, index, i_l, i_r, fprint):
+        """ Create a publicly derived child key of the specified index from the HMAC halves.
+
+        Args:
+            index (int)   : Index
+            i_l (bytes)   : Left half of the HMAC
+            i_r (bytes)   : Right half of the HMAC
+            fprint (bytes): Fingerprint of the current key
+
+        Returns:
+            Bip32 object: Bip32 object constructed with the child parameters
+
+        Raises:
+            Bip32KeyError: If the index results in an invalid key
+        """
+
         # Construct curve point i_l*G+K
-        point = string_to_int(i_l) * generator_secp256k1 + self.m_ver_key.pubkey.point
+        point = Secp256k1.JacobianToAffine(
+            Secp256k1.JacobianAddAffine(Secp256k1.GeneratorMultiply(string_to_int(i_l)), self.__PublicPoint())
+        )
 
-        # Try to construct public key from the curve point
-        try:
-            k_i = ecdsa.VerifyingKey.from_public_point(point, curve = SECP256k1)
-        except:
+        # The point is computed from a valid parent key, so it can only be invalid if it's the point at infinity
+        if point is None:
             raise Bip32KeyError("Computed public child key is not valid, very unlucky index")
 
-        # Construct and return a new Bip32 object
-        return Bip32(secret      = k_i,
-                     chain       = i_r,
-                     depth       = self.m_depth + 1,
-                     index       = index,
-                     fprint      = self.FingerPrint(),
-                     is_public   = True,
-                     key_net_ver = self.m_key_net_ver)
+        bip32_obj = Bip32(secret      = Secp256k1.PointToCompressed(point),
+                          chain       = i_r,
+                          depth       = self.m_depth + 1,
+                          index       = index,
+                          fprint      = fprint,
+                          is_public   = True,
+                          key_net_ver = self.m_key_net_ver)
+        # Keep the point that is already computed, so that it's not recovered from the compressed public key (which
+        # requires a modular square root) for the uncompressed public key or for derivation
+        bip32_obj.m_pub_point = point
+
+        return bip32_obj
+
+    def __PublicPoint(self):
+        """ Get the public key point in affine coordinates, computing it only the first time.
+        The point is computed from the private key or recovered from the compressed public key.
+
+        Returns:
+            tuple: Public key point in affine coordinates
+
+        Raises:
+            Bip32KeyError: If the public key is not a valid point
+        """
+        if self.m_pub_point is None:
+            if self.m_secret is not None:
+                self.m_pub_point = Secp256k1.JacobianToAffine(Secp256k1.GeneratorMultiply(string_to_int(self.m_secret)))
+            else:
+                try:
+                    self.m_pub_point = Secp256k1.PointFromCompressed(self.m_pub_key_bytes)
+                except ValueError:
+                    raise Bip32KeyError("Invalid public key (malformed point)")
+        return self.m_pub_point
+
+    @staticmethod
+    def __VerifyingKeyFromTrustedPoint(point):
+        """ Create a verifying key from a point computed internally, which is on the curve by construction.
+        The point validation of the ecdsa library is skipped since it's redundant (depending on the library version,
+        it can include another scalar multiplication).
+
+        Args:
+            point (tuple): Public point in affine coordinates, not at infinity
+
+        Returns:
+            ecdsa.VerifyingKey object: ecdsa.VerifyingKey object
+        """
+        return ecdsa.VerifyingKey.from_public_point(Point(SECP256k1.curve, point[0], point[1], SECP256k1.order),
+                                                    curve          = SECP256k1,
+                                                    validate_point = False)
+
+    @staticmethod
+    def __IsSecretValid(secret):
+        """ Get if the specified secret is a valid private key, without computing the public key.
+
+        Args:
+            secret (bytes): Secret bytes
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return len(secret) == Bip32Const.SECRET_BYTE_LEN and 0 < string_to_int(secret) < Bip32Const.CURVE_ORDER
 
     def __HmacHalves(self, data_bytes):
         """ Calculate the HMAC-SHA512 of input data using the chain code as key and returns a tuple of the left and right halves of the HMAC.
@@ -461,6 +811,9 @@ class Bip32:
             tuple: Left and right halves of the HMAC
         """
 
-        # Use chain as HMAC key
-        hmac = utils.HmacSha512(self.m_chain, data_bytes)
+        # Use chain as HMAC key, preparing it only the first time
+        if self.m_hmac is None:
+            self.m_hmac = utils.HmacSha512New(self.m_chain)
+
+        hmac = utils.HmacSha512Copy(self.m_hmac, data_bytes)
         return (hmac[:32], hmac[32:])
@@ -0,0 +1,107 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import threading
+from collections import OrderedDict
+
+
+class Bip32DerivationCacheConst:
+    """ Class container for BIP32 derivation cache constants. """
+
+    # Default maximum number of cached keys
+    DEF_MAX_SIZE = 1024
+
+
+class Bip32DerivationCache:
+    """ BIP32 derivation cache class. It's a bounded LRU cache of derived keys, indexed by their path from the key owning
+    the cache (as a tuple of indexes). It's thread-safe and it only lives in memory, so keys are never stored outside the process.
+    """
+
+    def __init__(self, max_size = Bip32DerivationCacheConst.DEF_MAX_SIZE):
+        """ Construct class.
+
+        Args:
+            max_size (int, optional): Maximum number of cached keys
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        if max_size <= 0:
+            raise ValueError("Maximum size of derivation cache (%d) is not valid" % max_size)
+
+        self.m_max_size = max_size
+        self.m_keys     = OrderedDict()
+        self.m_lock     = threading.Lock()
+
+    def GetLongestPrefix(self, path_idx, max_len):
+        """ Get the cached key with the longest path that is a prefix of the specified one.
+
+        Args:
+            path_idx (tuple): Path indexes
+            max_len (int)   : Maximum prefix length
+
+        Returns:
+            tuple: Prefix length and cached key (0 and None if no prefix is cached)
+        """
+        with self.m_lock:
+            for prefix_len in range(min(max_len, len(path_idx)), 0, -1):
+                prefix = path_idx[:prefix_len]
+                bip32_obj = self.m_keys.get(prefix)
+                if bip32_obj is not None:
+                    self.m_keys.move_to_end(prefix)
+                    return prefix_len, bip32_obj
+
+        return 0, None
+
+    def Put(self, path_idx, bip32_obj):
+        """ Put a key in the cache, removing the least recently used one if full.
+
+        Args:
+            path_idx (tuple)        : Path indexes
+            bip32_obj (Bip32 object): Bip32 object
+        """
+        with self.m_lock:
+            self.m_keys[path_idx] = bip32_obj
+            self.m_keys.move_to_end(path_idx)
+            while len(self.m_keys) > self.m_max_size:
+                self.m_keys.popitem(last = False)
+
+    def Purge(self):
+        """ Remove all the cached keys. """
+        with self.m_lock:
+            self.m_keys.clear()
+
+    def Size(self):
+        """ Get the number of cached keys.
+
+        Returns:
+            int: Number of cached keys
+        """
+        return len(self.m_keys)
+
+    def MaxSize(self):
+        """ Get the maximum number of cached keys.
+
+        Returns:
+            int: Maximum number of cached keys
+        """
+        return self.m_max_size
@@ -20,11 +20,33 @@
 
 
 # Imports
+import itertools
 import os
+import threading
+import unicodedata
+from collections        import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from enum               import IntEnum, unique
 from .bip39_ex import Bip39InvalidFileError, Bip39ChecksumError
 from .         import utils
 
 
+@unique
+class Bip39Languages(IntEnum):
+    """ Enumerative for BIP39 languages. """
+
+    ENGLISH             = 0,
+    SPANISH             = 1,
+    FRENCH              = 2,
+    ITALIAN             = 3,
+    PORTUGUESE          = 4,
+    CZECH               = 5,
+    JAPANESE            = 6,
+    KOREAN              = 7,
+    CHINESE_SIMPLIFIED  = 8,
+    CHINESE_TRADITIONAL = 9,
+
+
 class Bip39Const:
     """ Class container for BIP39 constants. """
 
@@ -38,6 +60,28 @@ class Bip39Const:
     # Bits of a single word
     WORD_BITS          = 11
 
+    # Words list file name for each language
+    LANGUAGE_FILES     = {
+        Bip39Languages.ENGLISH             : "bip39_wordslist_en.txt",
+        Bip39Languages.SPANISH             : "bip39_wordslist_es.txt",
+        Bip39Languages.FRENCH              : "bip39_wordslist_fr.txt",
+        Bip39Languages.ITALIAN             : "bip39_wordslist_it.txt",
+        Bip39Languages.PORTUGUESE          : "bip39_wordslist_pt.txt",
+        Bip39Languages.CZECH               : "bip39_wordslist_cs.txt",
+        Bip39Languages.JAPANESE            : "bip39_wordslist_ja.txt",
+        Bip39Languages.KOREAN              : "bip39_wordslist_ko.txt",
+        Bip39Languages.CHINESE_SIMPLIFIED  : "bip39_wordslist_zh_cn.txt",
+        Bip39Languages.CHINESE_TRADITIONAL : "bip39_wordslist_zh_tw.txt",
+    }
+    # Words separator, Japanese mnemonics use the ideographic space
+    WORDS_SEP          = " "
+    WORDS_SEP_JAPANESE = "\u3000"
+
+    # Length in bytes of the random blocks read when generating entropy for many mnemonics
+    ENTROPY_BLOCK_LEN  = 65536
+    # Maximum number of pending seeds for each worker when generating many seeds
+    SEED_PENDING_NUM   = 4
+
     # Salt modifier for seed generation
     SEED_SALT_MOD      = "mnemonic"
     # PBKDF2 round for seed generation
@@ -46,6 +90,61 @@ class Bip39Const:
     SEED_LEN           = 64
 
 
+class Bip39Utils:
+    """ Class container for BIP39 utility functions. """
+
+    @staticmethod
+    def ChecksumBitLen(entropy_bit_len):
+        """ Get the checksum length in bits from the entropy length in bits.
+
+        Args:
+            entropy_bit_len (int): Entropy length in bits
+
+        Returns:
+            int: Checksum length in bits
+        """
+        return entropy_bit_len // 32
+
+    @staticmethod
+    def ComputeChecksum(entropy_bytes):
+        """ Compute the checksum of the specified entropy, i.e. the first bits of its SHA256.
+
+        Args:
+            entropy_bytes (bytes): Entropy bytes
+
+        Returns:
+            int: Checksum
+        """
+
+        # The checksum is at most 8-bit, so only the first byte of the hash is needed
+        return utils.Sha256(entropy_bytes)[0] >> (8 - Bip39Utils.ChecksumBitLen(len(entropy_bytes) * 8))
+
+    @staticmethod
+    def Normalize(data_str):
+        """ Normalize the specified string in NFKD form, as required by BIP39 for mnemonics and passphrases.
+
+        Args:
+            data_str (str): Data string
+
+        Returns:
+            str: Normalized string
+        """
+        return unicodedata.normalize("NFKD", data_str)
+
+    @staticmethod
+    def SeedSalt(passphrase):
+        """ Get the seed salt bytes of the specified passphrase, normalized and encoded.
+        Salts are not cached, so that passphrases are not kept in memory.
+
+        Args:
+            passphrase (str): Passphrase
+
+        Returns:
+            bytes: Salt bytes
+        """
+        return utils.StringEncode(Bip39Utils.Normalize(Bip39Const.SEED_SALT_MOD + passphrase))
+
+
 class EntropyGenerator:
     """ Entropy generator class. It generates random entropy bytes with the specified length. """
 
@@ -71,31 +170,68 @@ class EntropyGenerator:
         """
         return os.urandom(self.m_bits_len // 8)
 
+    def GenerateMany(self, count):
+        """ Generate random entropy bytes with the length specified during construction for the specified number of times.
+        Random bytes are read in blocks and split, so that there is a single system call for many entropies.
 
-class MnemonicFileReader:
-    """ Mnemonic file reader class. It reads the English BIP39 words list from a file """
+        Args:
+            count (int): Number of entropies
+
+        Returns:
+            generator: Generator of entropy bytes
+        """
+        byte_len = self.m_bits_len // 8
+        block_num = max(Bip39Const.ENTROPY_BLOCK_LEN // byte_len, 1)
+
+        while count > 0:
+            curr_num = min(count, block_num)
+            block = os.urandom(curr_num * byte_len)
+
+            for i in range(curr_num):
+                yield block[i * byte_len : (i + 1) * byte_len]
+            count -= curr_num
 
-    # File name constant
-    FILE_NAME = "bip39_wordslist_en.txt"
 
-    def __init__(self):
-        """ Construct class by reading the words list from file.
+class MnemonicFileReader:
+    """ Mnemonic file reader class. It reads the BIP39 words list of a language from a file.
+    Each words list is read only once per process (the first time it's needed) and shared by all the objects, together
+    with a map for getting the index of a word and a map from each prefix to the words starting with it.
+    Words lists are NFKD-normalized, words not found as they are specified are normalized before searching them again.
+    """
+
+    # Words list, map from words to indexes and map from prefixes to words for each language, as a tuple
+    m_words_cache = {}
+    # Map from words to the languages including them
+    m_words_langs = None
+    # Lock for reading the words lists only once
+    m_lock        = threading.Lock()
+
+    def __init__(self, lang = Bip39Languages.ENGLISH):
+        """ Construct class by reading the words list from file, if not already read.
+
+        Args:
+            lang (Bip39Languages, optional): Language (default: English)
 
         Raises:
+            TypeError: If the language is not a Bip39Languages enum
             Bip39InvalidFileError: If loaded words list length is not 2048
         """
+        if not isinstance(lang, Bip39Languages):
+            raise TypeError("Language is not an enumerative of Bip39Languages")
 
-        # Read file
-        file_path = os.path.join(os.path.dirname(__file__), self.FILE_NAME)
-        with open(file_path, "r", encoding = "utf-8") as fin:
-            self.m_words_list = [word.strip() for word in fin.readlines() if word.strip() != ""]
+        self.m_lang = lang
+        self.m_words_list, self.m_words_to_idx, self.m_prefix_to_words = self.__LoadWords(lang)
 
-        # Check words list length
-        if len(self.m_words_list) != Bip39Const.WORDS_LIST_NUM:
-            raise Bip39InvalidFileError("Number of loaded words list (%d) is not valid" % len(self.m_words_list))
+    def Language(self):
+        """ Get the language.
+
+        Returns:
+            Bip39Languages: Language
+        """
+        return self.m_lang
 
     def GetWordIdx(self, word):
-        """ Get the index of the specified word, by searching it in the list.
+        """ Get the index of the specified word.
 
         Args:
             word (str): Word to be searched
@@ -106,12 +242,53 @@ class MnemonicFileReader:
         Raises:
             ValueError: If the word is not found
         """
-        idx = utils.BinarySearch(self.m_words_list, word)
-        if idx == -1:
-            raise ValueError("Word %s is not existent in word list" % word)
+        idx = self.m_words_to_idx.get(word)
+        if idx is None:
+            idx = self.m_words_to_idx.get(Bip39Utils.Normalize(word))
+            if idx is None:
+                raise ValueError("Word %s is not existent in word list" % word)
 
         return idx
 
+    def GetWordIdxFromPrefix(self, prefix):
+        """ Get the index of the word that is equal to the specified prefix or, if none, the only one starting with it.
+        This allows expanding abbreviated words, since English words (and most of the other languages ones) are unique
+        by their first four letters.
+
+        Args:
+            prefix (str): Word or word prefix
+
+        Returns:
+            int: Word index
+
+        Raises:
+            ValueError: If no word or more than one word start with the prefix
+        """
+        prefix = Bip39Utils.Normalize(prefix)
+
+        idx = self.m_words_to_idx.get(prefix)
+        if idx is not None:
+            return idx
+
+        words = self.m_prefix_to_words.get(prefix, ())
+        if len(words) != 1:
+            raise ValueError("Word prefix %s is %s in word list" % (prefix, "not existent" if len(words) == 0 else "ambiguous"))
+
+        return self.m_words_to_idx[words[0]]
+
+    def GetWordsFromPrefix(self, prefix, max_num = None):
+        """ Get the words starting with the specified prefix (e.g. for autocompletion), in the same order of the list.
+
+        Args:
+            prefix (str)            : Word prefix
+            max_num (int, optional): Maximum number of words, all if not specified
+
+        Returns:
+            list: Words starting with the prefix
+        """
+        words = self.m_prefix_to_words.get(Bip39Utils.Normalize(prefix), ()) if prefix != "" else self.m_words_list
+        return list(words[:max_num])
+
     def GetWordAtIdx(self, word_idx):
         """ Get the word at the specified index.
 
@@ -123,6 +300,316 @@ class MnemonicFileReader:
         """
         return self.m_words_list[word_idx]
 
+    @classmethod
+    def GetWordLanguages(cls, word):
+        """ Get the languages whose words list includes the specified word.
+        All the words lists are read the first time, in order to build a single map from words to languages.
+
+        Args:
+            word (str): Word to be searched
+
+        Returns:
+            tuple: Languages including the word, in the same order of Bip39Languages (empty if none)
+
+        Raises:
+            Bip39InvalidFileError: If loaded words list length is not 2048
+        """
+        if cls.m_words_langs is None:
+            words_langs = {}
+            for lang in Bip39Languages:
+                for lang_word in cls.__LoadWords(lang)[0]:
+                    words_langs.setdefault(lang_word, []).append(lang)
+
+            with cls.m_lock:
+                if cls.m_words_langs is None:
+                    cls.m_words_langs = {lang_word: tuple(langs) for lang_word, langs in words_langs.items()}
+
+        langs = cls.m_words_langs.get(word)
+        if langs is None:
+            langs = cls.m_words_langs.get(Bip39Utils.Normalize(word), ())
+
+        return langs
+
+    @classmethod
+    def IsLanguageLoaded(cls, lang):
+        """ Get if the words list of the specified language is already read.
+
+        Args:
+            lang (Bip39Languages): Language
+
+        Returns:
+            bool: True if already read, false otherwise
+        """
+        return lang in cls.m_words_cache
+
+    @classmethod
+    def __LoadWords(cls, lang):
+        """ Read the words list of the specified language from file and build the maps, only the first time.
+
+        Args:
+            lang (Bip39Languages): Language
+
+        Returns:
+            tuple: Words list, map from words to indexes and map from prefixes to words
+
+        Raises:
+            Bip39InvalidFileError: If loaded words list length is not 2048
+        """
+        if lang not in cls.m_words_cache:
+            with cls.m_lock:
+                if lang not in cls.m_words_cache:
+                    # Read file
+                    file_path = os.path.join(os.path.dirname(__file__), Bip39Const.LANGUAGE_FILES[lang])
+                    with open(file_path, "r", encoding = "utf-8") as fin:
+                        words_list = [Bip39Utils.Normalize(word.strip()) for word in fin.readlines() if word.strip() != ""]
+
+                    # Check words list length
+                    if len(words_list) != Bip39Const.WORDS_LIST_NUM:
+                        raise Bip39InvalidFileError("Number of loaded words list (%d) is not valid" % len(words_list))
+
+                    # Map each prefix of each word to the words starting with it
+                    prefix_to_words = {}
+                    for word in words_list:
+                        for i in range(1, len(word) + 1):
+                            prefix_to_words.setdefault(word[:i], []).append(word)
+
+                    cls.m_words_cache[lang] = (words_list,
+                                               {word: idx for idx, word in enumerate(words_list)},
+                                               {prefix: tuple(words) for prefix, words in prefix_to_words.items()})
+
+        return cls.m_words_cache[lang]
+
+
+class Bip39Mnemonic:
+    """ BIP39 mnemonic class. It represents a valid mnemonic together with its language, words indexes and entropy, so that
+    it can be passed to Bip39MnemonicValidator and Bip39SeedGenerator without being parsed and validated again.
+    """
+
+    def __init__(self, words, words_idx, entropy_bytes, lang):
+        """ Construct class. FromString or FromEntropy shall be used instead, since nothing is validated here.
+
+        Args:
+            words (list)         : Words, NFKD-normalized
+            words_idx (list)     : Words indexes
+            entropy_bytes (bytes): Entropy bytes
+            lang (Bip39Languages): Language
+        """
+        self.m_words         = words
+        self.m_words_idx     = words_idx
+        self.m_entropy_bytes = entropy_bytes
+        self.m_lang          = lang
+        self.m_norm_bytes    = None
+
+    @classmethod
+    def FromString(cls, mnemonic, expand = False, lang = None):
+        """ Create a mnemonic object from a mnemonic string or list, validating it.
+        If the language is not specified, it's detected from the words. English is tried first, then the languages whose
+        words lists are already read and finally the other ones, so words lists are read only if really needed.
+        In the unlikely case that the mnemonic is valid in more languages (i.e. all its words are included in more words
+        lists), the first one found is used.
+
+        Args:
+            mnemonic (str or list)         : Mnemonic
+            expand (bool, optional)        : True to accept abbreviated words (e.g. the first four letters), which are
+                                             expanded to the full ones (default: false)
+            lang (Bip39Languages, optional): Language, detected automatically if not specified
+
+        Returns:
+            Bip39Mnemonic object: Bip39Mnemonic object
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If mnemonic is not valid
+            Bip39ChecksumError: If checksum is not valid
+        """
+
+        # Normalize and split mnemonic string if needed (this also converts the ideographic spaces)
+        if not isinstance(mnemonic, list):
+            words = Bip39Utils.Normalize(mnemonic).split(" ")
+        else:
+            words = [Bip39Utils.Normalize(word) for word in mnemonic]
+
+        # Check mnemonic length
+        if len(words) not in Bip39Const.MNEMONIC_WORD_LEN:
+            raise ValueError("Mnemonic length (%d) is not valid" % len(words))
+
+        if lang is not None:
+            return cls.__FromWords(words, expand, lang)
+
+        # Try the languages until all the words are found and the checksum is valid
+        # Languages not including a word are discarded quickly, since the word is not found in the map
+        checksum_err = None
+        for lang in cls.__DetectionOrder():
+            try:
+                return cls.__FromWords(words, expand, lang)
+            except Bip39ChecksumError as ex:
+                checksum_err = ex
+            except ValueError:
+                pass
+
+        if checksum_err is not None:
+            raise checksum_err
+        raise ValueError("Mnemonic words are not existent in any word list")
+
+    @classmethod
+    def FromEntropy(cls, entropy_bytes, lang = Bip39Languages.ENGLISH):
+        """ Create a mnemonic object from the specified entropy bytes.
+
+        Args:
+            entropy_bytes (bytes)          : Entropy bytes (accepted lengths in bits: 128, 160, 192, 224, 256)
+            lang (Bip39Languages, optional): Language (default: English)
+
+        Returns:
+            Bip39Mnemonic object: Bip39Mnemonic object
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If entropy length is not valid
+        """
+
+        # Check entropy lenght in bits
+        entropy_bit_len = len(entropy_bytes) * 8
+        if entropy_bit_len not in Bip39Const.ENTROPY_BIT_LEN:
+            raise ValueError("Entropy length in bits (%d) is not valid" % entropy_bit_len)
+
+        # Create mnemonic entropy by concatenating entropy and checksum bits, as specified in BIP39
+        checksum_bit_len = Bip39Utils.ChecksumBitLen(entropy_bit_len)
+        mnemonic_int = (int.from_bytes(entropy_bytes, "big") << checksum_bit_len) | Bip39Utils.ComputeChecksum(entropy_bytes)
+        words_num = (entropy_bit_len + checksum_bit_len) // Bip39Const.WORD_BITS
+
+        # Create mnemonic reader
+        mnemonic_reader = MnemonicFileReader(lang)
+        # Get mnemonic from entropy, each word index is a group of bits starting from the most significant ones
+        word_mask = (1 << Bip39Const.WORD_BITS) - 1
+        words_idx = [(mnemonic_int >> ((words_num - i - 1) * Bip39Const.WORD_BITS)) & word_mask for i in range(words_num)]
+
+        return cls([mnemonic_reader.GetWordAtIdx(word_idx) for word_idx in words_idx], words_idx, entropy_bytes, lang)
+
+    def ToStr(self):
+        """ Get the mnemonic as a string, Japanese words are separated by the ideographic space.
+
+        Returns:
+            str: Mnemonic string
+        """
+        words_sep = Bip39Const.WORDS_SEP_JAPANESE if self.m_lang == Bip39Languages.JAPANESE else Bip39Const.WORDS_SEP
+        return words_sep.join(self.m_words)
+
+    def ToList(self):
+        """ Get the mnemonic as a list of words.
+
+        Returns:
+            list: Mnemonic words
+        """
+        return list(self.m_words)
+
+    def ToNormalizedBytes(self):
+        """ Get the NFKD-normalized mnemonic string encoded to bytes, as used for seed generation.
+        It's computed only the first time.
+
+        Returns:
+            bytes: Normalized mnemonic bytes
+        """
+        if self.m_norm_bytes is None:
+            self.m_norm_bytes = utils.StringEncode(Bip39Utils.Normalize(self.ToStr()))
+        return self.m_norm_bytes
+
+    def WordsIdx(self):
+        """ Get the words indexes.
+
+        Returns:
+            list: Words indexes
+        """
+        return list(self.m_words_idx)
+
+    def WordsCount(self):
+        """ Get the number of words.
+
+        Returns:
+            int: Number of words
+        """
+        return len(self.m_words)
+
+    def Entropy(self):
+        """ Get the entropy bytes.
+
+        Returns:
+            bytes: Entropy bytes
+        """
+        return self.m_entropy_bytes
+
+    def Language(self):
+        """ Get the language.
+
+        Returns:
+            Bip39Languages: Language
+        """
+        return self.m_lang
+
+    def __str__(self):
+        """ Get the mnemonic as a string.
+
+        Returns:
+            str: Mnemonic string
+        """
+        return self.ToStr()
+
+    @classmethod
+    def __FromWords(cls, words, expand, lang):
+        """ Create a mnemonic object from normalized words of the specified language, validating them.
+
+        Args:
+            words (list)         : Words
+            expand (bool)        : True to accept abbreviated words
+            lang (Bip39Languages): Language
+
+        Returns:
+            Bip39Mnemonic object: Bip39Mnemonic object
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If mnemonic is not valid
+            Bip39ChecksumError: If checksum is not valid
+        """
+
+        # Create reader
+        mnemonic_reader = MnemonicFileReader(lang)
+        # Concatenate the bits of each word index
+        if expand:
+            words_idx = [mnemonic_reader.GetWordIdxFromPrefix(word) for word in words]
+            words = [mnemonic_reader.GetWordAtIdx(word_idx) for word_idx in words_idx]
+        else:
+            words_idx = [mnemonic_reader.GetWordIdx(word) for word in words]
+        mnemonic_int = 0
+        for word_idx in words_idx:
+            mnemonic_int = (mnemonic_int << Bip39Const.WORD_BITS) | word_idx
+
+        # Split entropy and checksum bits
+        mnemonic_bit_len = len(words) * Bip39Const.WORD_BITS
+        checksum_bit_len = mnemonic_bit_len // 33
+        entropy_bit_len = mnemonic_bit_len - checksum_bit_len
+
+        entropy_bytes = (mnemonic_int >> checksum_bit_len).to_bytes(entropy_bit_len // 8, "big")
+        checksum = mnemonic_int & ((1 << checksum_bit_len) - 1)
+
+        # Verify checksum
+        comp_checksum = Bip39Utils.ComputeChecksum(entropy_bytes)
+        if checksum != comp_checksum:
+            raise Bip39ChecksumError("Invalid checksum when getting entropy (expected %s, got %s" %
+                                     (utils.IntToBinaryStr(comp_checksum, checksum_bit_len), utils.IntToBinaryStr(checksum, checksum_bit_len)))
+
+        return cls(words, words_idx, entropy_bytes, lang)
+
+    @staticmethod
+    def __DetectionOrder():
+        """ Get the order in which languages are tried when detecting the language of a mnemonic.
+
+        Returns:
+            list: English, then the languages already read and finally the other ones, in the order of Bip39Languages
+        """
+        loaded = [lang for lang in Bip39Languages if lang != Bip39Languages.ENGLISH and MnemonicFileReader.IsLanguageLoaded(lang)]
+        others = [lang for lang in Bip39Languages if lang != Bip39Languages.ENGLISH and lang not in loaded]
+        return [Bip39Languages.ENGLISH] + loaded + others
+
 
 class Bip39MnemonicGenerator:
     """ BIP39 mnemonic generator class. It generates the mnemonic in according to BIP39.
@@ -131,16 +618,36 @@ class Bip39MnemonicGenerator:
      """
 
     @staticmethod
-    def FromWordsNumber(words_num):
+    def FromWordsNumber(words_num, lang = Bip39Languages.ENGLISH):
         """ Generate mnemonic with the specified words number from random entropy.
 
         Args:
-            words_num (int): Number of words (12, 15, 18, 21, 24)
+            words_num (int)                : Number of words (12, 15, 18, 21, 24)
+            lang (Bip39Languages, optional): Language (default: English)
 
         Returns:
             str: Generated mnemonic from random entropy
 
         Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If words number is not valid
+        """
+        return Bip39MnemonicGenerator.FromWordsNumberObj(words_num, lang).ToStr()
+
+    @staticmethod
+    def FromWordsNumberObj(words_num, lang = Bip39Languages.ENGLISH):
+        """ Generate mnemonic with the specified words number from random entropy, as a Bip39Mnemonic object.
+        The object can be passed to Bip39MnemonicValidator and Bip39SeedGenerator without being validated again.
+
+        Args:
+            words_num (int)                : Number of words (12, 15, 18, 21, 24)
+            lang (Bip39Languages, optional): Language (default: English)
+
+        Returns:
+            Bip39Mnemonic object: Generated mnemonic from random entropy
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
             ValueError: If words number is not valid
         """
 
@@ -153,55 +660,95 @@ class Bip39MnemonicGenerator:
         # Generate entropy
         entropy_bytes = EntropyGenerator(entropy_bit_len).Generate()
 
-        return Bip39MnemonicGenerator.FromEntropy(entropy_bytes)
+        return Bip39MnemonicGenerator.FromEntropyObj(entropy_bytes, lang)
 
     @staticmethod
-    def FromEntropy(entropy_bytes):
-        """ Generate mnemonic from the specified entropy bytes.
+    def FromWordsNumberMany(words_num, count, lang = Bip39Languages.ENGLISH):
+        """ Generate many mnemonics with the specified words number from random entropy.
+        Mnemonics are generated lazily and the entropy is read in blocks for many of them (see EntropyGenerator.GenerateMany).
 
         Args:
-            entropy_bytes (bytes): Entropy bytes (accepted lengths in bits: 128, 160, 192, 224, 256)
+            words_num (int)                : Number of words (12, 15, 18, 21, 24)
+            count (int)                    : Number of mnemonics
+            lang (Bip39Languages, optional): Language (default: English)
 
         Returns:
-            str: Generated mnemonic from specified entropy
+            generator: Generator of mnemonics
 
         Raises:
-            ValueError: If entropy length is not valid
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If words number or count is not valid
         """
+        return (mnemonic.ToStr() for mnemonic in Bip39MnemonicGenerator.FromWordsNumberManyObj(words_num, count, lang))
 
-        # Check entropy lenght in bits
-        entropy_bit_len = len(entropy_bytes) * 8
-        if entropy_bit_len not in Bip39Const.ENTROPY_BIT_LEN:
-            raise ValueError("Entropy length in bits (%d) is not valid" % entropy_bit_len)
+    @staticmethod
+    def FromWordsNumberManyObj(words_num, count, lang = Bip39Languages.ENGLISH):
+        """ Generate many mnemonics with the specified words number from random entropy, as Bip39Mnemonic objects.
+        Mnemonics are generated lazily and the entropy is read in blocks for many of them (see EntropyGenerator.GenerateMany).
 
-        # Compute entropy hash
-        entropy_hash_bytes = utils.Sha256(entropy_bytes)
+        Args:
+            words_num (int)                : Number of words (12, 15, 18, 21, 24)
+            count (int)                    : Number of mnemonics
+            lang (Bip39Languages, optional): Language (default: English)
 
-        # Convert entropy to binary string
-        entropy_bin = utils.BytesToBinaryStr(entropy_bytes, len(entropy_bytes) * 8)
-        # Convert entropy hash to binary string
-        entropy_hash_bin = utils.BytesToBinaryStr(entropy_hash_bytes, utils.Sha256DigestSize() * 8)
-        # Get checksum binary string
-        checksum_bin = entropy_hash_bin[: len(entropy_bytes) // 4]
+        Returns:
+            generator: Generator of Bip39Mnemonic objects
 
-        # Create mnemonic entropy binary string by concatenating entropy and checksum, as specified in BIP39
-        mnemonic_entropy_bin = entropy_bin + checksum_bin
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If words number or count is not valid
+        """
 
-        # Create mnemonic reader
-        mnemonic_reader = MnemonicFileReader()
+        # Check words number
+        if words_num not in Bip39Const.MNEMONIC_WORD_LEN:
+            raise ValueError("Words number for mnemonic (%d) is not valid" % words_num)
+        # Check count
+        if count < 0:
+            raise ValueError("Number of mnemonics (%d) is not valid" % count)
 
-        # Empty mnemonic
-        mnemonic = []
+        # Check language, since mnemonics are generated lazily
+        if not isinstance(lang, Bip39Languages):
+            raise TypeError("Language is not an enumerative of Bip39Languages")
 
-        # Get mnemonic from entropy
-        for i in range(len(mnemonic_entropy_bin) // Bip39Const.WORD_BITS):
-            # Get current word index
-            word_idx = int(mnemonic_entropy_bin[i * Bip39Const.WORD_BITS : (i + 1) * Bip39Const.WORD_BITS], 2)
-            # Get word at given index
-            mnemonic.append(mnemonic_reader.GetWordAtIdx(word_idx))
+        # Get entropy length in bit from words number
+        entropy_bit_len = Bip39MnemonicGenerator.__EntropyBitLenFromWordsNum(words_num)
 
-        # Join to string
-        return " ".join(mnemonic)
+        return (Bip39MnemonicGenerator.FromEntropyObj(entropy_bytes, lang) for entropy_bytes in EntropyGenerator(entropy_bit_len).GenerateMany(count))
+
+    @staticmethod
+    def FromEntropy(entropy_bytes, lang = Bip39Languages.ENGLISH):
+        """ Generate mnemonic from the specified entropy bytes.
+
+        Args:
+            entropy_bytes (bytes)          : Entropy bytes (accepted lengths in bits: 128, 160, 192, 224, 256)
+            lang (Bip39Languages, optional): Language (default: English)
+
+        Returns:
+            str: Generated mnemonic from specified entropy
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If entropy length is not valid
+        """
+        return Bip39MnemonicGenerator.FromEntropyObj(entropy_bytes, lang).ToStr()
+
+    @staticmethod
+    def FromEntropyObj(entropy_bytes, lang = Bip39Languages.ENGLISH):
+        """ Generate mnemonic from the specified entropy bytes, as a Bip39Mnemonic object.
+        The object can be passed to Bip39MnemonicValidator and Bip39SeedGenerator without being validated again.
+
+        Args:
+            entropy_bytes (bytes)          : Entropy bytes (accepted lengths in bits: 128, 160, 192, 224, 256)
+            lang (Bip39Languages, optional): Language (default: English)
+
+        Returns:
+            Bip39Mnemonic object: Generated mnemonic from specified entropy
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If entropy length is not valid
+        """
+        return Bip39Mnemonic.FromEntropy(entropy_bytes, lang)
 
     @staticmethod
     def __EntropyBitLenFromWordsNum(words_num):
@@ -217,19 +764,29 @@ class Bip39MnemonicGenerator:
 
 
 class Bip39MnemonicValidator:
-    """ BIP39 mnemonic validator class. It validates a mnemonic string or list. """
+    """ BIP39 mnemonic validator class. It validates a mnemonic string or list.
+    The mnemonic is parsed only once, even if more methods are called, and not at all if it's a Bip39Mnemonic object.
+    """
 
     #
     # Public methods
     #
 
-    def __init__(self, mnemonic):
+    def __init__(self, mnemonic, lang = None):
         """ Construct the class from mnemonic.
 
         Args:
-            mnemonic (str or list): Mnemonic
+            mnemonic (str, list or Bip39Mnemonic object): Mnemonic
+            lang (Bip39Languages, optional)             : Language, detected automatically if not specified
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
         """
+        if lang is not None and not isinstance(lang, Bip39Languages):
+            raise TypeError("Language is not an enumerative of Bip39Languages")
+
         self.m_mnemonic = mnemonic
+        self.m_lang     = lang
 
     def Validate(self):
         """ Validate the mnemonic specified at construction.
@@ -237,15 +794,12 @@ class Bip39MnemonicValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-
-        # Get back mnemonic binary string
         try:
-            mnemonic_bin = self.__GetMnemonicBinaryStr()
-        except ValueError:
+            self.GetMnemonic()
+        except (ValueError, Bip39ChecksumError):
             return False
 
-        # The computed checksum shall be equal to the existent one
-        return self.__ComputeChecksum(mnemonic_bin) == self.__GetChecksum(mnemonic_bin)
+        return True
 
     def GetEntropy(self):
         """Get entropy bytes from mnemonic.
@@ -257,144 +811,165 @@ class Bip39MnemonicValidator:
             ValueError: If mnemonic is not valid
             Bip39ChecksumError: If checksum is not valid
         """
+        return self.GetMnemonic().Entropy()
 
-        # Get back mnemonic binary string
-        mnemonic_bin = self.__GetMnemonicBinaryStr()
-
-        checksum      = self.__GetChecksum(mnemonic_bin)
-        comp_checksum = self.__ComputeChecksum(mnemonic_bin)
-
-        # Verify checksum
-        if checksum != comp_checksum:
-            raise Bip39ChecksumError("Invalid checksum when getting entropy (expected %s, got %s" % (comp_checksum, checksum))
-
-        # Get entropy bytes from binary string
-        return self.__GetEntropyBytes(mnemonic_bin)
-
-    #
-    # Private methods
-    #
-
-    def __GetMnemonicBinaryStr(self):
-        """ Get mnemonic binary string from mnemonic string or list.
+    def GetMnemonic(self):
+        """ Get the validated mnemonic object, that can be passed to Bip39SeedGenerator without validating it again.
 
         Returns:
-           str: Mnemonic binary string
+            Bip39Mnemonic object: Bip39Mnemonic object
 
         Raises:
             ValueError: If mnemonic is not valid
+            Bip39ChecksumError: If checksum is not valid
         """
+        if not isinstance(self.m_mnemonic, Bip39Mnemonic):
+            self.m_mnemonic = Bip39Mnemonic.FromString(self.m_mnemonic, lang = self.m_lang)
+        return self.m_mnemonic
 
-        # Split mnemonic string if needed
-        mnemonic = self.m_mnemonic.split(" ") if not isinstance(self.m_mnemonic, list) else self.m_mnemonic
-
-        # Check mnemonic length
-        if len(mnemonic) not in Bip39Const.MNEMONIC_WORD_LEN:
-            raise ValueError("Mnemonic length (%d) is not valid" % len(mnemonic))
-
-        # Create reader
-        mnemonic_reader = MnemonicFileReader()
-        # Convert each word to its index in binary format
-        mnemonic_bin = map(lambda word : utils.IntToBinaryStr(mnemonic_reader.GetWordIdx(word), Bip39Const.WORD_BITS), mnemonic)
 
-        # Join the elements to get the complete binary string
-        return "".join(mnemonic_bin)
+class Bip39SeedGenerator:
+    """ BIP39 seed generator class. It generates the seed from a mnemonic in according to BIP39. """
 
-    def __GetEntropyBytes(self, mnemonic_bin_str):
-        """ Get entropy from mnemonic binary string.
+    def __init__(self, mnemonic, lang = None):
+        """ Construct the class from a specified mnemonic.
 
         Args:
-            mnemonic_bin_str (str): Mnemonic binary string
+            mnemonic (str, list or Bip39Mnemonic object): Mnemonic, a Bip39Mnemonic object is not validated again
+            lang (Bip39Languages, optional)             : Language, detected automatically if not specified
 
-        Returns:
-           bytes: Entropy bytes
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If the mnemonic is not valid
         """
 
-        # Get checksum length
-        checksum_len = self.__GetChecksumLen(mnemonic_bin_str)
-        # Get back entropy binary string
-        entropy_bin = mnemonic_bin_str[:-checksum_len]
+        # Make sure that the given mnemonic is valid
+        validator = Bip39MnemonicValidator(mnemonic, lang)
+        if not validator.Validate():
+            raise ValueError("Invalid mnemonic (%s)" % mnemonic)
 
-        # Get entropy bytes from binary string
-        return utils.BytesFromBinaryStr(entropy_bin, checksum_len * 8)
+        # Normalize and encode the mnemonic only once, since it's the same for any passphrase
+        self.m_mnemonic_bytes = validator.GetMnemonic().ToNormalizedBytes()
 
-    def __GetChecksum(self, mnemonic_bin_str):
-        """ Get checksum from mnemonic binary string.
+    def Generate(self, passphrase = ""):
+        """ Generate the seed using the specified passphrase.
 
         Args:
-            mnemonic_bin_str (str): Mnemonic binary string
+            passphrase (str, optional): Passphrase, empty if not specified
 
         Returns:
-           str: Checksum binary string
+            bytes: Generated seed
         """
 
-        return mnemonic_bin_str[-self.__GetChecksumLen(mnemonic_bin_str):]
+        # Compute key, the salt is NFKD-normalized at every call and never cached
+        key = utils.Pbkdf2HmacSha512(self.m_mnemonic_bytes, Bip39Utils.SeedSalt(passphrase), Bip39Const.SEED_PBKDF2_ROUNDS)
+
+        return key[:Bip39Const.SEED_LEN]
 
-    def __ComputeChecksum(self, mnemonic_bin_str):
-        """ Compute checksum from mnemonic binary string.
+    @staticmethod
+    def GenerateMany(mnemonics, passphrases = "", workers = 1, ordered = True):
+        """ Generate the seeds of many mnemonics using a pool of threads.
+        Since the PBKDF2 computation releases the GIL, seeds are actually generated in parallel.
+        Mnemonics are consumed lazily, keeping only a limited number of pending seeds for each worker.
 
         Args:
-            mnemonic_bin_str (str): Mnemonic binary string
+            mnemonics (iterable)                   : Mnemonics
+            passphrases (str or iterable, optional): Passphrase for all mnemonics or passphrases for each mnemonic, empty if not specified
+            workers (int, optional)                : Number of worker threads (default: 1)
+            ordered (bool, optional)               : True to yield seeds in the same order of mnemonics (default),
+                                                     false to yield them as completed
 
         Returns:
-           bytes: Computed checksum binary string
-        """
+            generator: Generator of seeds if ordered, generator of (mnemonic index, seed) tuples otherwise
 
-        # Get entropy bytes
-        entropy_bytes = self.__GetEntropyBytes(mnemonic_bin_str)
-        # Convert entropy hash to binary string
-        entropy_hash_bin = utils.BytesToBinaryStr(utils.Sha256(entropy_bytes), utils.Sha256DigestSize() * 8)
+        Raises:
+            ValueError: If the number of workers is not valid (if a mnemonic is not valid or the number of passphrases is
+                        different from the number of mnemonics, it's raised when the seed is reached)
+        """
+        if workers <= 0:
+            raise ValueError("Invalid number of workers (%d)" % workers)
 
-        # Compute checksum
-        checksum_bin = entropy_hash_bin[:self.__GetChecksumLen(mnemonic_bin_str)]
+        # Same passphrase for all mnemonics
+        if isinstance(passphrases, str):
+            items = zip(mnemonics, itertools.repeat(passphrases))
+        else:
+            items = Bip39SeedGenerator.__ZipPassphrases(mnemonics, passphrases)
 
-        return checksum_bin
+        return Bip39SeedGenerator.__GenerateMany(items, workers, ordered)
 
     @staticmethod
-    def __GetChecksumLen(mnemonic_bin_str):
-        """ Get checksum length from mnemonic binary string.
+    def __ZipPassphrases(mnemonics, passphrases):
+        """ Pair each mnemonic with its passphrase, checking that they are the same number.
 
         Args:
-            mnemonic_bin_str (str): Mnemonic binary string
+            mnemonics (iterable)  : Mnemonics
+            passphrases (iterable): Passphrases
 
         Returns:
-           int: Checksum length
-        """
-        return len(mnemonic_bin_str) // 33
-
+            generator: Generator of (mnemonic, passphrase) tuples
 
-class Bip39SeedGenerator:
-    """ BIP39 seed generator class. It generates the seed from a mnemonic in according to BIP39. """
+        Raises:
+            ValueError: If the number of passphrases is different from the number of mnemonics
+        """
+        missing = object()
+        for mnemonic, passphrase in itertools.zip_longest(mnemonics, passphrases, fillvalue = missing):
+            if mnemonic is missing or passphrase is missing:
+                raise ValueError("Number of passphrases is different from the number of mnemonics")
+            yield mnemonic, passphrase
 
-    def __init__(self, mnemonic):
-        """ Construct the class from a specified mnemonic.
+    @staticmethod
+    def __GenerateMany(items, workers, ordered):
+        """ Generate the seeds of many mnemonics using a pool of threads.
 
         Args:
-            mnemonic (str or list): Mnemonic
+            items (iterator): Iterator of (mnemonic, passphrase) tuples
+            workers (int)   : Number of worker threads
+            ordered (bool)  : True to yield seeds in the same order of mnemonics, false to yield them as completed
 
-        Raises:
-            ValueError: If the mnemonic is not valid
+        Returns:
+            generator: Generator of seeds if ordered, generator of (mnemonic index, seed) tuples otherwise
         """
+        max_pending = workers * Bip39Const.SEED_PENDING_NUM
+        items = enumerate(items)
 
-        # Make sure that the given mnemonic is valid
-        if not Bip39MnemonicValidator(mnemonic).Validate():
-            raise ValueError("Invalid mnemonic (%s)" % mnemonic)
+        # Deque for keeping the order, dict from futures to mnemonic indexes for getting the completed ones
+        pending = deque() if ordered else {}
 
-        self.m_mnemonic = mnemonic
+        executor = ThreadPoolExecutor(max_workers = workers)
+        try:
+            while True:
+                # Fill the pending seeds
+                for idx, (mnemonic, passphrase) in itertools.islice(items, max_pending - len(pending)):
+                    future = executor.submit(Bip39SeedGenerator.__GenerateSeed, mnemonic, passphrase)
+                    if ordered:
+                        pending.append(future)
+                    else:
+                        pending[future] = idx
+
+                if len(pending) == 0:
+                    break
+
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when = FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+        finally:
+            # Pending seeds are not needed anymore if the generator is closed before the end
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait = False)
 
-    def Generate(self, passphrase = ""):
-        """ Generate the seed using the specified passphrase.
+    @staticmethod
+    def __GenerateSeed(mnemonic, passphrase):
+        """ Generate the seed of a mnemonic.
 
         Args:
-            passphrase (str, optional): Passphrase, empty if not specified
+            mnemonic (str, list or Bip39Mnemonic object): Mnemonic
+            passphrase (str)                            : Passphrase
 
         Returns:
             bytes: Generated seed
         """
-
-        # Get salt
-        salt = Bip39Const.SEED_SALT_MOD + passphrase
-        # Compute key
-        key = utils.Pbkdf2HmacSha512(utils.StringEncode(self.m_mnemonic), utils.StringEncode(salt), Bip39Const.SEED_PBKDF2_ROUNDS)
-
-        return key[:Bip39Const.SEED_LEN]
+        return Bip39SeedGenerator(mnemonic).Generate(passphrase)
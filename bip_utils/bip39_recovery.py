@@ -0,0 +1,495 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import itertools
+from collections        import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from .bip39             import Bip39Languages, Bip39Const, Bip39Utils, MnemonicFileReader, Bip39Mnemonic, Bip39SeedGenerator
+from .bip32             import Bip32Const, Bip32
+from .bip44_base_ex     import Bip44CoinNotAllowedError
+from .bip44_base        import Bip44Changes
+
+
+class Bip39RecoveryConst:
+    """ Class container for BIP39 recovery constants. """
+
+    # Placeholder for unknown words
+    UNKNOWN_WORD     = "?"
+    # Default maximum edit distance of the candidates of a misspelled word
+    DEF_MAX_DISTANCE = 2
+    # Default number of possibilities checked by each work unit
+    DEF_CHUNK_LEN    = 16384
+    # Default number of passphrases checked by each work unit
+    DEF_BATCH_LEN    = 64
+    # Maximum number of pending work units for each worker
+    PENDING_NUM      = 2
+
+
+class Bip39RecoveryTarget:
+    """ BIP39 recovery target class. It confirms that a seed is the one being recovered, by comparing addresses or the
+    account extended public key computed with a BIP44/49/84 class, or the master key fingerprint.
+    """
+
+    def __init__(self, bip_class = None, coin_idx = None, acc_idx = 0, address = None, addr_num = 1, ex_key = None, fprint = None):
+        """ Construct class. FromAddress, FromExtendedKey or FromFingerPrint shall be used instead.
+
+        Args:
+            bip_class (class, optional)     : Bip44, Bip49 or Bip84 class
+            coin_idx (Bip44Coins, optional) : Coin index, must be a Bip44Coins enum
+            acc_idx (int, optional)         : Account index
+            address (str, optional)         : Target address
+            addr_num (int, optional)        : Number of external chain addresses compared with the target address
+            ex_key (str, optional)          : Target account extended public key
+            fprint (bytes, optional)        : Target master key fingerprint
+        """
+        self.m_bip_class = bip_class
+        self.m_coin_idx  = coin_idx
+        self.m_acc_idx   = acc_idx
+        self.m_address   = address
+        self.m_addr_num  = addr_num
+        self.m_ex_key    = ex_key
+        self.m_fprint    = fprint
+
+    @classmethod
+    def FromAddress(cls, bip_class, coin_idx, address, addr_num = 1, acc_idx = 0):
+        """ Create a target from an address of the external chain.
+
+        Args:
+            bip_class (class)       : Bip44, Bip49 or Bip84 class
+            coin_idx (Bip44Coins)   : Coin index, must be a Bip44Coins enum
+            address (str)           : Target address
+            addr_num (int, optional): Number of first addresses compared with the target one (default: 1)
+            acc_idx (int, optional) : Account index (default: 0)
+
+        Returns:
+            Bip39RecoveryTarget object: Bip39RecoveryTarget object
+
+        Raises:
+            ValueError: If the number of addresses is not valid
+            Bip44CoinNotAllowedError: If the coin is not allowed for the class
+        """
+        if addr_num <= 0:
+            raise ValueError("Invalid number of addresses (%d)" % addr_num)
+        if not bip_class.IsCoinAllowed(coin_idx):
+            raise Bip44CoinNotAllowedError("Coin %s cannot derive from %s specification" % (coin_idx, bip_class.SpecName()))
+
+        return cls(bip_class, coin_idx, acc_idx, address = address, addr_num = addr_num)
+
+    @classmethod
+    def FromExtendedKey(cls, bip_class, coin_idx, ex_key, acc_idx = 0):
+        """ Create a target from an account extended public key.
+
+        Args:
+            bip_class (class)      : Bip44, Bip49 or Bip84 class
+            coin_idx (Bip44Coins)  : Coin index, must be a Bip44Coins enum
+            ex_key (str)           : Target account extended public key
+            acc_idx (int, optional): Account index (default: 0)
+
+        Returns:
+            Bip39RecoveryTarget object: Bip39RecoveryTarget object
+
+        Raises:
+            Bip44CoinNotAllowedError: If the coin is not allowed for the class
+        """
+        if not bip_class.IsCoinAllowed(coin_idx):
+            raise Bip44CoinNotAllowedError("Coin %s cannot derive from %s specification" % (coin_idx, bip_class.SpecName()))
+
+        return cls(bip_class, coin_idx, acc_idx, ex_key = ex_key)
+
+    @classmethod
+    def FromFingerPrint(cls, fprint):
+        """ Create a target from a master key fingerprint.
+        It's the cheapest target to check, but a fingerprint is short and a match could be a false positive.
+
+        Args:
+            fprint (bytes): Target master key fingerprint
+
+        Returns:
+            Bip39RecoveryTarget object: Bip39RecoveryTarget object
+
+        Raises:
+            ValueError: If the fingerprint length is not valid
+        """
+        if len(fprint) != Bip32Const.FINGERPRINT_BYTE_LEN:
+            raise ValueError("Invalid fingerprint length (%d)" % len(fprint))
+
+        return cls(fprint = fprint)
+
+    def Matches(self, seed_bytes):
+        """ Get if the specified seed matches the target.
+
+        Args:
+            seed_bytes (bytes): Seed bytes
+
+        Returns:
+            bool: True if matching, false otherwise
+        """
+        if self.m_fprint is not None:
+            return Bip32.FromSeed(seed_bytes).FingerPrint() == self.m_fprint
+
+        bip_obj = self.m_bip_class.FromSeed(seed_bytes, self.m_coin_idx).Purpose().Coin().Account(self.m_acc_idx)
+        if self.m_ex_key is not None:
+            return bip_obj.PublicKey().ToExtended() == self.m_ex_key
+
+        return self.m_address in bip_obj.Change(Bip44Changes.CHAIN_EXT).AddressRange(0, self.m_addr_num)
+
+
+class Bip39Recovery:
+    """ BIP39 recovery class. It enumerates the possible mnemonics of a damaged one, with unknown or misspelled words.
+    Possibilities are filtered by the mnemonic checksum, which is cheap, before computing the seed and comparing it with
+    the target. The enumeration can be split between more worker processes and resumed from a checkpoint.
+    """
+
+    def __init__(self, mnemonic, target = None, passphrase = "", candidates = None, max_distance = Bip39RecoveryConst.DEF_MAX_DISTANCE,
+                 lang = Bip39Languages.ENGLISH):
+        """ Construct class.
+        Unknown words shall be replaced by Bip39RecoveryConst.UNKNOWN_WORD and can be any word of the list.
+        The candidates of a misspelled word (i.e. not in the words list) are the words within the maximum edit distance
+        or, if there is none, any word of the list.
+
+        Args:
+            mnemonic (str or list)                       : Damaged mnemonic
+            target (Bip39RecoveryTarget object, optional): Target for confirming the seed, if not specified all the
+                                                           mnemonics with a valid checksum are found
+            passphrase (str, optional)                   : Passphrase, empty if not specified
+            candidates (dict, optional)                  : Candidate words indexed by word position (starting from 0),
+                                                           they take precedence over the words of the mnemonic
+            max_distance (int, optional)                 : Maximum edit distance of the candidates of a misspelled word
+            lang (Bip39Languages, optional)              : Language (default: English)
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If the words number, a position or a candidate word is not valid
+        """
+        if isinstance(mnemonic, str):
+            mnemonic = Bip39Utils.Normalize(mnemonic).split(" ")
+        candidates = candidates or {}
+
+        words_num = len(mnemonic)
+        if words_num not in Bip39Const.MNEMONIC_WORD_LEN:
+            raise ValueError("Number of words (%d) is not valid" % words_num)
+        for pos in candidates:
+            if pos < 0 or pos >= words_num:
+                raise ValueError("Position of candidate words (%d) is not valid" % pos)
+
+        mnemonic_reader = MnemonicFileReader(lang)
+
+        # Known words are fixed in the mnemonic integer, the other positions are enumerated
+        self.m_mnemonic_int = 0
+        self.m_positions = []
+        for pos, word in enumerate(mnemonic):
+            shift = (words_num - pos - 1) * Bip39Const.WORD_BITS
+
+            if pos in candidates:
+                words_idx = [mnemonic_reader.GetWordIdx(cand_word) for cand_word in candidates[pos]]
+            elif word == Bip39RecoveryConst.UNKNOWN_WORD:
+                words_idx = range(Bip39Const.WORDS_LIST_NUM)
+            else:
+                try:
+                    self.m_mnemonic_int |= mnemonic_reader.GetWordIdx(word) << shift
+                    continue
+                except ValueError:
+                    words_idx = self.__SimilarWords(mnemonic_reader, Bip39Utils.Normalize(word), max_distance)
+
+            # Remove duplicates keeping the order
+            words_idx = list(dict.fromkeys(words_idx))
+            if len(words_idx) == 0:
+                raise ValueError("No candidate words for position %d" % pos)
+            self.m_positions.append([word_idx << shift for word_idx in words_idx])
+
+        # The last position is the least significant digit of the possibility index
+        self.m_positions.reverse()
+
+        self.m_words_num   = words_num
+        self.m_entropy_len = words_num * Bip39Const.WORD_BITS * 32 // 33
+        self.m_target      = target
+        self.m_passphrase  = passphrase
+        self.m_lang        = lang
+
+    def Total(self):
+        """ Get the total number of possibilities.
+
+        Returns:
+            int: Total number of possibilities
+        """
+        total = 1
+        for words_shift in self.m_positions:
+            total *= len(words_shift)
+        return total
+
+    def Search(self, workers = 1, start = 0, chunk_len = Bip39RecoveryConst.DEF_CHUNK_LEN, progress = None):
+        """ Search the mnemonics matching the target.
+        Possibilities are checked in chunks, which are split between the worker processes. Found mnemonics are yielded
+        in order of chunk and, after each chunk, the progress function is called with the number of checked possibilities.
+        It's also a checkpoint: passing it as start, the search is resumed without yielding again the same mnemonics.
+
+        Args:
+            workers (int, optional)      : Number of worker processes (default: 1, i.e. no worker processes)
+            start (int, optional)        : Index of the first possibility (default: 0)
+            chunk_len (int, optional)    : Number of possibilities of each chunk
+            progress (function, optional): Function that takes the number of checked and total possibilities
+
+        Returns:
+            generator: Generator of found mnemonics
+
+        Raises:
+            ValueError: If the number of workers, the start index or the chunk length is not valid
+        """
+        total = self.Total()
+        if workers <= 0:
+            raise ValueError("Invalid number of workers (%d)" % workers)
+        if start < 0 or start > total:
+            raise ValueError("Invalid start index (%d)" % start)
+        if chunk_len <= 0:
+            raise ValueError("Invalid chunk length (%d)" % chunk_len)
+
+        chunks = [(chunk_start, min(chunk_start + chunk_len, total)) for chunk_start in range(start, total, chunk_len)]
+        if workers == 1:
+            return self.__Search(chunks, total, progress)
+        return self.__SearchParallel(chunks, total, workers, progress)
+
+    #
+    # Protected methods
+    #
+
+    def _SearchRange(self, start, stop):
+        """ Search the mnemonics matching the target in the specified range of possibilities.
+        It's called by the worker processes of Search.
+
+        Args:
+            start (int): First possibility index (included)
+            stop (int) : Last possibility index (excluded)
+
+        Returns:
+            list: Found mnemonics
+        """
+        checksum_len = self.m_words_num * Bip39Const.WORD_BITS - self.m_entropy_len
+        checksum_mask = (1 << checksum_len) - 1
+        entropy_byte_len = self.m_entropy_len // 8
+
+        found = []
+        for poss_idx in range(start, stop):
+            # Compose the mnemonic integer from the possibility index, as a mixed radix number
+            mnemonic_int = self.m_mnemonic_int
+            for words_shift in self.m_positions:
+                poss_idx, word_pos = divmod(poss_idx, len(words_shift))
+                mnemonic_int |= words_shift[word_pos]
+
+            # Filter by checksum before computing the seed
+            entropy_bytes = (mnemonic_int >> checksum_len).to_bytes(entropy_byte_len, "big")
+            if Bip39Utils.ComputeChecksum(entropy_bytes) != mnemonic_int & checksum_mask:
+                continue
+
+            # The checksum is valid, so the seed generator doesn't need to validate the mnemonic again
+            mnemonic = Bip39Mnemonic.FromEntropy(entropy_bytes, self.m_lang)
+            if self.m_target is None or self.m_target.Matches(Bip39SeedGenerator(mnemonic).Generate(self.m_passphrase)):
+                found.append(mnemonic.ToStr())
+
+        return found
+
+    #
+    # Private methods
+    #
+
+    def __Search(self, chunks, total, progress):
+        """ Search the mnemonics matching the target in the current process.
+
+        Args:
+            chunks (list)      : Chunks, as a list of (start, stop) tuples
+            total (int)        : Total number of possibilities
+            progress (function): Progress function, None if not specified
+
+        Returns:
+            generator: Generator of found mnemonics
+        """
+        for start, stop in chunks:
+            yield from self._SearchRange(start, stop)
+            if progress is not None:
+                progress(stop, total)
+
+    def __SearchParallel(self, chunks, total, workers, progress):
+        """ Search the mnemonics matching the target using worker processes.
+
+        Args:
+            chunks (list)      : Chunks, as a list of (start, stop) tuples
+            total (int)        : Total number of possibilities
+            workers (int)      : Number of worker processes
+            progress (function): Progress function, None if not specified
+
+        Returns:
+            generator: Generator of found mnemonics
+        """
+        chunks = iter(chunks)
+        pending = deque()
+
+        executor = ProcessPoolExecutor(max_workers = workers)
+        try:
+            while True:
+                # Keep a limited number of pending chunks, results are collected in order
+                while len(pending) < workers * Bip39RecoveryConst.PENDING_NUM:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.append((chunk[1], executor.submit(self._SearchRange, *chunk)))
+
+                if len(pending) == 0:
+                    break
+
+                stop, future = pending.popleft()
+                yield from future.result()
+                if progress is not None:
+                    progress(stop, total)
+        finally:
+            # Pending chunks are not needed anymore if the generator is closed before the end
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait = False)
+
+    @staticmethod
+    def __SimilarWords(mnemonic_reader, word, max_distance):
+        """ Get the indexes of the words similar to the specified one, sorted by edit distance.
+        If there is no word within the maximum distance, all the words are returned.
+
+        Args:
+            mnemonic_reader (MnemonicFileReader object): MnemonicFileReader object
+            word (str)                                 : Word
+            max_distance (int)                         : Maximum edit distance
+
+        Returns:
+            list: Words indexes
+        """
+        words_dist = []
+        for word_idx in range(Bip39Const.WORDS_LIST_NUM):
+            dist = Bip39Recovery.__EditDistance(word, mnemonic_reader.GetWordAtIdx(word_idx))
+            if dist <= max_distance:
+                words_dist.append((dist, word_idx))
+
+        return [word_idx for _, word_idx in sorted(words_dist)] if len(words_dist) > 0 else list(range(Bip39Const.WORDS_LIST_NUM))
+
+    @staticmethod
+    def __EditDistance(str_1, str_2):
+        """ Compute the edit (i.e. Levenshtein) distance between two strings.
+
+        Args:
+            str_1 (str): First string
+            str_2 (str): Second string
+
+        Returns:
+            int: Edit distance
+        """
+        prev_row = list(range(len(str_2) + 1))
+        for i, char_1 in enumerate(str_1, 1):
+            curr_row = [i]
+            for j, char_2 in enumerate(str_2, 1):
+                curr_row.append(min(prev_row[j] + 1, curr_row[j - 1] + 1, prev_row[j - 1] + (char_1 != char_2)))
+            prev_row = curr_row
+        return prev_row[-1]
+
+
+class Bip39PassphraseRecovery:
+    """ BIP39 passphrase recovery class. It searches the passphrase of a known mnemonic among some candidates, stopping
+    at the first one matching the target. The mnemonic is validated and encoded only once, so each candidate only
+    requires the seed computation and the target check.
+    """
+
+    def __init__(self, mnemonic, target):
+        """ Construct class.
+
+        Args:
+            mnemonic (str or list)             : Mnemonic
+            target (Bip39RecoveryTarget object): Target for confirming the seed
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        self.m_seed_gen = Bip39SeedGenerator(mnemonic)
+        self.m_target   = target
+
+    def Search(self, passphrases, workers = 1, batch_len = Bip39RecoveryConst.DEF_BATCH_LEN):
+        """ Search the passphrase matching the target.
+        Passphrases are consumed lazily (e.g. they can be streamed from a file) and, with more workers, they are split in
+        batches between the worker processes, keeping only a limited number of pending batches.
+
+        Args:
+            passphrases (iterable)   : Candidate passphrases
+            workers (int, optional)  : Number of worker processes (default: 1, i.e. no worker processes)
+            batch_len (int, optional): Number of passphrases of each batch
+
+        Returns:
+            str: Found passphrase, None if not found
+
+        Raises:
+            ValueError: If the number of workers or the batch length is not valid
+        """
+        if workers <= 0:
+            raise ValueError("Invalid number of workers (%d)" % workers)
+        if batch_len <= 0:
+            raise ValueError("Invalid batch length (%d)" % batch_len)
+
+        passphrases = iter(passphrases)
+        if workers == 1:
+            return self._SearchBatch(passphrases)
+
+        pending = set()
+
+        executor = ProcessPoolExecutor(max_workers = workers)
+        try:
+            while True:
+                while len(pending) < workers * Bip39RecoveryConst.PENDING_NUM:
+                    batch = list(itertools.islice(passphrases, batch_len))
+                    if len(batch) == 0:
+                        break
+                    pending.add(executor.submit(self._SearchBatch, batch))
+
+                if len(pending) == 0:
+                    return None
+
+                # Stop as soon as any batch finds the passphrase
+                done, pending = wait(pending, return_when = FIRST_COMPLETED)
+                for future in done:
+                    passphrase = future.result()
+                    if passphrase is not None:
+                        return passphrase
+        finally:
+            # Pending batches are not needed anymore
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait = False)
+
+    #
+    # Protected methods
+    #
+
+    def _SearchBatch(self, passphrases):
+        """ Search the passphrase matching the target in the specified ones.
+        It's called by the worker processes of Search.
+
+        Args:
+            passphrases (iterable): Candidate passphrases
+
+        Returns:
+            str: Found passphrase, None if not found
+        """
+        for passphrase in passphrases:
+            if self.m_target.Matches(self.m_seed_gen.Generate(passphrase)):
+                return passphrase
+        return None
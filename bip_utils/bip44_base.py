@@ -20,12 +20,13 @@
 
 
 # Imports
-from abc            import ABC, abstractmethod
-from enum           import IntEnum, unique
-from .bip32_utils   import Bip32Utils
-from .bip32         import Bip32
-from .bip_keys      import BipPrivateKey, BipPublicKey
-from .bip44_base_ex import Bip44DepthError, Bip44CoinNotAllowedError
+from abc                import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from enum               import IntEnum, unique
+from .bip32_utils       import Bip32Utils, Bip32UtilsConst
+from .bip32             import Bip32
+from .bip_keys          import BipPrivateKey, BipPublicKey
+from .bip44_base_ex     import Bip44DepthError, Bip44CoinNotAllowedError
 
 
 @unique
@@ -69,7 +70,13 @@ class Bip44BaseConst:
     """ Class container for BIP44 base constants. """
 
     # Test net coin index
-    TEST_NET_COIN_IDX   = 1
+    TEST_NET_COIN_IDX         = 1
+    # Minimum number of addresses computed by each worker process of AddressRange
+    ADDR_RANGE_MIN_SHARD_LEN  = 256
+    # Default gap limit for addresses scanning (number of consecutive unused addresses)
+    DEF_SCAN_GAP_LIMIT        = 20
+    # Default number of addresses derived ahead for addresses scanning
+    DEF_SCAN_BATCH_LEN        = 20
 
 
 class Bip44Base(ABC):
@@ -156,6 +163,27 @@ class Bip44Base(ABC):
         self.m_coin_idx   = coin_idx
         self.m_coin_class = self._GetCoinClass(coin_idx)
 
+    def __getstate__(self):
+        """ Get the object state for pickling.
+        Only the Bip32 object and the coin index value are stored, the coin class is got again when unpickling.
+
+        Returns:
+            tuple: Object state
+        """
+        return (self.m_bip32, int(self.m_coin_idx))
+
+    def __setstate__(self, state):
+        """ Set the object state when unpickling.
+
+        Args:
+            state (tuple): Object state
+        """
+        bip32_obj, coin_idx = state
+
+        self.m_bip32      = bip32_obj
+        self.m_coin_idx   = Bip44Coins(coin_idx)
+        self.m_coin_class = self._GetCoinClass(self.m_coin_idx)
+
     def PublicKey(self):
         """ Return the public key.
 
@@ -209,10 +237,240 @@ class Bip44Base(ABC):
 
         return self.m_bip32.Depth() == level_idx
 
+    def AddressRange(self, start, stop, workers = 1, payloads = False):
+        """ Compute the addresses of the specified range of indexes from the current change level.
+        The range can be split between more worker processes, each receiving only the public extended key of the
+        change level. If the range is too small to be worth it, addresses are computed in the current process.
+
+        Args:
+            start (int)              : First address index (included)
+            stop (int)               : Last address index (excluded)
+            workers (int, optional)  : Maximum number of worker processes (default: 1, i.e. no worker processes)
+            payloads (bool, optional): True to get the address payloads (see BipPublicKey.ToAddressPayload) instead of
+                                       the addresses (default: false)
+
+        Returns:
+            list: Addresses (or address payloads) in the same order of indexes
+
+        Raises:
+            ValueError: If the range of indexes or the number of workers is not valid
+            Bip44DepthError: If the current depth is not suitable for deriving addresses
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if not self.IsLevel(Bip44Levels.CHANGE):
+            raise Bip44DepthError("Current depth (%d) is not suitable for deriving addresses" % self.m_bip32.Depth())
+        if start < 0 or stop < start or stop > Bip32UtilsConst.HARDENED_IDX:
+            raise ValueError("Invalid range of address indexes (%d, %d)" % (start, stop))
+        if workers <= 0:
+            raise ValueError("Invalid number of workers (%d)" % workers)
+
+        shards_num = min(workers, (stop - start) // Bip44BaseConst.ADDR_RANGE_MIN_SHARD_LEN)
+        if shards_num <= 1:
+            return self._AddressRange(start, stop, payloads)
+
+        # Split the range in contiguous shards, results are collected in the same order
+        bounds = [start + (stop - start) * i // shards_num for i in range(shards_num + 1)]
+        ex_key = self.PublicKey().ToExtended()
+
+        with ProcessPoolExecutor(max_workers = shards_num) as executor:
+            shards = executor.map(self.__class__._AddressRangeFromExtendedKey,
+                                  [ex_key] * shards_num,
+                                  [self.m_bip32.KeyNetVersions()] * shards_num,
+                                  [self.m_coin_idx] * shards_num,
+                                  bounds[:-1],
+                                  bounds[1:],
+                                  [payloads] * shards_num)
+            return [addr for shard in shards for addr in shard]
+
+    def ScanAddresses(self, is_used, gap_limit = Bip44BaseConst.DEF_SCAN_GAP_LIMIT, batch_len = Bip44BaseConst.DEF_SCAN_BATCH_LEN):
+        """ Scan the external and internal chains of the current account for used addresses.
+        Each chain is scanned until the specified number of consecutive unused addresses is found (gap limit).
+        Addresses are derived in batches and the next batch is derived in a separate thread while checking the current one,
+        so derivation overlaps with slow checks (e.g. queries to a server).
+
+        Args:
+            is_used (function)       : Function that takes an address and returns true if it's used, false otherwise
+            gap_limit (int, optional): Number of consecutive unused addresses that stops the scanning of a chain (default: 20)
+            batch_len (int, optional): Number of addresses derived in each batch (default: 20)
+
+        Returns:
+            dict: Used addresses for each chain, as a list of (address index, address) tuples, indexed by Bip44Changes enum
+
+        Raises:
+            ValueError: If the gap limit or the batch length is not valid
+            Bip44DepthError: If the current depth is not suitable for scanning addresses
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if not self.IsLevel(Bip44Levels.ACCOUNT):
+            raise Bip44DepthError("Current depth (%d) is not suitable for scanning addresses" % self.m_bip32.Depth())
+        if gap_limit <= 0:
+            raise ValueError("Invalid gap limit (%d)" % gap_limit)
+        if batch_len <= 0:
+            raise ValueError("Invalid batch length (%d)" % batch_len)
+
+        return {change_idx: self.Change(change_idx)._ScanChange(is_used, gap_limit, batch_len) for change_idx in Bip44Changes}
+
+    def DiscoverAccounts(self, is_used, gap_limit = Bip44BaseConst.DEF_SCAN_GAP_LIMIT, workers = 1):
+        """ Discover the used accounts of the current coin, in according to the BIP44 account discovery algorithm.
+        Accounts are scanned in order and the discovery stops at the first account without used addresses in the external chain.
+        More accounts can be scanned concurrently by worker threads, in this case some accounts after the first empty one
+        may be scanned but they are not returned.
+
+        Args:
+            is_used (function)       : Function that takes an address and returns true if it's used, false otherwise
+            gap_limit (int, optional): Number of consecutive unused addresses that stops the scanning of a chain (default: 20)
+            workers (int, optional)  : Number of accounts scanned concurrently (default: 1)
+
+        Returns:
+            list: Used accounts, as a list of (account index, used addresses) tuples, where used addresses are returned
+                  by ScanAddresses
+
+        Raises:
+            ValueError: If the gap limit or the number of workers is not valid
+            Bip44DepthError: If the current depth is not suitable for discovering accounts
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if not self.IsLevel(Bip44Levels.COIN):
+            raise Bip44DepthError("Current depth (%d) is not suitable for discovering accounts" % self.m_bip32.Depth())
+        if workers <= 0:
+            raise ValueError("Invalid number of workers (%d)" % workers)
+
+        accounts = []
+
+        with ThreadPoolExecutor(max_workers = workers) as executor:
+            acc_idx = 0
+            while True:
+                # Scan the next accounts concurrently, results are got in order
+                acc_idxs = range(acc_idx, acc_idx + workers)
+                for acc_idx, used_addrs in zip(acc_idxs, executor.map(self._ScanAccount, acc_idxs, [is_used] * workers, [gap_limit] * workers)):
+                    if len(used_addrs[Bip44Changes.CHAIN_EXT]) == 0:
+                        return accounts
+                    accounts.append((acc_idx, used_addrs))
+                acc_idx += 1
+
+    @classmethod
+    def DiscoverCoins(cls, seed_bytes, coin_idxs, is_used, gap_limit = Bip44BaseConst.DEF_SCAN_GAP_LIMIT, workers = 1):
+        """ Discover the used accounts of the specified coins from a seed, by calling DiscoverAccounts for each coin.
+        Coins are discovered concurrently, each one by a separate thread.
+
+        Args:
+            seed_bytes (bytes)       : Seed bytes
+            coin_idxs (list)         : Coin indexes, each one must be a Bip44Coins enum
+            is_used (function)       : Function that takes an address and returns true if it's used, false otherwise
+            gap_limit (int, optional): Number of consecutive unused addresses that stops the scanning of a chain (default: 20)
+            workers (int, optional)  : Number of accounts of each coin scanned concurrently (default: 1)
+
+        Returns:
+            dict: Used accounts returned by DiscoverAccounts, indexed by Bip44Coins enum
+
+        Raises:
+            TypeError: If coin index is not a Bip44Coins enum
+            ValueError: If the seed is too short or the gap limit or the number of workers is not valid
+            Bip44CoinNotAllowedError: If a coin is not allowed to derive from the BIP specification
+            Bip32KeyError: If the seed is not suitable for master key generation or the derivation results in an invalid key
+        """
+        coin_objs = [cls.FromSeed(seed_bytes, coin_idx).Purpose().Coin() for coin_idx in coin_idxs]
+        if len(coin_objs) == 0:
+            return {}
+
+        with ThreadPoolExecutor(max_workers = len(coin_objs)) as executor:
+            futures = [executor.submit(coin_obj.DiscoverAccounts, is_used, gap_limit, workers) for coin_obj in coin_objs]
+            return {coin_idx: future.result() for coin_idx, future in zip(coin_idxs, futures)}
+
+    #
+    # Protected methods (used internally by the library)
+    #
+
+    def _ScanAccount(self, acc_idx, is_used, gap_limit):
+        """ Scan the specified account of the current coin for used addresses.
+
+        Args:
+            acc_idx (int)     : Account index
+            is_used (function): Function that takes an address and returns true if it's used, false otherwise
+            gap_limit (int)   : Number of consecutive unused addresses that stops the scanning of a chain
+
+        Returns:
+            dict: Used addresses returned by ScanAddresses
+        """
+        return self.Account(acc_idx).ScanAddresses(is_used, gap_limit)
+
+    def _ScanChange(self, is_used, gap_limit, batch_len):
+        """ Scan the current change level for used addresses until the gap limit is reached.
+
+        Args:
+            is_used (function): Function that takes an address and returns true if it's used, false otherwise
+            gap_limit (int)   : Number of consecutive unused addresses that stops the scanning
+            batch_len (int)   : Number of addresses derived in each batch
+
+        Returns:
+            list: Used addresses, as a list of (address index, address) tuples
+        """
+        used_addrs = []
+        unused_num = 0
+
+        executor = ThreadPoolExecutor(max_workers = 1)
+        try:
+            start = 0
+            next_batch = executor.submit(self._AddressRange, start, min(batch_len, Bip32UtilsConst.HARDENED_IDX))
+
+            while start < Bip32UtilsConst.HARDENED_IDX:
+                addresses = next_batch.result()
+                # Derive the next batch while checking the current one
+                next_start = start + len(addresses)
+                next_batch = executor.submit(self._AddressRange, next_start, min(next_start + batch_len, Bip32UtilsConst.HARDENED_IDX))
+
+                for i, addr in enumerate(addresses):
+                    if is_used(addr):
+                        used_addrs.append((start + i, addr))
+                        unused_num = 0
+                    else:
+                        unused_num += 1
+                        if unused_num == gap_limit:
+                            return used_addrs
+
+                start = next_start
+        finally:
+            # Don't wait for the batch derived ahead, it's not needed anymore
+            executor.shutdown(wait = False)
+
+        return used_addrs
+
+    def _AddressRange(self, start, stop, payloads = False):
+        """ Compute the addresses of the specified range of indexes from the current change level in the current process.
+
+        Args:
+            start (int)              : First address index (included)
+            stop (int)               : Last address index (excluded)
+            payloads (bool, optional): True to get the address payloads instead of the addresses (default: false)
+
+        Returns:
+            list: Addresses (or address payloads) in the same order of indexes
+        """
+        pub_keys = [BipPublicKey(bip32_obj, self.m_coin_class) for bip32_obj in self.m_bip32.ChildKeys(range(start, stop))]
+        return [pub_key.ToAddressPayload() for pub_key in pub_keys] if payloads else [pub_key.ToAddress() for pub_key in pub_keys]
+
     #
     # Class methods ("protected", in the sense that they are called only internally)
     #
 
+    @classmethod
+    def _AddressRangeFromExtendedKey(cls, ex_key, key_net_ver, coin_idx, start, stop, payloads):
+        """ Compute the addresses of the specified range of indexes from a change level extended key.
+        It's called by the worker processes of AddressRange.
+
+        Args:
+            ex_key (str)                       : Change level extended key
+            key_net_ver (KeyNetVersions object): Key net version object
+            coin_idx (Bip44Coins)              : Coin index, must be a Bip44Coins enum
+            start (int)                        : First address index (included)
+            stop (int)                         : Last address index (excluded)
+            payloads (bool)                    : True to get the address payloads instead of the addresses
+
+        Returns:
+            list: Addresses (or address payloads) in the same order of indexes
+        """
+        return cls(Bip32.FromExtendedKey(ex_key, key_net_ver), coin_idx)._AddressRange(start, stop, payloads)
+
     @classmethod
     def _PurposeGeneric(cls, bip_obj):
         """ Derive a child key from the purpose and return a new Bip object (e.g. BIP44, BIP49, BIP84).
@@ -112,3 +112,18 @@ class BipCoinBase:
             return self.m_addr_fct.ToAddress(pub_key.RawCompressed().ToBytes())
         else:
             raise RuntimeError("Invalid address class")
+
+    def ComputeAddressPayload(self, pub_key):
+        """ Compute address payload from public key, i.e. the 20-byte hash encoded in the address.
+
+        Args:
+            pub_key (BipPublicKey object): BipPublicKey object
+
+        Returns:
+            bytes: Address payload (20-byte)
+        """
+
+        # Ethereum is the only one using the uncompressed key
+        if self.m_addr_fct is EthAddr:
+            return self.m_addr_fct.ToPayload(pub_key.RawUncompressed().ToBytes())
+        return self.m_addr_fct.ToPayload(pub_key.RawCompressed().ToBytes())
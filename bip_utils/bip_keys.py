@@ -74,7 +74,7 @@ class BipPublicKey:
         Returns:
             BipKeyBytes object: BipKeyBytes object
         """
-        return BipKeyBytes(self.m_bip32_obj.EcdsaPublicKey().to_string("compressed"))
+        return BipKeyBytes(self.m_bip32_obj._CompressedPublicKey())
 
     def RawUncompressed(self):
         """ Return raw uncompressed public key.
@@ -82,9 +82,7 @@ class BipPublicKey:
         Returns:
             BipKeyBytes object: BipKeyBytes object
         """
-
-        # The first byte is the version (0x04) and it's not needed
-        return BipKeyBytes(self.m_bip32_obj.EcdsaPublicKey().to_string("uncompressed")[1:])
+        return BipKeyBytes(self.m_bip32_obj._UncompressedPublicKey())
 
     def ToExtended(self):
         """ Return key in serialized extended format.
@@ -102,6 +100,14 @@ class BipPublicKey:
         """
         return self.m_coin_class.ComputeAddress(self)
 
+    def ToAddressPayload(self):
+        """ Return address payload correspondent to the public key, i.e. the 20-byte hash encoded in the address.
+
+        Returns:
+            bytes: Address payload
+        """
+        return self.m_coin_class.ComputeAddressPayload(self)
+
 
 class BipPrivateKey:
     """ BIP privte key class. It allows to get a privte key in different formats. """
@@ -128,7 +134,7 @@ class BipPrivateKey:
         Returns:
             BipKeyBytes object: BipKeyBytes object
         """
-        return BipKeyBytes(self.m_bip32_obj.EcdsaPrivateKey().to_string())
+        return BipKeyBytes(self.m_bip32_obj._PrivateKeyBytes())
 
     def ToExtended(self):
         """ Return key in serialized extended format.
@@ -22,15 +22,16 @@
 # Imports
 import sha3
 from .key_helper import KeyHelper
+from .           import utils
 
 
 class EthAddrConst:
     """ Class container for Ethereum address constants. """
 
     # Prefix
-    PREFIX     = "0x"
-    # Start byte
-    START_BYTE = 24
+    PREFIX           = "0x"
+    # Payload length in bytes
+    PAYLOAD_BYTE_LEN = 20
 
 
 class EthAddrUtils:
@@ -58,14 +59,14 @@ class EthAddr:
     """ Ethereum address class. It allows the Ethereum address generation. """
 
     @staticmethod
-    def ToAddress(pub_key_bytes):
-        """ Get address in Ethereum format.
+    def ToPayload(pub_key_bytes):
+        """ Get address payload in Ethereum format, i.e. the last 20 bytes of the public key Keccak-256 hash.
 
         Args:
             pub_key_bytes (bytes): Public key bytes
 
         Returns:
-            str: Address string
+            bytes: Address payload (20-byte)
 
         Raised:
             ValueError: If the key is not a public uncompressed key
@@ -73,5 +74,20 @@ class EthAddr:
         if not KeyHelper.IsPublicUncompressed(pub_key_bytes):
             raise ValueError("Public uncompressed key is required for Ethereum address")
 
-        addr = sha3.keccak_256(pub_key_bytes).hexdigest()[EthAddrConst.START_BYTE:]
+        return sha3.keccak_256(pub_key_bytes).digest()[-EthAddrConst.PAYLOAD_BYTE_LEN:]
+
+    @staticmethod
+    def ToAddress(pub_key_bytes):
+        """ Get address in Ethereum format.
+
+        Args:
+            pub_key_bytes (bytes): Public key bytes
+
+        Returns:
+            str: Address string
+
+        Raised:
+            ValueError: If the key is not a public uncompressed key
+        """
+        addr = utils.BytesToHexString(EthAddr.ToPayload(pub_key_bytes))
         return EthAddrConst.PREFIX + EthAddrUtils.ChecksumEncode(addr)
@@ -0,0 +1,484 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import threading
+from ecdsa.ecdsa         import generator_secp256k1
+from ecdsa.numbertheory  import inverse_mod
+from .                   import utils
+
+
+class Secp256k1Const:
+    """ Class container for secp256k1 constants. """
+
+    # Field prime
+    P  = generator_secp256k1.curve().p()
+    # Curve order
+    N  = generator_secp256k1.order()
+    # Generator point in affine coordinates
+    GX = generator_secp256k1.x()
+    GY = generator_secp256k1.y()
+
+    # Bits of each window of the fixed-base table
+    FIXED_BASE_WINDOW_BITS = 8
+    # Number of windows of the fixed-base table
+    FIXED_BASE_WINDOW_NUM  = 256 // FIXED_BASE_WINDOW_BITS
+    # Byte length of a coordinate
+    COORD_BYTE_LEN         = 32
+
+
+class Secp256k1:
+    """ Secp256k1 class. It implements the curve point arithmetic needed for keys derivation.
+    Points are represented as tuples of integers, (x, y) for affine coordinates and (X, Y, Z) for Jacobian ones.
+    The point at infinity is None in affine coordinates and it has Z equal to zero in Jacobian ones.
+    """
+
+    @staticmethod
+    def JacobianFromAffine(point):
+        """ Convert a point from affine to Jacobian coordinates.
+
+        Args:
+            point (tuple): Point in affine coordinates
+
+        Returns:
+            tuple: Point in Jacobian coordinates
+        """
+        return (point[0], point[1], 1) if point is not None else (0, 1, 0)
+
+    @staticmethod
+    def JacobianToAffine(point):
+        """ Convert a point from Jacobian to affine coordinates.
+
+        Args:
+            point (tuple): Point in Jacobian coordinates
+
+        Returns:
+            tuple: Point in affine coordinates (None if it's the point at infinity)
+        """
+        p = Secp256k1Const.P
+        x, y, z = point
+
+        if z == 0:
+            return None
+
+        z_inv = inverse_mod(z, p)
+        z_inv_2 = z_inv * z_inv % p
+        return (x * z_inv_2 % p, y * z_inv_2 * z_inv % p)
+
+    @staticmethod
+    def JacobianToAffineBatch(points):
+        """ Convert a list of points from Jacobian to affine coordinates.
+        A single modular inversion is performed for all of them (Montgomery's trick), which is worth it when building the
+        fixed-base table.
+
+        Args:
+            points (list): Points in Jacobian coordinates
+
+        Returns:
+            list: Points in affine coordinates (None for the points at infinity)
+        """
+        p = Secp256k1Const.P
+
+        # Compute the cumulative products of the Z coordinates, skipping the points at infinity
+        z_prods = []
+        z_prod = 1
+        for _, _, z in points:
+            if z != 0:
+                z_prod = z_prod * z % p
+            z_prods.append(z_prod)
+
+        # Invert the total product, then get each inverse from it by going backward
+        z_prod_inv = inverse_mod(z_prod, p)
+        affine_points = [None] * len(points)
+
+        for i in range(len(points) - 1, -1, -1):
+            x, y, z = points[i]
+            if z == 0:
+                continue
+
+            z_inv = z_prod_inv * (z_prods[i - 1] if i > 0 else 1) % p
+            z_prod_inv = z_prod_inv * z % p
+
+            z_inv_2 = z_inv * z_inv % p
+            affine_points[i] = (x * z_inv_2 % p, y * z_inv_2 * z_inv % p)
+
+        return affine_points
+
+    @staticmethod
+    def JacobianDouble(point):
+        """ Double a point in Jacobian coordinates.
+
+        Args:
+            point (tuple): Point in Jacobian coordinates
+
+        Returns:
+            tuple: Doubled point in Jacobian coordinates
+        """
+        p = Secp256k1Const.P
+        x, y, z = point
+
+        if z == 0 or y == 0:
+            return (0, 1, 0)
+
+        a = x * x % p
+        b = y * y % p
+        c = b * b % p
+        d = 2 * ((x + b) * (x + b) - a - c) % p
+        e = 3 * a % p
+        x3 = (e * e - 2 * d) % p
+        y3 = (e * (d - x3) - 8 * c) % p
+        z3 = 2 * y * z % p
+        return (x3, y3, z3)
+
+    @staticmethod
+    def JacobianAddAffine(point_jac, point_aff):
+        """ Add a point in affine coordinates to a point in Jacobian coordinates.
+
+        Args:
+            point_jac (tuple): Point in Jacobian coordinates
+            point_aff (tuple): Point in affine coordinates
+
+        Returns:
+            tuple: Resulting point in Jacobian coordinates
+        """
+        p = Secp256k1Const.P
+
+        if point_aff is None:
+            return point_jac
+
+        x1, y1, z1 = point_jac
+        x2, y2 = point_aff
+
+        if z1 == 0:
+            return (x2, y2, 1)
+
+        z1_2 = z1 * z1 % p
+        h = (x2 * z1_2 - x1) % p
+        r = 2 * (y2 * z1 * z1_2 - y1) % p
+
+        # Same x coordinate: the points are either equal or opposite
+        if h == 0:
+            return Secp256k1.JacobianDouble(point_jac) if r == 0 else (0, 1, 0)
+
+        h_2 = h * h % p
+        i = 4 * h_2 % p
+        j = h * i % p
+        v = x1 * i % p
+        x3 = (r * r - j - 2 * v) % p
+        y3 = (r * (v - x3) - 2 * y1 * j) % p
+        z3 = ((z1 + h) * (z1 + h) - z1_2 - h_2) % p
+        return (x3, y3, z3)
+
+    @staticmethod
+    def GeneratorMultiply(scalar):
+        """ Multiply the generator point by the specified scalar.
+        The fixed-base table is used if enabled, otherwise the multiplication is performed by the ecdsa library.
+
+        Args:
+            scalar (int): Scalar
+
+        Returns:
+            tuple: Resulting point in Jacobian coordinates
+        """
+        if Secp256k1FixedBase.IsEnabled():
+            return Secp256k1FixedBase.Multiply(scalar)
+
+        point = generator_secp256k1 * scalar
+        return (point.x(), point.y(), 1) if scalar % Secp256k1Const.N != 0 else (0, 1, 0)
+
+    @staticmethod
+    def IsOnCurve(point):
+        """ Get if the specified point lies on the curve.
+
+        Args:
+            point (tuple): Point in affine coordinates
+
+        Returns:
+            bool: True if the point lies on the curve, false otherwise
+        """
+        p = Secp256k1Const.P
+        x, y = point
+        return 0 <= x < p and 0 <= y < p and (y * y - x * x * x - 7) % p == 0
+
+    @staticmethod
+    def PointToCompressed(point):
+        """ Encode a point to compressed format.
+
+        Args:
+            point (tuple): Point in affine coordinates
+
+        Returns:
+            bytes: Point in compressed format (33-byte)
+        """
+        x, y = point
+        return bytes([2 + (y & 1)]) + x.to_bytes(Secp256k1Const.COORD_BYTE_LEN, "big")
+
+    @staticmethod
+    def PointToUncompressed(point):
+        """ Encode a point to uncompressed format, without the prefix byte.
+
+        Args:
+            point (tuple): Point in affine coordinates
+
+        Returns:
+            bytes: Point in uncompressed format (64-byte)
+        """
+        x, y = point
+        return x.to_bytes(Secp256k1Const.COORD_BYTE_LEN, "big") + y.to_bytes(Secp256k1Const.COORD_BYTE_LEN, "big")
+
+    @staticmethod
+    def PointFromCompressed(point_bytes):
+        """ Decode a point from compressed format, recovering the y coordinate.
+
+        Args:
+            point_bytes (bytes): Point in compressed format (33-byte)
+
+        Returns:
+            tuple: Point in affine coordinates
+
+        Raises:
+            ValueError: If the bytes are not a valid compressed point
+        """
+        p = Secp256k1Const.P
+
+        if len(point_bytes) != Secp256k1Const.COORD_BYTE_LEN + 1 or point_bytes[0] not in (2, 3):
+            raise ValueError("Invalid compressed point (wrong format)")
+
+        x = int.from_bytes(point_bytes[1:], "big")
+        if x >= p:
+            raise ValueError("Invalid compressed point (x coordinate out of range)")
+
+        # Since p = 3 mod 4, the square root is y = (x^3 + 7)^((p + 1) / 4)
+        y_2 = (x * x * x + 7) % p
+        y = pow(y_2, (p + 1) // 4, p)
+        if y * y % p != y_2:
+            raise ValueError("Invalid compressed point (not on curve)")
+
+        # Choose the root with the correct parity
+        if (y & 1) != (point_bytes[0] & 1):
+            y = p - y
+        return (x, y)
+
+
+class Secp256k1FixedBase:
+    """ Secp256k1 fixed-base class. It speeds up the multiplication of the generator point by using a precomputed table
+    with the multiples of the generator point for each window of the scalar, so that a multiplication only requires
+    an addition for each window and no doubling.
+    The table is built once per process when first needed, but it can also be saved to and loaded from a file.
+    """
+
+    # Precomputed table, row i contains the points j * 2^(w*i) * G with j from 1 to 2^w - 1 in affine coordinates
+    m_table   = None
+    # Enable flag
+    m_enabled = True
+    # Lock for building the table only once
+    m_lock    = threading.Lock()
+
+    @classmethod
+    def Enable(cls, enabled):
+        """ Enable or disable the fixed-base table.
+        If disabled, the generator multiplication is performed by the ecdsa library.
+
+        Args:
+            enabled (bool): True to enable, false to disable
+        """
+        cls.m_enabled = enabled
+
+    @classmethod
+    def IsEnabled(cls):
+        """ Get if the fixed-base table is enabled.
+
+        Returns:
+            bool: True if enabled, false otherwise
+        """
+        return cls.m_enabled
+
+    @classmethod
+    def Multiply(cls, scalar):
+        """ Multiply the generator point by the specified scalar using the fixed-base table.
+
+        Args:
+            scalar (int): Scalar
+
+        Returns:
+            tuple: Resulting point in Jacobian coordinates
+        """
+        table = cls.Table()
+        scalar %= Secp256k1Const.N
+
+        win_mask = (1 << Secp256k1Const.FIXED_BASE_WINDOW_BITS) - 1
+        point = (0, 1, 0)
+
+        for row in table:
+            digit = scalar & win_mask
+            if digit != 0:
+                point = Secp256k1.JacobianAddAffine(point, row[digit - 1])
+            scalar >>= Secp256k1Const.FIXED_BASE_WINDOW_BITS
+
+        return point
+
+    @classmethod
+    def Table(cls):
+        """ Get the fixed-base table, building it if not yet done.
+
+        Returns:
+            list: Fixed-base table
+        """
+        if cls.m_table is None:
+            with cls.m_lock:
+                if cls.m_table is None:
+                    cls.m_table = cls.__BuildTable()
+        return cls.m_table
+
+    @classmethod
+    def Save(cls, file_path):
+        """ Save the fixed-base table to file, building it if not yet done.
+
+        Args:
+            file_path (str): File path
+        """
+        table_bytes = b"".join([x.to_bytes(Secp256k1Const.COORD_BYTE_LEN, "big") + y.to_bytes(Secp256k1Const.COORD_BYTE_LEN, "big")
+                                for row in cls.Table() for x, y in row])
+
+        with open(file_path, "wb") as fout:
+            fout.write(table_bytes + utils.Sha256(table_bytes))
+
+    @classmethod
+    def Load(cls, file_path):
+        """ Load the fixed-base table from file.
+
+        Args:
+            file_path (str): File path
+
+        Raises:
+            ValueError: If the file content is not valid
+        """
+        with open(file_path, "rb") as fin:
+            file_bytes = fin.read()
+
+        coord_len = Secp256k1Const.COORD_BYTE_LEN
+        row_len   = (1 << Secp256k1Const.FIXED_BASE_WINDOW_BITS) - 1
+        table_len = Secp256k1Const.FIXED_BASE_WINDOW_NUM * row_len * coord_len * 2
+
+        # Check length and checksum
+        if len(file_bytes) != table_len + utils.Sha256DigestSize():
+            raise ValueError("Invalid fixed-base table file (wrong length)")
+        if utils.Sha256(file_bytes[:table_len]) != file_bytes[table_len:]:
+            raise ValueError("Invalid fixed-base table file (wrong checksum)")
+
+        coords = [int.from_bytes(file_bytes[i : i + coord_len], "big") for i in range(0, table_len, coord_len)]
+        points = list(zip(coords[0::2], coords[1::2]))
+        table  = [points[i : i + row_len] for i in range(0, len(points), row_len)]
+
+        # The checksum only detects accidental corruption, so all the points are verified
+        if not cls.__IsTableValid(table):
+            raise ValueError("Invalid fixed-base table file (wrong points)")
+
+        with cls.m_lock:
+            cls.m_table = table
+
+    @staticmethod
+    def __IsTableValid(table):
+        """ Get if the specified fixed-base table is valid, i.e. if each point is the correct multiple of the generator.
+        Starting from the generator, each point shall be the sum of the previous one and the base point of its row
+        (the first point of the next row is the sum of the last one and the base point of the current row).
+        It's faster than building the table again, since no modular inversion is needed.
+
+        Args:
+            table (list): Fixed-base table
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        base = (Secp256k1Const.GX, Secp256k1Const.GY)
+        if table[0][0] != base:
+            return False
+
+        prev_point = base
+        for i, row in enumerate(table):
+            for j, point in enumerate(row):
+                if (i, j) != (0, 0):
+                    if not Secp256k1FixedBase.__IsSum(prev_point, base, point):
+                        return False
+                    # The first point of the row is the base point, used after being verified
+                    if j == 0:
+                        base = point
+                prev_point = point
+
+        return True
+
+    @staticmethod
+    def __IsSum(point_1, point_2, point_sum):
+        """ Get if a point is the sum of two other points, all in affine coordinates and not at infinity.
+        The affine addition formulas are multiplied by their denominator, so that no modular inversion is needed.
+        The first two points shall be on the curve.
+
+        Args:
+            point_1 (tuple)  : First point
+            point_2 (tuple)  : Second point
+            point_sum (tuple): Sum point
+
+        Returns:
+            bool: True if sum, false otherwise
+        """
+        p = Secp256k1Const.P
+        x1, y1 = point_1
+        x2, y2 = point_2
+        x3, y3 = point_sum
+
+        if not (0 <= x3 < p and 0 <= y3 < p):
+            return False
+
+        # Slope as numerator and denominator, for addition or doubling
+        if x1 != x2:
+            num, den = y2 - y1, x2 - x1
+        elif y1 == y2 and y1 != 0:
+            num, den = 3 * x1 * x1, 2 * y1
+        else:
+            return False
+
+        # x3 = l^2 - x1 - x2, y3 = l * (x1 - x3) - y1
+        return ((x3 + x1 + x2) * den * den - num * num) % p == 0 and ((y3 + y1) * den - num * (x1 - x3)) % p == 0
+
+    @staticmethod
+    def __BuildTable():
+        """ Build the fixed-base table.
+
+        Returns:
+            list: Fixed-base table
+        """
+        table = []
+        base  = (Secp256k1Const.GX, Secp256k1Const.GY)
+
+        for _ in range(Secp256k1Const.FIXED_BASE_WINDOW_NUM):
+            # Compute all the multiples of the base point of the current window
+            point = Secp256k1.JacobianFromAffine(base)
+            points = [point]
+            for _ in range((1 << Secp256k1Const.FIXED_BASE_WINDOW_BITS) - 1):
+                point = Secp256k1.JacobianAddAffine(point, base)
+                points.append(point)
+            row = Secp256k1.JacobianToAffineBatch(points)
+
+            # The last multiple is the base point of the next window
+            base = row.pop()
+            table.append(row)
+
+        return table
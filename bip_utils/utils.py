@@ -60,6 +60,34 @@ def HmacSha512(key_bytes, data_bytes):
     return hmac.new(key_bytes, data_bytes, hashlib.sha512).digest()
 
 
+def HmacSha512New(key_bytes):
+    """ Create a HMAC-SHA512 object keyed with the specified key.
+    The object can be then copied for computing many HMACs with the same key, without preparing the key again.
+
+    Args:
+        key_bytes (bytes): Key bytes
+
+    Returns:
+        hmac object: Keyed HMAC-SHA512 object
+    """
+    return hmac.new(key_bytes, digestmod = hashlib.sha512)
+
+
+def HmacSha512Copy(hmac_obj, data_bytes):
+    """ Compute the HMAC-SHA512 of the specified bytes by copying the specified keyed object, which is left unchanged.
+
+    Args:
+        hmac_obj (hmac object): Keyed HMAC-SHA512 object
+        data_bytes (bytes)    : Data bytes
+
+    Returns:
+        bytes: Computed HMAC-SHA512
+    """
+    hmac_copy = hmac_obj.copy()
+    hmac_copy.update(data_bytes)
+    return hmac_copy.digest()
+
+
 def Pbkdf2HmacSha512(password_bytes, salt_bytes, itr_num):
     """ Compute the PBKDF2 HMAC-SHA512 of the specified password, using the specified keys and iteration number.
 
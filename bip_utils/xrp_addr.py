@@ -35,6 +35,21 @@ class XrpAddrConst:
 class XrpAddr:
     """ Ripple address class. It allows the Ripple address generation. """
 
+    @staticmethod
+    def ToPayload(pub_key_bytes):
+        """ Get address payload in Ripple format, i.e. the public key hash.
+
+        Args:
+            pub_key_bytes (bytes): Public key bytes
+
+        Returns:
+            bytes: Address payload (20-byte)
+
+        Raises:
+            ValueError: If key is not a public compressed key
+        """
+        return P2PKH.ToPayload(pub_key_bytes)
+
     @staticmethod
     def ToAddress(pub_key_bytes):
         """ Get address in Ripple format.
@@ -32,9 +32,9 @@ setuptools.setup(
     download_url="https://github.com/ebellocchia/bip_utils/archive/v%s.tar.gz" % version,
     license="MIT",
     test_suite="tests",
-    install_requires = ["ecdsa","pysha3"],
+    install_requires = ["ecdsa>=0.15","pysha3"],
     packages=["bip_utils"],
-    package_data={"bip_utils": ["bip39_wordslist_en.txt"]},
+    package_data={"bip_utils": ["bip39_wordslist_*.txt"]},
     keywords="bitcoin, litecoin, dogecoin, dash, ethereum, ripple, wallet, hd-wallet, bip39, bip32, bip44, bip49, bip84, python",
     platforms = ["any"],
     classifiers=[
@@ -22,7 +22,7 @@
 # Imports
 import binascii
 import unittest
-from bip_utils import BitcoinConf, LitecoinConf, DogecoinConf, DashConf, P2PKH
+from bip_utils import BitcoinConf, LitecoinConf, DogecoinConf, DashConf, Base58Decoder, P2PKH
 
 
 # Some keys randomly taken from Ian Coleman web page
@@ -119,8 +119,11 @@ class P2PKHTests(unittest.TestCase):
     def test_to_addr(self):
         for test in TEST_MAIN:
             self.assertEqual(test["address"], P2PKH.ToAddress(binascii.unhexlify(test["pub_key"]), test["net_addr_ver"]))
+            # The payload is the address without the net version
+            self.assertEqual(Base58Decoder.CheckDecode(test["address"])[len(test["net_addr_ver"]):], P2PKH.ToPayload(binascii.unhexlify(test["pub_key"])))
 
     # Test invalid keys
     def test_invalid_keys(self):
         for test in TEST_KEY_INVALID:
             self.assertRaises(ValueError, P2PKH.ToAddress, binascii.unhexlify(test))
+            self.assertRaises(ValueError, P2PKH.ToPayload, binascii.unhexlify(test))
@@ -22,7 +22,7 @@
 # Imports
 import binascii
 import unittest
-from bip_utils import BitcoinConf, LitecoinConf, P2WPKH
+from bip_utils import BitcoinConf, LitecoinConf, Bech32Decoder, P2WPKH
 
 
 # Some keys randomly taken from Ian Coleman web page
@@ -89,8 +89,11 @@ class P2WPKHTests(unittest.TestCase):
     def test_to_addr(self):
         for test in TEST_MAIN:
             self.assertEqual(test["address"], P2WPKH.ToAddress(binascii.unhexlify(test["pub_key"]), test["net_addr_ver"]))
+            # The payload is the witness program
+            self.assertEqual(Bech32Decoder.DecodeAddr(test["net_addr_ver"], test["address"])[1], P2WPKH.ToPayload(binascii.unhexlify(test["pub_key"])))
 
     # Test invalid keys
     def test_invalid_keys(self):
         for test in TEST_KEY_INVALID:
             self.assertRaises(ValueError, P2WPKH.ToAddress, binascii.unhexlify(test))
+            self.assertRaises(ValueError, P2WPKH.ToPayload, binascii.unhexlify(test))
@@ -0,0 +1,99 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+# Imports
+import binascii
+import os
+import unittest
+from bip_utils import AddressFilter, Bip44, Bip44Changes, Bip44Coins
+
+
+# Tests seed
+TEST_SEED = b"5eb00bbddcf069084889a8ab9155568165f5c453ccb85e70811aaed6f6da5fc19a5ac40b389cd370d086206dec8aa6c43daea6690f20ad3d8d48b2d2ce9e38e4"
+
+
+#
+# Tests
+#
+class AddressFilterTests(unittest.TestCase):
+    # Test filter with random payloads
+    def test_contains(self):
+        payloads = [os.urandom(20) for _ in range(1000)]
+        addr_filter = AddressFilter.FromCapacity(len(payloads), 0.01)
+
+        for payload in payloads:
+            addr_filter.Add(payload)
+        # No false negatives
+        for payload in payloads:
+            self.assertTrue(payload in addr_filter)
+
+        # False positives shall be near the specified rate
+        false_pos = sum([os.urandom(20) in addr_filter for _ in range(10000)])
+        self.assertLess(false_pos, 300)
+
+    # Test filter built from address ranges
+    def test_add_range(self):
+        for coin_idx in (Bip44Coins.BITCOIN, Bip44Coins.ETHEREUM):
+            bip_obj_change = Bip44.FromSeed(binascii.unhexlify(TEST_SEED), coin_idx).Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT)
+
+            addr_filter = AddressFilter.FromCapacity(100)
+            addr_filter.AddRange(bip_obj_change, 0, 10)
+            for i in range(10):
+                self.assertTrue(bip_obj_change.AddressIndex(i).PublicKey().ToAddressPayload() in addr_filter)
+
+    # Test serialization and merge
+    def test_bytes_merge(self):
+        payloads = [os.urandom(20) for _ in range(200)]
+        addr_filter_1 = AddressFilter.FromCapacity(len(payloads))
+        addr_filter_2 = AddressFilter(addr_filter_1.BitNum(), addr_filter_1.HashNum())
+        for i, payload in enumerate(payloads):
+            (addr_filter_1 if i % 2 == 0 else addr_filter_2).Add(payload)
+
+        # Serialization
+        filter_bytes = addr_filter_1.ToBytes()
+        addr_filter = AddressFilter.FromBytes(filter_bytes)
+        self.assertEqual(addr_filter_1.BitNum(), addr_filter.BitNum())
+        self.assertEqual(addr_filter_1.HashNum(), addr_filter.HashNum())
+        self.assertEqual(filter_bytes, addr_filter.ToBytes())
+
+        # Merge
+        addr_filter.Merge(addr_filter_2)
+        for payload in payloads:
+            self.assertTrue(payload in addr_filter)
+
+        # Invalid bytes
+        self.assertRaises(ValueError, AddressFilter.FromBytes, filter_bytes[:4])
+        self.assertRaises(ValueError, AddressFilter.FromBytes, filter_bytes[:-1])
+        self.assertRaises(ValueError, AddressFilter.FromBytes, filter_bytes[:4] + b"\x00" + filter_bytes[5:])
+        # Different filters
+        self.assertRaises(ValueError, addr_filter.Merge, AddressFilter(addr_filter.BitNum() + 1, addr_filter.HashNum()))
+        self.assertRaises(ValueError, addr_filter.Merge, AddressFilter(addr_filter.BitNum(), addr_filter.HashNum() + 1))
+
+    # Test invalid parameters
+    def test_invalid(self):
+        self.assertRaises(ValueError, AddressFilter.FromCapacity, 0)
+        self.assertRaises(ValueError, AddressFilter.FromCapacity, 10, 0.0)
+        self.assertRaises(ValueError, AddressFilter.FromCapacity, 10, 1.0)
+        self.assertRaises(ValueError, AddressFilter, 0, 1)
+        self.assertRaises(ValueError, AddressFilter, 10, 0)
+        self.assertRaises(ValueError, AddressFilter(10, 1).Add, b"\x00" * 21)
+        self.assertRaises(ValueError, AddressFilter(10, 1).__contains__, b"\x00" * 19)
@@ -0,0 +1,118 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+# Imports
+import binascii
+import os
+import tempfile
+import unittest
+from bip_utils import AddressIndex, AddressIndexBuilder, Bip32, Bip32PathParser, Bip44, Bip84, Bip44Changes, Bip44Coins
+
+
+# Tests seed
+TEST_SEED = b"5eb00bbddcf069084889a8ab9155568165f5c453ccb85e70811aaed6f6da5fc19a5ac40b389cd370d086206dec8aa6c43daea6690f20ad3d8d48b2d2ce9e38e4"
+# Accounts added to the index, with their path from the master key
+TEST_ACCOUNTS = \
+    [
+        (Bip44, Bip44Coins.BITCOIN , "44'/0'/0'"),
+        (Bip84, Bip44Coins.BITCOIN , "84'/0'/0'"),
+        (Bip44, Bip44Coins.ETHEREUM, "44'/60'/0'"),
+    ]
+# Number of addresses for each change level
+TEST_ADDR_NUM = 10
+
+
+#
+# Tests
+#
+class AddressIndexTests(unittest.TestCase):
+    # Build an index with the addresses of the test accounts, as strings and payloads
+    def setUp(self):
+        self.m_tmp_dir = tempfile.TemporaryDirectory()
+        self.m_file_path = os.path.join(self.m_tmp_dir.name, "index.bin")
+        self.m_addrs = []
+
+        builder = AddressIndexBuilder()
+        root_fprint = Bip32.FromSeed(binascii.unhexlify(TEST_SEED)).FingerPrint()
+
+        for bip_class, coin_idx, acc_path in TEST_ACCOUNTS:
+            bip_obj_acc = bip_class.FromSeed(binascii.unhexlify(TEST_SEED), coin_idx).Purpose().Coin().Account(0)
+
+            for change_idx in Bip44Changes:
+                bip_obj_change = bip_obj_acc.Change(change_idx)
+                path_idx = Bip32PathParser.Parse(acc_path, True) + [change_idx]
+
+                builder.AddRange(bip_obj_change, 0, TEST_ADDR_NUM, root_fprint, path_idx)
+                builder.AddRange(bip_obj_change, 0, TEST_ADDR_NUM, root_fprint, path_idx, payloads = True)
+
+                for addr_idx in range(TEST_ADDR_NUM):
+                    pub_key = bip_obj_change.AddressIndex(addr_idx).PublicKey()
+                    self.m_addrs.append((pub_key.ToAddress(), pub_key.ToAddressPayload(), root_fprint, path_idx + [addr_idx]))
+
+        self.assertEqual(len(self.m_addrs) * 2, builder.Size())
+        builder.Save(self.m_file_path)
+
+    def tearDown(self):
+        self.m_tmp_dir.cleanup()
+
+    # Test lookups
+    def test_lookup(self):
+        with AddressIndex(self.m_file_path) as addr_index:
+            self.assertEqual(len(self.m_addrs) * 2, addr_index.Size())
+
+            for addr, payload, root_fprint, path_idx in self.m_addrs:
+                self.assertEqual((root_fprint, path_idx), addr_index.Lookup(addr))
+                self.assertEqual((root_fprint, path_idx), addr_index.Lookup(payload))
+                self.assertTrue(addr in addr_index)
+
+            # Not present addresses
+            self.assertIsNone(addr_index.Lookup("1LqBGSKuX5yYUonjxT5qGfpUsXKYYWeabB"))
+            self.assertIsNone(addr_index.Lookup(b"\x00" * 20))
+            self.assertIsNone(addr_index.Lookup(b"\xff" * 20))
+            self.assertFalse(b"\x00" * 20 in addr_index)
+            # Invalid payload
+            self.assertRaises(ValueError, addr_index.Lookup, b"\x00" * 19)
+
+    # Test empty index
+    def test_empty(self):
+        AddressIndexBuilder().Save(self.m_file_path)
+
+        with AddressIndex(self.m_file_path) as addr_index:
+            self.assertEqual(0, addr_index.Size())
+            self.assertIsNone(addr_index.Lookup(self.m_addrs[0][0]))
+
+    # Test invalid parameters and files
+    def test_invalid(self):
+        builder = AddressIndexBuilder()
+        self.assertRaises(ValueError, builder.Add, b"\x00" * 21, b"\x00" * 4, [0])
+        self.assertRaises(ValueError, builder.Add, "addr", b"\x00" * 3, [0])
+        self.assertRaises(ValueError, builder.Add, "addr", b"\x00" * 4, [0] * 7)
+        self.assertRaises(ValueError, builder.Add, "addr", b"\x00" * 4, [-1])
+
+        with open(self.m_file_path, "rb") as fin:
+            file_bytes = fin.read()
+
+        # Wrong magic, version and length
+        for invalid_bytes in (b"X" + file_bytes[1:], file_bytes[:4] + b"\x02" + file_bytes[5:], file_bytes[:-1], file_bytes[:4]):
+            with open(self.m_file_path, "wb") as fout:
+                fout.write(invalid_bytes)
+            self.assertRaises(ValueError, AddressIndex, self.m_file_path)
@@ -21,8 +21,10 @@
 
 # Imports
 import binascii
+import pickle
 import unittest
-from bip_utils import Bip32, Bip32KeyError, Bip32PathError, Bip32PathParser, Bip32Utils
+from bip_utils       import Bip32, Bip32KeyError, Bip32PathError, Bip32PathParser, Bip32Utils
+from bip_utils.utils import Hash160
 
 
 # Tests from BIP32 page
@@ -418,6 +420,199 @@ class Bip32Tests(unittest.TestCase):
                 bip32_ctx = bip32_ctx.ChildKey(test["index"])
                 self.assertEqual(test["ex_pub"] , bip32_ctx.PublicKey().ToExtended())
 
+    # Test that the parent fingerprint is correct also when it is computed lazily
+    def test_lazy_parent_fprint(self):
+        for test in TEST_BIP32_MAIN:
+            bip32_ctx = Bip32.FromSeed(binascii.unhexlify(test["seed"]))
+
+            for chain in test["der_paths"]:
+                bip32_child = bip32_ctx.ChildKey(chain["index"])
+                self.assertEqual(bip32_ctx.FingerPrint(), bip32_child.ParentFingerPrint())
+                bip32_ctx = bip32_child
+
+        # The public keys of the intermediate keys of a hardened path are not needed, except the parent of the last one
+        seed_bytes = binascii.unhexlify(TEST_BIP32_MAIN[0]["seed"])
+        parent_fprint = Bip32.FromSeed(seed_bytes).ChildKey(Bip32Utils.HardenIndex(44)).ChildKey(Bip32Utils.HardenIndex(0)).FingerPrint()
+
+        bip32_ctx = Bip32.FromSeed(seed_bytes)
+        bip32_ctx.EnableDerivationCache()
+        for bip32_obj in (Bip32.FromSeedAndPath(seed_bytes, "m/44'/0'/0'"),
+                          bip32_ctx.DerivePath("44'/0'/0'"),
+                          bip32_ctx.DerivePath("44'/0'/0'"),
+                          list(bip32_ctx.DeriveMany(["44'/0'/0'"]))[0][1]):
+            self.assertIsNone(bip32_obj.m_pub_key_bytes)
+            self.assertEqual(parent_fprint, bip32_obj.ParentFingerPrint())
+        self.assertIsNone(bip32_ctx.m_pub_key_bytes)
+
+    # Test that a derived key, also when converted to public, cannot reach any private key of its ancestors
+    def test_convert_to_public_ancestors(self):
+        for test in TEST_BIP32_MAIN:
+            bip32_ctx = Bip32.FromSeed(binascii.unhexlify(test["seed"]))
+            priv_keys = [bip32_ctx.PrivateKey().Raw().ToBytes()]
+
+            # Hardened derivation
+            bip32_child = bip32_ctx
+            for index in (Bip32Utils.HardenIndex(44), Bip32Utils.HardenIndex(0), Bip32Utils.HardenIndex(0)):
+                bip32_child = bip32_child.ChildKey(index)
+                priv_keys.append(bip32_child.PrivateKey().Raw().ToBytes())
+
+            # No field shall be a Bip32 object or a private key of the ancestors
+            for is_public in (False, True):
+                if is_public:
+                    bip32_child.ConvertToPublic()
+                for slot in Bip32.__slots__:
+                    value = getattr(bip32_child, slot)
+                    self.assertNotIsInstance(value, Bip32)
+                    self.assertNotIn(value, priv_keys[:-1] if not is_public else priv_keys)
+                self.assertEqual(bip32_ctx.DerivePath("44'/0'").FingerPrint(), bip32_child.ParentFingerPrint())
+
+    # Test that public key bytes, key identifier and fingerprint are computed once and are correct
+    def test_key_id_cached(self):
+        for test in TEST_BIP32_MAIN:
+            bip32_ctx = Bip32.FromSeed(binascii.unhexlify(test["seed"]))
+
+            for chain in test["der_paths"]:
+                bip32_ctx = bip32_ctx.ChildKey(chain["index"])
+                pub_key_bytes = bip32_ctx.EcdsaPublicKey().to_string("compressed")
+
+                self.assertEqual(pub_key_bytes, bip32_ctx.PublicKey().RawCompressed().ToBytes())
+                self.assertEqual(Hash160(pub_key_bytes), bip32_ctx.KeyIdentifier())
+                self.assertEqual(Hash160(pub_key_bytes)[:4], bip32_ctx.FingerPrint())
+                self.assertIs(bip32_ctx.KeyIdentifier(), bip32_ctx.KeyIdentifier())
+                self.assertIs(bip32_ctx.FingerPrint(), bip32_ctx.FingerPrint())
+
+    # Test that the ECDSA private key object is created once and is consistent with the public key
+    def test_ecdsa_priv_key_cached(self):
+        for test in TEST_BIP32_MAIN:
+            bip32_ctx = Bip32.FromSeed(binascii.unhexlify(test["seed"]))
+
+            for chain in test["der_paths"]:
+                bip32_ctx = bip32_ctx.ChildKey(chain["index"])
+                ecdsa_priv_key = bip32_ctx.EcdsaPrivateKey()
+
+                self.assertIs(ecdsa_priv_key, bip32_ctx.EcdsaPrivateKey())
+                self.assertEqual(bip32_ctx.PrivateKey().Raw().ToBytes(), ecdsa_priv_key.to_string())
+                self.assertEqual(chain["ex_pub"], bip32_ctx.PublicKey().ToExtended())
+
+            # Shall be removed when converting to public
+            bip32_ctx.ConvertToPublic()
+            self.assertIsNone(bip32_ctx.m_ecdsa_priv_key)
+            self.assertRaises(Bip32KeyError, bip32_ctx.EcdsaPrivateKey)
+
+    # Test that deriving many children gives the same keys of single derivation
+    def test_child_keys(self):
+        indexes = [0, 1, Bip32Utils.HardenIndex(2), 3, 1000000000]
+
+        # Private derivation
+        bip32_ctx = Bip32.FromExtendedKey(TEST_PUBLIC_DER_MAIN["ex_priv"])
+        for index, bip32_child in zip(indexes, bip32_ctx.ChildKeys(indexes)):
+            self.assertEqual(bip32_ctx.ChildKey(index).PrivateKey().ToExtended(), bip32_child.PrivateKey().ToExtended())
+
+        # Public derivation
+        bip32_ctx.ConvertToPublic()
+        self.assertRaises(Bip32KeyError, bip32_ctx.ChildKeys, indexes)
+
+        pub_indexes = [index for index in indexes if not Bip32Utils.IsHardenedIndex(index)]
+        for index, bip32_child in zip(pub_indexes, bip32_ctx.ChildKeys(pub_indexes)):
+            self.assertEqual(bip32_ctx.ChildKey(index).PublicKey().ToExtended(), bip32_child.PublicKey().ToExtended())
+            # The computed point shall be kept, so that it's not recovered from the compressed public key
+            self.assertIsNotNone(bip32_child.m_pub_point)
+            self.assertIsNotNone(bip32_ctx.ChildKey(index).m_pub_point)
+
+    # Test derivation of many paths
+    def test_derive_many(self):
+        for test in TEST_BIP32_MAIN:
+            bip32_ctx = Bip32.FromSeed(binascii.unhexlify(test["seed"]))
+
+            # Test paths in reverse order, so that they are not sorted
+            paths = [chain["path"][2:] for chain in reversed(test["der_paths"])]
+            results = list(bip32_ctx.DeriveMany(paths))
+
+            self.assertEqual(paths, [path for path, _ in results])
+            for chain, (_, bip32_from_path) in zip(reversed(test["der_paths"]), results):
+                self.assertEqual(chain["ex_pub"] , bip32_from_path.PublicKey().ToExtended())
+                self.assertEqual(chain["ex_priv"], bip32_from_path.PrivateKey().ToExtended())
+
+            # Invalid paths
+            for test_err in TEST_PATH_ERR:
+                self.assertRaises(Bip32PathError, list, bip32_ctx.DeriveMany(["0", test_err["path"]]))
+
+    # Test derivation with cache
+    def test_derivation_cache(self):
+        for test in TEST_BIP32_MAIN:
+            bip32_ctx = Bip32.FromSeed(binascii.unhexlify(test["seed"]))
+            bip32_ctx.EnableDerivationCache(2)
+            self.assertTrue(bip32_ctx.IsDerivationCacheEnabled())
+
+            # Derive twice, the second time the keys are taken from cache
+            for _ in range(2):
+                for chain in test["der_paths"]:
+                    bip32_from_path = bip32_ctx.DerivePath(chain["path"][2:])
+                    self.assertEqual(chain["ex_pub"] , bip32_from_path.PublicKey().ToExtended())
+                    self.assertEqual(chain["ex_priv"], bip32_from_path.PrivateKey().ToExtended())
+                    self.assertLessEqual(bip32_ctx.m_der_cache.Size(), 2)
+
+            bip32_ctx.PurgeDerivationCache()
+            self.assertEqual(0, bip32_ctx.m_der_cache.Size())
+            bip32_ctx.DisableDerivationCache()
+            self.assertFalse(bip32_ctx.IsDerivationCacheEnabled())
+
+        self.assertRaises(ValueError, bip32_ctx.EnableDerivationCache, 0)
+
+    # Test compact representation of keys, with public keys constructed from compressed bytes or ecdsa objects
+    def test_compact_keys(self):
+        bip32_ctx = Bip32.FromExtendedKey(TEST_PUBLIC_DER_MAIN["ex_priv"])
+        self.assertFalse(hasattr(bip32_ctx, "__dict__"))
+
+        bip32_ctx.ConvertToPublic()
+        bip32_child = bip32_ctx.ChildKey(0)
+        pub_key_bytes = bip32_child.PublicKey().RawCompressed().ToBytes()
+
+        # The ecdsa objects shall be consistent with the stored bytes
+        self.assertEqual(pub_key_bytes, bip32_child.EcdsaPublicKey().to_string("compressed"))
+        self.assertEqual(bip32_child.EcdsaPublicKey().to_string("uncompressed")[1:], bip32_child.PublicKey().RawUncompressed().ToBytes())
+
+        for secret in (pub_key_bytes, bip32_child.EcdsaPublicKey()):
+            bip32_obj = Bip32(secret      = secret,
+                              chain       = bip32_child.Chain(),
+                              depth       = bip32_child.Depth(),
+                              index       = bip32_child.Index(),
+                              fprint      = bip32_child.ParentFingerPrint(),
+                              is_public   = True)
+            self.assertEqual(bip32_child.PublicKey().ToExtended(), bip32_obj.PublicKey().ToExtended())
+            self.assertEqual(bip32_child.ChildKey(1).PublicKey().ToExtended(), bip32_obj.ChildKey(1).PublicKey().ToExtended())
+
+        # Invalid public keys
+        self.assertRaises(Bip32KeyError, Bip32, pub_key_bytes[1:], bip32_child.Chain(), is_public = True)
+        self.assertRaises(Bip32KeyError, Bip32, b"\x04" + pub_key_bytes[1:], bip32_child.Chain(), is_public = True)
+        # Point not on curve, detected when it's needed for derivation
+        bip32_obj = Bip32(b"\x02" + b"\x00" * 31 + b"\x05", bip32_child.Chain(), is_public = True)
+        self.assertRaises(Bip32KeyError, bip32_obj.ChildKey, 0)
+
+    # Test pickling of private and public keys
+    def test_pickle(self):
+        for test in TEST_BIP32_MAIN:
+            bip32_ctx = Bip32.FromSeed(binascii.unhexlify(test["seed"]))
+
+            for chain in test["der_paths"]:
+                bip32_ctx = bip32_ctx.ChildKey(chain["index"])
+                bip32_ctx.EnableDerivationCache()
+
+                pickled = pickle.dumps(bip32_ctx)
+                self.assertLess(len(pickled), 200)
+
+                bip32_obj = pickle.loads(pickled)
+                self.assertEqual(chain["ex_priv"], bip32_obj.PrivateKey().ToExtended())
+                self.assertEqual(chain["ex_pub"] , bip32_obj.PublicKey().ToExtended())
+                self.assertFalse(bip32_obj.IsDerivationCacheEnabled())
+
+                # Public key
+                bip32_obj.ConvertToPublic()
+                bip32_obj = pickle.loads(pickle.dumps(bip32_obj))
+                self.assertTrue(bip32_obj.IsPublicOnly())
+                self.assertEqual(chain["ex_pub"], bip32_obj.PublicKey().ToExtended())
+                self.assertEqual(bip32_ctx.ChildKey(0).PublicKey().ToExtended(), bip32_obj.ChildKey(0).PublicKey().ToExtended())
+
     # Test invalid seed
     def test_invalid_seed(self):
         for test in TEST_SEED_ERR:
@@ -21,8 +21,12 @@
 
 # Imports
 import binascii
+import unicodedata
 import unittest
-from bip_utils import EntropyGenerator, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39ChecksumError
+from bip_utils       import (
+    Bip39Languages, EntropyGenerator, Bip39Mnemonic, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39ChecksumError
+)
+from bip_utils.bip39 import MnemonicFileReader
 
 
 # Tests from BIP39 page
@@ -161,6 +165,46 @@ TEST_MAIN = \
 # Tests passphrase
 TEST_PASSPHRASE = "TREZOR"
 
+# Tests for languages other than English
+TEST_LANG = \
+    [
+        {
+            "lang"       : Bip39Languages.JAPANESE,
+            "entropy"    : b"00000000000000000000000000000000",
+            "mnemonic"   : "\u3000".join(["あいこくしん"] * 11 + ["あおぞら"]),
+            "passphrase" : "㍍ガバヴァぱばぐゞちぢ十人十色",
+            "seed"       : b"a262d6fb6122ecf45be09c50492b31f92e9beb7d9a845987a02cefda57a15f9c467a17872029a9e92299b5cbdf306e3a0ee620245cbd508959b6cb7ca637bd55",
+        },
+        {
+            "lang"       : Bip39Languages.SPANISH,
+            "entropy"    : b"7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f",
+            "mnemonic"   : "ligero vista talar yogur venta queso yacer trozo ligero vista talar zafiro",
+            "passphrase" : TEST_PASSPHRASE,
+            "seed"       : b"1580aa5d5d67057b3a0a12253c283b93921851555529d0bbe9634349d641029216f791ddce3527819d44d833a0df3500b15fd8ba4cae7ca24e1464b9167de633",
+        },
+        {
+            "lang"       : Bip39Languages.FRENCH,
+            "entropy"    : b"808080808080808080808080808080808080808080808080",
+            "mnemonic"   : "indexer acompte bolide abrasif agréable dédale abusif appuyer indexer acompte bolide abrasif agréable dédale abusif appuyer indexer agencer",
+            "passphrase" : TEST_PASSPHRASE,
+            "seed"       : b"b039606212ccadb0d05c7a0c08605c5137028d0253d26b9ad6ee113f9595700d9834b2eec8b224975a6d9585d7ad39e962036edcf07d5b125b0fc225d519982f",
+        },
+        {
+            "lang"       : Bip39Languages.KOREAN,
+            "entropy"    : b"9e885d952ad362caeb4efe34a8e91bd2",
+            "mnemonic"   : "원고 물질 생일 부산 마요네즈 생활 일찍 큰절 동화책 반성 반드시 의식",
+            "passphrase" : TEST_PASSPHRASE,
+            "seed"       : b"8d148c7f8ed529d7a88fe2bc8bff574b56406f9928ab5426df793f4d3a5121c7c6974c856ad20f66ecf04fbecd3bc025912b3e41d500f1e5be896505e01d08d6",
+        },
+        {
+            "lang"       : Bip39Languages.CHINESE_SIMPLIFIED,
+            "entropy"    : b"ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",
+            "mnemonic"   : " ".join(["歇"] * 23 + ["佳"]),
+            "passphrase" : TEST_PASSPHRASE,
+            "seed"       : b"8e6607a07fa664d6e4ead23fcc08caf72216d6f078c3b2e5be94e4b6e8d64c784d36bf9b70144fa05840e9a49899128111be5093a2b552b6ab76c0906e9b0e65",
+        },
+    ]
+
 # Bit lengths for entropy tests
 TEST_ENTROPY_BITS_MAIN = \
     [
@@ -242,6 +286,11 @@ class Bip39Tests(unittest.TestCase):
 
             self.assertEqual(test["seed"], binascii.hexlify(seed))
 
+            # Test seed generator using list
+            seed = Bip39SeedGenerator(mnemonic.split(" ")).Generate(TEST_PASSPHRASE)
+
+            self.assertEqual(test["seed"], binascii.hexlify(seed))
+
     # Test entropy generator and construction from entropy
     def test_entropy(self):
         for test in TEST_ENTROPY_BITS_MAIN:
@@ -271,9 +320,206 @@ class Bip39Tests(unittest.TestCase):
             else:
                 self.assertRaises(ValueError, Bip39MnemonicGenerator.FromWordsNumber, test["words_num"])
 
+    # Test generation of many mnemonics from words number
+    def test_from_words_num_many(self):
+        for test in TEST_WORDS_NUM_MAIN:
+            if test["is_valid"]:
+                mnemonics = list(Bip39MnemonicGenerator.FromWordsNumberMany(test["words_num"], 100))
+
+                self.assertEqual(100, len(mnemonics))
+                self.assertEqual(100, len(set(mnemonics)))
+                for mnemonic in mnemonics:
+                    self.assertEqual(len(mnemonic.split(" ")), test["words_num"])
+                    self.assertTrue(Bip39MnemonicValidator(mnemonic).Validate())
+            else:
+                self.assertRaises(ValueError, Bip39MnemonicGenerator.FromWordsNumberMany, test["words_num"], 100)
+
+        self.assertEqual([], list(Bip39MnemonicGenerator.FromWordsNumberMany(12, 0)))
+        self.assertRaises(ValueError, Bip39MnemonicGenerator.FromWordsNumberMany, 12, -1)
+
+    # Test generation of many entropies, more than the ones of a single random block
+    def test_entropy_many(self):
+        entropies = list(EntropyGenerator(256).GenerateMany(5000))
+
+        self.assertEqual(5000, len(entropies))
+        self.assertEqual(5000, len(set(entropies)))
+        for entropy in entropies:
+            self.assertEqual(32, len(entropy))
+
+    # Test generation of many seeds
+    def test_seed_many(self):
+        mnemonics = [test["mnemonic"] for test in TEST_MAIN]
+        seeds = [binascii.unhexlify(test["seed"]) for test in TEST_MAIN]
+
+        for workers in (1, 3):
+            # In order
+            self.assertEqual(seeds, list(Bip39SeedGenerator.GenerateMany(mnemonics, TEST_PASSPHRASE, workers)))
+            self.assertEqual(seeds, list(Bip39SeedGenerator.GenerateMany(iter(mnemonics), [TEST_PASSPHRASE] * len(mnemonics), workers)))
+            # As completed
+            self.assertEqual(seeds, [seed for _, seed in sorted(Bip39SeedGenerator.GenerateMany(mnemonics, TEST_PASSPHRASE, workers, False))])
+
+        # Closing the generator before the end
+        seeds_gen = Bip39SeedGenerator.GenerateMany(mnemonics, TEST_PASSPHRASE, 2)
+        self.assertEqual(seeds[0], next(seeds_gen))
+        seeds_gen.close()
+
+        self.assertEqual([], list(Bip39SeedGenerator.GenerateMany([], TEST_PASSPHRASE, 2)))
+        self.assertRaises(ValueError, Bip39SeedGenerator.GenerateMany, mnemonics, TEST_PASSPHRASE, 0)
+        # Invalid mnemonic
+        self.assertRaises(ValueError, list, Bip39SeedGenerator.GenerateMany(mnemonics + [TEST_MNEMONIC_INVALID[0]["mnemonic"]], TEST_PASSPHRASE, 2))
+        # Different number of passphrases
+        self.assertRaises(ValueError, list, Bip39SeedGenerator.GenerateMany(mnemonics, [TEST_PASSPHRASE] * (len(mnemonics) - 1), 2))
+        self.assertRaises(ValueError, list, Bip39SeedGenerator.GenerateMany(mnemonics, [TEST_PASSPHRASE] * (len(mnemonics) + 1), 2, False))
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_MNEMONIC_INVALID:
             self.assertFalse(Bip39MnemonicValidator(test["mnemonic"]).Validate())
             self.assertRaises(test["exception"], Bip39MnemonicValidator(test["mnemonic"]).GetEntropy)
             self.assertRaises(ValueError, Bip39SeedGenerator, test["mnemonic"])
+            self.assertRaises(test["exception"], Bip39Mnemonic.FromString, test["mnemonic"])
+
+    # Test validated mnemonic object
+    def test_mnemonic_object(self):
+        for test in TEST_MAIN:
+            entropy = binascii.unhexlify(test["entropy"])
+            words = test["mnemonic"].split(" ")
+
+            for mnemonic in (Bip39Mnemonic.FromString(test["mnemonic"]), Bip39Mnemonic.FromString(words), Bip39Mnemonic.FromEntropy(entropy),
+                             Bip39MnemonicGenerator.FromEntropyObj(entropy)):
+                self.assertEqual(test["mnemonic"], mnemonic.ToStr())
+                self.assertEqual(test["mnemonic"], str(mnemonic))
+                self.assertEqual(words, mnemonic.ToList())
+                self.assertEqual([MnemonicFileReader().GetWordIdx(word) for word in words], mnemonic.WordsIdx())
+                self.assertEqual(len(words), mnemonic.WordsCount())
+                self.assertEqual(entropy, mnemonic.Entropy())
+
+                # Validator and seed generator
+                bip39_mnemonic_validator = Bip39MnemonicValidator(mnemonic)
+                self.assertTrue(bip39_mnemonic_validator.Validate())
+                self.assertEqual(entropy, bip39_mnemonic_validator.GetEntropy())
+                self.assertIs(mnemonic, bip39_mnemonic_validator.GetMnemonic())
+                self.assertEqual(test["seed"], binascii.hexlify(Bip39SeedGenerator(mnemonic).Generate(TEST_PASSPHRASE)))
+
+            # The validator parses the mnemonic only once
+            bip39_mnemonic_validator = Bip39MnemonicValidator(test["mnemonic"])
+            self.assertIs(bip39_mnemonic_validator.GetMnemonic(), bip39_mnemonic_validator.GetMnemonic())
+
+        # Generated mnemonic objects
+        for words_num in (12, 15, 18, 21, 24):
+            mnemonics = [Bip39MnemonicGenerator.FromWordsNumberObj(words_num)] + list(Bip39MnemonicGenerator.FromWordsNumberManyObj(words_num, 3))
+            for mnemonic in mnemonics:
+                self.assertIsInstance(mnemonic, Bip39Mnemonic)
+                self.assertEqual(words_num, mnemonic.WordsCount())
+                self.assertEqual(mnemonic.Entropy(), Bip39MnemonicValidator(mnemonic.ToStr()).GetEntropy())
+
+        self.assertRaises(ValueError, Bip39Mnemonic.FromEntropy, b"\x00" * 15)
+        self.assertRaises(ValueError, Bip39MnemonicGenerator.FromWordsNumberObj, 13)
+        self.assertRaises(ValueError, Bip39MnemonicGenerator.FromWordsNumberManyObj, 12, -1)
+
+    # Test words list reader
+    def test_words_list(self):
+        mnemonic_reader = MnemonicFileReader()
+        # The words list shall be read only once
+        self.assertIs(mnemonic_reader.m_words_list, MnemonicFileReader().m_words_list)
+
+        for i in range(2048):
+            self.assertEqual(i, mnemonic_reader.GetWordIdx(mnemonic_reader.GetWordAtIdx(i)))
+        self.assertEqual(0, mnemonic_reader.GetWordIdx("abandon"))
+        self.assertEqual(2047, mnemonic_reader.GetWordIdx("zoo"))
+        self.assertRaises(ValueError, mnemonic_reader.GetWordIdx, "notexistent")
+
+    # Test languages other than English
+    def test_languages(self):
+        for test in TEST_LANG:
+            entropy = binascii.unhexlify(test["entropy"])
+            # Generated mnemonics words are NFKD-normalized, like words lists (the ideographic space is kept)
+            words_sep = "\u3000" if test["lang"] == Bip39Languages.JAPANESE else " "
+            test_mnemonic = words_sep.join([unicodedata.normalize("NFKD", word) for word in test["mnemonic"].split(words_sep)])
+
+            # Mnemonic generator
+            self.assertEqual(test_mnemonic, Bip39MnemonicGenerator.FromEntropy(entropy, test["lang"]))
+            for mnemonic in Bip39MnemonicGenerator.FromWordsNumberMany(12, 10, test["lang"]):
+                self.assertEqual(test["lang"], Bip39Mnemonic.FromString(mnemonic, lang = test["lang"]).Language())
+
+            # Validator, also with language detection and not normalized mnemonic
+            for mnemonic in (test_mnemonic, unicodedata.normalize("NFC", test_mnemonic)):
+                for lang in (test["lang"], None):
+                    bip39_mnemonic_validator = Bip39MnemonicValidator(mnemonic, lang)
+
+                    self.assertTrue(bip39_mnemonic_validator.Validate())
+                    self.assertEqual(entropy, bip39_mnemonic_validator.GetEntropy())
+                    self.assertEqual(test["lang"], bip39_mnemonic_validator.GetMnemonic().Language())
+                    self.assertEqual(test_mnemonic, bip39_mnemonic_validator.GetMnemonic().ToStr())
+
+                    # Seed generator
+                    seed = Bip39SeedGenerator(mnemonic, lang).Generate(test["passphrase"])
+                    self.assertEqual(test["seed"], binascii.hexlify(seed))
+
+            # Words of another language
+            self.assertFalse(Bip39MnemonicValidator(test_mnemonic, Bip39Languages.ENGLISH).Validate())
+
+        # Words lists
+        self.assertEqual((Bip39Languages.ENGLISH, Bip39Languages.FRENCH), MnemonicFileReader.GetWordLanguages("abandon"))
+        self.assertEqual((Bip39Languages.JAPANESE,), MnemonicFileReader.GetWordLanguages("あおぞら"))
+        self.assertEqual((), MnemonicFileReader.GetWordLanguages("notexistent"))
+        self.assertEqual(Bip39Languages.SPANISH, MnemonicFileReader(Bip39Languages.SPANISH).Language())
+        self.assertEqual(0, MnemonicFileReader(Bip39Languages.SPANISH).GetWordIdx(unicodedata.normalize("NFC", "ábaco")))
+        self.assertEqual(0, MnemonicFileReader(Bip39Languages.SPANISH).GetWordIdx(unicodedata.normalize("NFKD", "ábaco")))
+        # Invalid language
+        self.assertRaises(TypeError, MnemonicFileReader, 0)
+        self.assertRaises(TypeError, Bip39MnemonicGenerator.FromWordsNumber, 12, 0)
+        self.assertRaises(TypeError, Bip39MnemonicGenerator.FromWordsNumberMany, 12, 1, 0)
+        self.assertRaises(TypeError, Bip39MnemonicValidator, TEST_MAIN[0]["mnemonic"], 0)
+        self.assertRaises(TypeError, Bip39SeedGenerator, TEST_MAIN[0]["mnemonic"], 0)
+
+    # Test that language detection reads only the needed words lists
+    def test_languages_lazy(self):
+        words_cache = dict(MnemonicFileReader.m_words_cache)
+        try:
+            MnemonicFileReader.m_words_cache.clear()
+
+            # English mnemonic, only the English words list shall be read
+            self.assertTrue(Bip39MnemonicValidator(TEST_MAIN[0]["mnemonic"]).Validate())
+            Bip39SeedGenerator(TEST_MAIN[0]["mnemonic"]).Generate()
+            self.assertEqual([Bip39Languages.ENGLISH], list(MnemonicFileReader.m_words_cache.keys()))
+
+            # Other languages are read only if the mnemonic is not English
+            self.assertEqual(Bip39Languages.JAPANESE, Bip39Mnemonic.FromString(TEST_LANG[0]["mnemonic"]).Language())
+            self.assertTrue(MnemonicFileReader.IsLanguageLoaded(Bip39Languages.JAPANESE))
+        finally:
+            MnemonicFileReader.m_words_cache.clear()
+            MnemonicFileReader.m_words_cache.update(words_cache)
+
+    # Test words prefixes
+    def test_words_prefix(self):
+        mnemonic_reader = MnemonicFileReader()
+
+        # Words are unique by their first four letters
+        for i in range(2048):
+            word = mnemonic_reader.GetWordAtIdx(i)
+            self.assertEqual(i, mnemonic_reader.GetWordIdxFromPrefix(word))
+            self.assertEqual(i, mnemonic_reader.GetWordIdxFromPrefix(word[:4]))
+            self.assertTrue(word in mnemonic_reader.GetWordsFromPrefix(word[:2]))
+
+        # A full word takes precedence over the longer ones starting with it
+        self.assertEqual(["act", "action", "actor", "actress", "actual"], mnemonic_reader.GetWordsFromPrefix("act"))
+        self.assertEqual(mnemonic_reader.GetWordIdx("act"), mnemonic_reader.GetWordIdxFromPrefix("act"))
+        self.assertEqual(mnemonic_reader.GetWordIdx("actress"), mnemonic_reader.GetWordIdxFromPrefix("actr"))
+        # Maximum number of words
+        self.assertEqual(["act", "action"], mnemonic_reader.GetWordsFromPrefix("act", 2))
+        self.assertEqual(["abandon", "ability"], mnemonic_reader.GetWordsFromPrefix("", 2))
+        # Not existent or ambiguous prefixes
+        self.assertEqual([], mnemonic_reader.GetWordsFromPrefix("abx"))
+        self.assertRaises(ValueError, mnemonic_reader.GetWordIdxFromPrefix, "abx")
+        self.assertRaises(ValueError, mnemonic_reader.GetWordIdxFromPrefix, "ab")
+
+        # Abbreviated mnemonic
+        for test in TEST_MAIN:
+            words = test["mnemonic"].split(" ")
+            mnemonic = Bip39Mnemonic.FromString([word[:4] for word in words], expand = True)
+
+            self.assertEqual(test["mnemonic"], mnemonic.ToStr())
+            self.assertEqual(binascii.unhexlify(test["entropy"]), mnemonic.Entropy())
+            if any(len(word) > 4 for word in words):
+                self.assertRaises(ValueError, Bip39Mnemonic.FromString, [word[:4] for word in words])
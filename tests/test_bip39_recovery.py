@@ -0,0 +1,145 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+# Imports
+import unittest
+from bip_utils import (
+    Bip39Recovery, Bip39PassphraseRecovery, Bip39RecoveryTarget, Bip39SeedGenerator, Bip32, Bip44, Bip84, Bip44Changes, Bip44Coins
+)
+
+
+# Tests mnemonic
+TEST_MNEMONIC = "legal winner thank year wave sausage worth useful legal winner thank yellow"
+# Tests passphrase
+TEST_PASSPHRASE = "TREZOR"
+
+
+#
+# Tests
+#
+class Bip39RecoveryTests(unittest.TestCase):
+    # Set up the targets
+    @classmethod
+    def setUpClass(cls):
+        seed_bytes = Bip39SeedGenerator(TEST_MNEMONIC).Generate(TEST_PASSPHRASE)
+        bip_obj_acc = Bip84.FromSeed(seed_bytes, Bip44Coins.BITCOIN).Purpose().Coin().Account(0)
+
+        cls.ex_key = bip_obj_acc.PublicKey().ToExtended()
+        cls.fprint = Bip32.FromSeed(seed_bytes).FingerPrint()
+        cls.address = bip_obj_acc.Change(Bip44Changes.CHAIN_EXT).AddressIndex(2).PublicKey().ToAddress()
+
+    # Test recovery of an unknown word
+    def test_unknown_word(self):
+        words = TEST_MNEMONIC.split(" ")
+        words[11] = "?"
+
+        # Without target, only the checksum is checked
+        recovery = Bip39Recovery(words)
+        mnemonics = list(recovery.Search())
+        self.assertEqual(2048, recovery.Total())
+        self.assertEqual(128, len(mnemonics))
+        self.assertTrue(TEST_MNEMONIC in mnemonics)
+
+        # With target
+        target = Bip39RecoveryTarget.FromAddress(Bip84, Bip44Coins.BITCOIN, self.address, addr_num = 3)
+        self.assertEqual([TEST_MNEMONIC], list(Bip39Recovery(words, target, TEST_PASSPHRASE).Search()))
+        # Wrong passphrase
+        self.assertEqual([], list(Bip39Recovery(words, target).Search()))
+
+    # Test recovery of misspelled words and candidates
+    def test_misspelled_candidates(self):
+        words = TEST_MNEMONIC.split(" ")
+        words[1] = "winnre"
+        words[4] = "wave"
+        candidates = { 4: ["wage", "wave", "wait"], 7: ["useful", "usage", "use"] }
+
+        target = Bip39RecoveryTarget.FromExtendedKey(Bip84, Bip44Coins.BITCOIN, self.ex_key)
+        recovery = Bip39Recovery(" ".join(words), target, TEST_PASSPHRASE, candidates)
+        self.assertEqual([TEST_MNEMONIC], list(recovery.Search()))
+
+        # No candidates within the maximum distance, all words are possible
+        words[1] = "zzzzzz"
+        self.assertEqual(2048, Bip39Recovery(words).Total())
+
+    # Test search by chunks and resume from checkpoint
+    def test_resume(self):
+        words = TEST_MNEMONIC.split(" ")
+        words[3] = "?"
+        words[11] = "?"
+        candidates = { 3: ["year", "abandon", "zoo", "legal"] }
+
+        recovery = Bip39Recovery(words, candidates = candidates)
+        mnemonics = list(recovery.Search())
+        self.assertEqual(4 * 2048, recovery.Total())
+        self.assertTrue(TEST_MNEMONIC in mnemonics)
+
+        # Worker processes give the same result
+        self.assertEqual(mnemonics, list(recovery.Search(workers = 2, chunk_len = 1000)))
+
+        # Stop after the first chunk and resume from checkpoint
+        checkpoints = []
+        search = recovery.Search(chunk_len = 3000, progress = lambda checked, total: checkpoints.append((checked, total)))
+        first_mnemonics = []
+        for mnemonic in search:
+            # Mnemonics yielded after the checkpoint are found again when resuming
+            if len(checkpoints) > 0:
+                break
+            first_mnemonics.append(mnemonic)
+        search.close()
+
+        self.assertEqual([(3000, recovery.Total())], checkpoints)
+        self.assertEqual(mnemonics, first_mnemonics + list(recovery.Search(start = checkpoints[0][0])))
+
+    # Test passphrase recovery
+    def test_passphrase(self):
+        passphrases = ["pass_%d" % i for i in range(20)] + [TEST_PASSPHRASE] + ["pass_%d" % i for i in range(20, 40)]
+
+        for target in (Bip39RecoveryTarget.FromFingerPrint(self.fprint),
+                       Bip39RecoveryTarget.FromAddress(Bip84, Bip44Coins.BITCOIN, self.address, addr_num = 3)):
+            recovery = Bip39PassphraseRecovery(TEST_MNEMONIC, target)
+
+            # Passphrases are consumed lazily and the search stops at the first match
+            passphrases_it = iter(passphrases)
+            self.assertEqual(TEST_PASSPHRASE, recovery.Search(passphrases_it))
+            self.assertEqual("pass_20", next(passphrases_it))
+
+            self.assertEqual(TEST_PASSPHRASE, recovery.Search(iter(passphrases), workers = 2, batch_len = 4))
+            self.assertIsNone(recovery.Search(passphrases[:20]))
+            self.assertIsNone(recovery.Search(passphrases[:20], workers = 2, batch_len = 4))
+
+        self.assertRaises(ValueError, Bip39PassphraseRecovery, TEST_MNEMONIC.replace("legal", "abandon", 1), target)
+        self.assertRaises(ValueError, recovery.Search, passphrases, 0)
+        self.assertRaises(ValueError, recovery.Search, passphrases, 1, 0)
+
+    # Test invalid parameters
+    def test_invalid(self):
+        words = TEST_MNEMONIC.split(" ")
+
+        self.assertRaises(ValueError, Bip39Recovery, words[:-1])
+        self.assertRaises(ValueError, Bip39Recovery, words, candidates = { 12: ["zoo"] })
+        self.assertRaises(ValueError, Bip39Recovery, words, candidates = { 0: ["notexistent"] })
+        self.assertRaises(ValueError, Bip39Recovery, words, candidates = { 0: [] })
+        self.assertRaises(ValueError, Bip39Recovery(words).Search, 0)
+        self.assertRaises(ValueError, Bip39Recovery(words).Search, 1, 2)
+        self.assertRaises(ValueError, Bip39Recovery(words).Search, 1, 0, 0)
+        self.assertRaises(ValueError, Bip39RecoveryTarget.FromAddress, Bip44, Bip44Coins.BITCOIN, self.address, 0)
+        self.assertRaises(ValueError, Bip39RecoveryTarget.FromFingerPrint, self.fprint[:-1])
@@ -400,3 +400,19 @@ class Bip44Tests(unittest.TestCase):
     # Test invalid path derivations
     def test_invalid_derivations(self):
         Bip44BaseTestHelper.test_invalid_derivations(self, Bip44, TEST_SEED)
+
+    # Test address range
+    def test_address_range(self):
+        Bip44BaseTestHelper.test_address_range(self, Bip44, TEST_MAIN)
+
+    # Test pickling
+    def test_pickle(self):
+        Bip44BaseTestHelper.test_pickle(self, Bip44, TEST_MAIN)
+
+    # Test addresses scanning
+    def test_scan_addresses(self):
+        Bip44BaseTestHelper.test_scan_addresses(self, Bip44, TEST_MAIN)
+
+    # Test accounts discovery
+    def test_discover_accounts(self):
+        Bip44BaseTestHelper.test_discover_accounts(self, Bip44, TEST_MAIN)
@@ -21,8 +21,9 @@
 
 # Imports
 import binascii
+import pickle
 from bip_utils import (
-     Bip44Coins, Bip44Changes, Bip44Levels,
+     Bip44BaseConst, Bip44Coins, Bip44Changes, Bip44Levels,
      Bip44DepthError, Bip44CoinNotAllowedError,
      Bip32KeyError,
      LitecoinConf
@@ -239,3 +240,129 @@ class Bip44BaseTestHelper:
         ut_class.assertRaises(Bip44DepthError, bip_obj_addr.Account     , 0)
         ut_class.assertRaises(Bip44DepthError, bip_obj_addr.Change      , Bip44Changes.CHAIN_EXT)
         ut_class.assertRaises(Bip44DepthError, bip_obj_addr.AddressIndex, 0)
+
+    # Test address range, computed in the current process and by worker processes
+    def test_address_range(ut_class, bip_class, test_vector):
+        for test in test_vector:
+            addr_num = len(test["addresses"])
+
+            # Create from private and public change keys
+            for ex_key in (test["chain_ext"]["ex_priv"], test["chain_ext"]["ex_pub"]):
+                bip_obj_ctx = bip_class.FromExtendedKey(ex_key, test["coin"])
+                ut_class.assertEqual(test["addresses"], bip_obj_ctx.AddressRange(0, addr_num))
+                ut_class.assertEqual(test["addresses"][1:3], bip_obj_ctx.AddressRange(1, 3))
+                ut_class.assertEqual([], bip_obj_ctx.AddressRange(3, 3))
+
+        # Use worker processes also for small ranges
+        shard_len = Bip44BaseConst.ADDR_RANGE_MIN_SHARD_LEN
+        Bip44BaseConst.ADDR_RANGE_MIN_SHARD_LEN = 2
+        try:
+            test = test_vector[0]
+            bip_obj_ctx = bip_class.FromExtendedKey(test["chain_ext"]["ex_priv"], test["coin"])
+            addresses = bip_obj_ctx.AddressRange(0, 11)
+
+            ut_class.assertEqual(addresses, bip_obj_ctx.AddressRange(0, 11, workers = 3))
+            ut_class.assertEqual(test["addresses"], addresses[:len(test["addresses"])])
+        finally:
+            Bip44BaseConst.ADDR_RANGE_MIN_SHARD_LEN = shard_len
+
+        # Invalid ranges
+        ut_class.assertRaises(ValueError, bip_obj_ctx.AddressRange, -1, 3)
+        ut_class.assertRaises(ValueError, bip_obj_ctx.AddressRange, 3, 2)
+        # Invalid number of workers
+        ut_class.assertRaises(ValueError, bip_obj_ctx.AddressRange, 0, 3, 0)
+        ut_class.assertRaises(ValueError, bip_obj_ctx.AddressRange, 0, 3, -1)
+        # Invalid depth
+        bip_obj_ctx = bip_class.FromExtendedKey(test["account"]["ex_priv"], test["coin"])
+        ut_class.assertRaises(Bip44DepthError, bip_obj_ctx.AddressRange, 0, 3)
+
+    # Test pickling
+    def test_pickle(ut_class, bip_class, test_vector):
+        for test in test_vector:
+            bip_obj_acc = bip_class.FromSeed(binascii.unhexlify(test["seed"]), test["coin"]).Purpose().Coin().Account(0)
+            bip_obj_change = bip_obj_acc.Change(Bip44Changes.CHAIN_EXT)
+            bip_obj_ctx = bip_obj_change.AddressIndex(0)
+
+            # Account and change levels
+            for bip_obj_lvl in (bip_obj_acc, bip_obj_change):
+                pickled = pickle.dumps(bip_obj_lvl)
+                ut_class.assertLess(len(pickled), 200)
+                ut_class.assertEqual(bip_obj_lvl.PublicKey().ToExtended(), pickle.loads(pickled).PublicKey().ToExtended())
+
+            # Address index level
+            pickled = pickle.dumps(bip_obj_ctx)
+            ut_class.assertLess(len(pickled), 200)
+
+            bip_obj = pickle.loads(pickled)
+            ut_class.assertIs(bip_obj_ctx.CoinClass(), bip_obj.CoinClass())
+            ut_class.assertEqual(test["addresses"][0], bip_obj.PublicKey().ToAddress())
+            ut_class.assertEqual(bip_obj_ctx.PrivateKey().ToExtended(), bip_obj.PrivateKey().ToExtended())
+            ut_class.assertEqual(bip_obj_ctx.PrivateKey().ToWif(), bip_obj.PrivateKey().ToWif())
+
+            # Public change level
+            bip_obj_ctx = bip_class.FromExtendedKey(test["chain_ext"]["ex_pub"], test["coin"])
+            bip_obj = pickle.loads(pickle.dumps(bip_obj_ctx))
+            ut_class.assertTrue(bip_obj.IsPublicOnly())
+            ut_class.assertEqual(test["addresses"], bip_obj.AddressRange(0, len(test["addresses"])))
+
+    # Test addresses scanning
+    def test_scan_addresses(ut_class, bip_class, test_vector):
+        for test in test_vector:
+            bip_obj_ctx = bip_class.FromExtendedKey(test["account"]["ex_pub"], test["coin"])
+            int_addrs = bip_obj_ctx.Change(Bip44Changes.CHAIN_INT).AddressRange(0, 10)
+
+            # Used addresses with gaps shorter than the gap limit, with batches shorter than the gap
+            used_addrs = {test["addresses"][0]: 0, test["addresses"][3]: 3, int_addrs[2]: 2, int_addrs[7]: 7}
+            checked_addrs = []
+            def is_used(addr):
+                checked_addrs.append(addr)
+                return addr in used_addrs
+
+            res = bip_obj_ctx.ScanAddresses(is_used, gap_limit = 4, batch_len = 3)
+            ut_class.assertEqual([(0, test["addresses"][0]), (3, test["addresses"][3])], res[Bip44Changes.CHAIN_EXT])
+            ut_class.assertEqual([(2, int_addrs[2])], res[Bip44Changes.CHAIN_INT])
+            # Addresses shall be checked in order, stopping at the gap limit
+            ut_class.assertEqual(test["addresses"][:5], checked_addrs[:5])
+            ut_class.assertEqual(8 + 7, len(checked_addrs))
+
+            # Gap limit longer than batches
+            res = bip_obj_ctx.ScanAddresses(lambda addr: addr in used_addrs, gap_limit = 5, batch_len = 2)
+            ut_class.assertEqual([(2, int_addrs[2]), (7, int_addrs[7])], res[Bip44Changes.CHAIN_INT])
+
+        # Invalid parameters
+        ut_class.assertRaises(ValueError, bip_obj_ctx.ScanAddresses, is_used, gap_limit = 0)
+        ut_class.assertRaises(ValueError, bip_obj_ctx.ScanAddresses, is_used, batch_len = 0)
+        # Invalid depth
+        bip_obj_ctx = bip_obj_ctx.Change(Bip44Changes.CHAIN_EXT)
+        ut_class.assertRaises(Bip44DepthError, bip_obj_ctx.ScanAddresses, is_used)
+
+    # Test accounts discovery
+    def test_discover_accounts(ut_class, bip_class, test_vector):
+        test = test_vector[0]
+        bip_obj_ctx = bip_class.FromSeed(binascii.unhexlify(test["seed"]), test["coin"]).Purpose().Coin()
+        acc_addrs = [bip_obj_ctx.Account(i).Change(Bip44Changes.CHAIN_EXT).AddressRange(0, 3) for i in range(4)]
+
+        # Account 2 is empty, so account 3 shall not be discovered
+        used_addrs = {acc_addrs[0][1], acc_addrs[1][0], acc_addrs[3][0]}
+        is_used = lambda addr: addr in used_addrs
+
+        for workers in (1, 3):
+            accounts = bip_obj_ctx.DiscoverAccounts(is_used, gap_limit = 3, workers = workers)
+            ut_class.assertEqual([0, 1], [acc_idx for acc_idx, _ in accounts])
+            ut_class.assertEqual([(1, acc_addrs[0][1])], accounts[0][1][Bip44Changes.CHAIN_EXT])
+            ut_class.assertEqual([(0, acc_addrs[1][0])], accounts[1][1][Bip44Changes.CHAIN_EXT])
+
+        # Discover more coins
+        coin_idxs = [t["coin"] for t in test_vector if t["seed"] == test["seed"]]
+        coins = bip_class.DiscoverCoins(binascii.unhexlify(test["seed"]), coin_idxs, is_used, gap_limit = 3, workers = 2)
+        ut_class.assertEqual(set(coin_idxs), set(coins.keys()))
+        ut_class.assertEqual(accounts, coins[test["coin"]])
+        for coin_idx in coin_idxs:
+            bip_obj_coin = bip_class.FromSeed(binascii.unhexlify(test["seed"]), coin_idx).Purpose().Coin()
+            ut_class.assertEqual(bip_obj_coin.DiscoverAccounts(is_used, gap_limit = 3), coins[coin_idx])
+        ut_class.assertEqual({}, bip_class.DiscoverCoins(binascii.unhexlify(test["seed"]), [], is_used))
+
+        # Invalid parameters
+        ut_class.assertRaises(ValueError, bip_obj_ctx.DiscoverAccounts, is_used, workers = 0)
+        # Invalid depth
+        ut_class.assertRaises(Bip44DepthError, bip_obj_ctx.Account(0).DiscoverAccounts, is_used)
@@ -73,8 +73,11 @@ class EthAddrTests(unittest.TestCase):
             # Decompress key
             ver_key = ecdsa.VerifyingKey.from_string(binascii.unhexlify(test["pub_key"]), curve = SECP256k1)
             self.assertEqual(test["address"], EthAddr.ToAddress(ver_key.to_string("uncompressed")[1:]))
+            # The payload is the address without prefix
+            self.assertEqual(test["address"][2:].lower(), binascii.hexlify(EthAddr.ToPayload(ver_key.to_string("uncompressed")[1:])).decode())
 
     # Test invalid keys
     def test_invalid_keys(self):
         for test in TEST_KEY_INVALID:
             self.assertRaises(ValueError, EthAddr.ToAddress, binascii.unhexlify(test))
+            self.assertRaises(ValueError, EthAddr.ToPayload, binascii.unhexlify(test))
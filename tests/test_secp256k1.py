@@ -0,0 +1,135 @@
+# Copyright (c) 2020 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import os
+import tempfile
+import unittest
+from ecdsa.ecdsa          import generator_secp256k1
+from bip_utils.secp256k1  import Secp256k1, Secp256k1Const, Secp256k1FixedBase
+from bip_utils.utils      import Sha256
+
+
+# Some tests scalars
+TEST_SCALARS = \
+    [
+        1,
+        2,
+        255,
+        256,
+        0x1837c1be8e2995ec11cda2b066151be2cfb48adf9e47b151d46adab3a21cdf67,
+        0xe8f32e723decf4051aefac8e2c93c9c5b214313817cdb01a1494b917c8436b35,
+        Secp256k1Const.N - 1,
+        (1 << 256) - 1,
+    ]
+
+
+#
+# Tests
+#
+class Secp256k1Tests(unittest.TestCase):
+    # Test generator multiplication against the ecdsa library
+    def test_generator_mul(self):
+        for scalar in TEST_SCALARS:
+            point = generator_secp256k1 * scalar
+            self.assertEqual((point.x(), point.y()), Secp256k1.JacobianToAffine(Secp256k1FixedBase.Multiply(scalar)))
+
+        # Multiples of the order result in the point at infinity
+        self.assertIsNone(Secp256k1.JacobianToAffine(Secp256k1FixedBase.Multiply(0)))
+        self.assertIsNone(Secp256k1.JacobianToAffine(Secp256k1FixedBase.Multiply(Secp256k1Const.N)))
+
+    # Test generator multiplication with fixed-base table disabled
+    def test_generator_mul_disabled(self):
+        Secp256k1FixedBase.Enable(False)
+        try:
+            for scalar in TEST_SCALARS:
+                self.assertEqual(Secp256k1.JacobianToAffine(Secp256k1FixedBase.Multiply(scalar)),
+                                 Secp256k1.JacobianToAffine(Secp256k1.GeneratorMultiply(scalar)))
+        finally:
+            Secp256k1FixedBase.Enable(True)
+
+    # Test points addition and doubling
+    def test_add_double(self):
+        g = (Secp256k1Const.GX, Secp256k1Const.GY)
+        g_2 = Secp256k1.JacobianToAffine(Secp256k1.JacobianDouble(Secp256k1.JacobianFromAffine(g)))
+        self.assertTrue(Secp256k1.IsOnCurve(g_2))
+
+        # G + G = 2G
+        self.assertEqual(g_2, Secp256k1.JacobianToAffine(Secp256k1.JacobianAddAffine(Secp256k1.JacobianFromAffine(g), g)))
+        # G + (-G) = infinity
+        self.assertIsNone(Secp256k1.JacobianToAffine(Secp256k1.JacobianAddAffine(Secp256k1.JacobianFromAffine(g),
+                                                                               (g[0], Secp256k1Const.P - g[1]))))
+        # 2G + G = 3G
+        point = generator_secp256k1 * 3
+        self.assertEqual((point.x(), point.y()),
+                         Secp256k1.JacobianToAffine(Secp256k1.JacobianAddAffine(Secp256k1.JacobianFromAffine(g_2), g)))
+
+    # Test batch conversion to affine coordinates
+    def test_to_affine_batch(self):
+        points = [Secp256k1FixedBase.Multiply(scalar) for scalar in TEST_SCALARS]
+        # Add some points at infinity, also at the beginning and at the end
+        points = [(0, 1, 0)] + points[:3] + [(0, 1, 0)] + points[3:] + [(0, 1, 0)]
+
+        self.assertEqual([Secp256k1.JacobianToAffine(point) for point in points], Secp256k1.JacobianToAffineBatch(points))
+        self.assertEqual([], Secp256k1.JacobianToAffineBatch([]))
+
+    # Test table save and load
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "table.bin")
+
+            Secp256k1FixedBase.Save(file_path)
+            Secp256k1FixedBase.Load(file_path)
+            for scalar in TEST_SCALARS:
+                point = generator_secp256k1 * scalar
+                self.assertEqual((point.x(), point.y()), Secp256k1.JacobianToAffine(Secp256k1FixedBase.Multiply(scalar)))
+
+            # Tampered point with valid checksum (the point is on the curve, but it's not the correct multiple)
+            with open(file_path, "rb") as fin:
+                table_bytes = fin.read()[:-32]
+            point = generator_secp256k1 * 3
+            point_bytes = point.x().to_bytes(32, "big") + point.y().to_bytes(32, "big")
+            table_bytes = table_bytes[:64 * 300] + point_bytes + table_bytes[64 * 301:]
+            with open(file_path, "wb") as fout:
+                fout.write(table_bytes + Sha256(table_bytes))
+            self.assertRaises(ValueError, Secp256k1FixedBase.Load, file_path)
+
+            # Corrupted file
+            with open(file_path, "r+b") as fout:
+                fout.write(b"\x00")
+            self.assertRaises(ValueError, Secp256k1FixedBase.Load, file_path)
+
+    # Test points encoding and decoding
+    def test_encoding(self):
+        for scalar in TEST_SCALARS[:-2]:
+            point = generator_secp256k1 * scalar
+            point = (point.x(), point.y())
+
+            point_bytes = Secp256k1.PointToCompressed(point)
+            self.assertEqual(2 + (point[1] & 1), point_bytes[0])
+            self.assertEqual(point, Secp256k1.PointFromCompressed(point_bytes))
+            self.assertEqual(point[0].to_bytes(32, "big") + point[1].to_bytes(32, "big"), Secp256k1.PointToUncompressed(point))
+
+        # Invalid points
+        self.assertRaises(ValueError, Secp256k1.PointFromCompressed, b"\x02" * 32)
+        self.assertRaises(ValueError, Secp256k1.PointFromCompressed, b"\x04" + b"\x00" * 32)
+        self.assertRaises(ValueError, Secp256k1.PointFromCompressed, b"\x02" + Secp256k1Const.P.to_bytes(32, "big"))
+        self.assertRaises(ValueError, Secp256k1.PointFromCompressed, b"\x02" + b"\x00" * 31 + b"\x05")